@@ -0,0 +1,67 @@
+import time
+from typing import Optional
+
+from django.db import transaction
+from django.db.models import F
+
+from ads.images import VARIANTS, FORMATS, variant_name
+from ads.models import ImageBlob
+from ads.storage import image_storage, is_content_name
+
+
+def add_reference(name: str) -> None:
+    """
+    The add_reference function takes as an argument the name of an image in the storage of the ad images.
+    Increments the number of the ads referencing the image, registering the image on the first reference.
+    The images stored outside of the content-addressed layout are not counted. Returns None.
+    """
+    if not is_content_name(name):
+        return
+
+    try:
+        size: int = image_storage.size(name)
+    except OSError:
+        size = 0
+
+    blob, created = ImageBlob.objects.get_or_create(name=name, defaults={"size": size, "refcount": 1})
+    if not created:
+        ImageBlob.objects.filter(pk=blob.pk).update(refcount=F("refcount") + 1)
+
+
+def release_reference(name: str) -> None:
+    """
+    The release_reference function takes as an argument the name of an image in the storage of the ad images.
+    Decrements the number of the ads referencing the image. When no ad references it anymore, deletes the image
+    and its variants after the transaction is committed, unless the image is uploaded again after its release.
+    The images that were never registered are kept. Returns None.
+    """
+    if not is_content_name(name):
+        return
+
+    with transaction.atomic():
+        blob: Optional[ImageBlob] = ImageBlob.objects.select_for_update().filter(name=name).first()
+        if blob is None:
+            return
+        if blob.refcount > 1:
+            ImageBlob.objects.filter(pk=blob.pk).update(refcount=F("refcount") - 1)
+            return
+        blob.delete()
+    released_at: int = time.time_ns()
+    transaction.on_commit(lambda: delete_unreferenced(name, released_at))
+
+
+def delete_unreferenced(name: str, released_at: int) -> None:
+    """
+    The delete_unreferenced function takes as arguments the name of an image in the storage of the ad images
+    and the time of the release of its last reference in nanoseconds. Deletes the image and its variants unless
+    the image has been referenced again or uploaded again after its release, the upload refreshing
+    the modification time of the stored file. Returns None.
+    """
+    if ImageBlob.objects.filter(name=name).exists():
+        return
+
+    if not image_storage.delete_unless_modified(name, released_at):
+        return
+    for variant in VARIANTS:
+        for image_format in FORMATS:
+            image_storage.delete(variant_name(name, variant, image_format))
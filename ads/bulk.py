@@ -0,0 +1,129 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.serializers import ModelSerializer
+
+from ads.cache import invalidate_categories
+from ads.models import Ad
+from ads.permissions import AdEditPermission
+from ads.serializers import AdCreateSerializer, AdUpdateSerializer
+from author.models import User
+
+
+def prefetch_related_objects(items: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    The prefetch_related_objects function takes as an argument the list of the items of a bulk request.
+    Loads all the referenced authors by username with one query. The categories are resolved
+    by the cache of the categories. Returns a dictionary of the loaded objects by slug for the author field.
+    """
+    usernames: Set[str] = {item["author"] for item in items if isinstance(item.get("author"), str)}
+
+    return {
+        "author": User.objects.in_bulk(usernames, field_name="username") if usernames else {},
+    }
+
+
+def attach_authors(request, ads: List[Ad]) -> None:
+    """
+    The attach_authors function takes as arguments the request object and the list of the updated ads.
+    Sets the authors displayed by the representations of the ads, taking the user of the request for the own ads
+    and loading the other authors with one query only if there are any. Returns None.
+    """
+    authors: Dict[int, User] = {request.user.pk: request.user} if request.user.pk is not None else {}
+    missing: Set[int] = {ad.author_id for ad in ads if ad.author_id is not None} - authors.keys()
+    if missing:
+        authors.update(User.objects.in_bulk(missing))
+    for ad in ads:
+        if ad.author_id in authors:
+            ad.author = authors[ad.author_id]
+
+
+def validate_items(request, view: Any, items: Any) -> Tuple[List[ModelSerializer], List[Dict[str, Any]]]:
+    """
+    The validate_items function takes as arguments the request object, the view object and the body
+    of a bulk request. Validates every item with the serializer of the ad creation, or of the ad update
+    if the item contains an id, and checks the right to edit the updated ads. The images are not changed
+    in bulk, since the bulk update bypasses the signals counting the references to them and generating
+    their variants. Returns a tuple of the list of serializers and the list of errors by items, empty
+    for the valid ones.
+    """
+    if not isinstance(items, list) or not items:
+        raise ValidationError({"non_field_errors": ["Expected a non-empty list of ads."]})
+    if len(items) > settings.ADS_BULK_MAX_ITEMS:
+        raise ValidationError({"non_field_errors": [f"At most {settings.ADS_BULK_MAX_ITEMS} ads per request."]})
+    if not all(isinstance(item, dict) for item in items):
+        raise ValidationError({"non_field_errors": ["Every ad must be an object."]})
+
+    context: Dict[str, Any] = {"request": request, "prefetched": prefetch_related_objects(items)}
+    update_ids: List[Any] = [item["id"] for item in items if "id" in item]
+    existing: Dict[int, Ad] = Ad.objects.in_bulk(
+        [ad_id for ad_id in update_ids if isinstance(ad_id, int)]
+    ) if update_ids else {}
+    attach_authors(request, list(existing.values()))
+    permission: AdEditPermission = AdEditPermission()
+
+    serializers: List[ModelSerializer] = []
+    errors: List[Dict[str, Any]] = []
+    for item in items:
+        serializer: ModelSerializer
+        if "id" in item:
+            instance: Optional[Ad] = existing.get(item["id"])
+            if instance is None:
+                serializers.append(None)
+                errors.append({"id": [f"Ad {item['id']} does not exist."]})
+                continue
+            if not permission.has_object_permission(request, view, instance):
+                serializers.append(None)
+                errors.append({"detail": permission.message})
+                continue
+            if "image" in item:
+                serializers.append(None)
+                errors.append({"image": [f"The image is changed at the address '/ad/{instance.pk}/update/'."]})
+                continue
+            serializer = AdUpdateSerializer(instance, data=item, partial=True, context=context)
+        else:
+            serializer = AdCreateSerializer(data=item, context=context)
+
+        serializers.append(serializer)
+        errors.append({} if serializer.is_valid() else serializer.errors)
+
+    return serializers, errors
+
+
+def save_items(serializers: List[ModelSerializer]) -> List[Dict[str, Any]]:
+    """
+    The save_items function takes as an argument the list of the validated serializers of a bulk request.
+    Inserts the new ads with one bulk_create and writes the changed ones with one bulk_update in a single
+    transaction. Returns the list of the representations of the saved ads in the order of the items.
+    """
+    created: List[Ad] = []
+    updated: List[Ad] = []
+    updated_fields: Set[str] = set()
+    category_ids: Set[int] = set()
+    now: datetime = timezone.now()
+
+    for serializer in serializers:
+        if serializer.instance is None:
+            serializer.instance = Ad(**serializer.validated_data)
+            created.append(serializer.instance)
+        else:
+            category_ids.add(serializer.instance.category_id)
+            for field, value in serializer.validated_data.items():
+                setattr(serializer.instance, field, value)
+            serializer.instance.updated_at = now
+            updated_fields.update(serializer.validated_data, ["updated_at"])
+            updated.append(serializer.instance)
+
+    with transaction.atomic():
+        Ad.objects.bulk_create(created)
+        if updated:
+            Ad.objects.bulk_update(updated, list(updated_fields))
+
+    category_ids.update(ad.category_id for ad in created + updated)
+    invalidate_categories(category_ids)
+
+    return [serializer.data for serializer in serializers]
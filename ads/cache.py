@@ -0,0 +1,168 @@
+import hashlib
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+
+from django.conf import settings
+from django.core.cache import caches, BaseCache
+from django.http import HttpRequest, QueryDict
+from django.utils.http import urlencode
+from rest_framework.response import Response
+
+ALL_CATEGORIES: str = "all"
+VERSION_KEY: str = "ads:list:version:{category}"
+ENTRY_KEY: str = "ads:list:{category}:{version}:{digest}"
+HITS_KEY: str = "ads:list:stats:hits"
+MISSES_KEY: str = "ads:list:stats:misses"
+
+
+def get_cache() -> BaseCache:
+    """
+    The get_cache function returns the cache backend configured for the ad list responses
+    by the ADS_LIST_CACHE_ALIAS setting.
+    """
+    return caches[settings.ADS_LIST_CACHE_ALIAS]
+
+
+def get_version_cache() -> BaseCache:
+    """
+    The get_version_cache function returns the cache backend storing the versions of the cached ad list responses,
+    configured by the ADS_LIST_VERSION_CACHE_ALIAS setting. The backend must be shared by all the processes
+    serving the application, otherwise the responses cached by the other processes stay stale after a change
+    until they expire.
+    """
+    return caches[settings.ADS_LIST_VERSION_CACHE_ALIAS]
+
+
+def get_version(category: str) -> int:
+    """
+    The get_version function takes as an argument the category identifier as a string or 'all'
+    for the responses that are not filtered by category. Returns the current version of the cached responses.
+    A missing version is started from the current time, so the entries written before an eviction
+    of the version are never read again.
+    """
+    cache: BaseCache = get_version_cache()
+    key: str = VERSION_KEY.format(category=category)
+    version: Optional[int] = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def invalidate_categories(category_ids: Iterable[Any]) -> None:
+    """
+    The invalidate_categories function takes as an argument the identifiers of the categories of the changed ads.
+    Replaces the versions of the cached responses filtered by these categories and of the responses
+    that are not filtered by category with new ones. The versions are set rather than incremented,
+    as the increments of the file and database backends are not atomic. Returns None.
+    """
+    version: int = time.time_ns()
+    get_version_cache().set_many({
+        VERSION_KEY.format(category=category): version
+        for category in {str(category_id) for category_id in category_ids if category_id is not None} | {ALL_CATEGORIES}
+    }, timeout=None)
+
+
+def get_category(query_params: QueryDict) -> str:
+    """
+    The get_category function takes as an argument the query parameters of the request. Returns the identifier
+    of the requested category normalized as an integer, so that '07' and '7' share the version bumped
+    by the invalidation, or 'all' if the responses are not filtered by a valid category.
+    """
+    try:
+        return str(int(query_params.get("cat", "")))
+    except ValueError:
+        return ALL_CATEGORIES
+
+
+def make_key(request: HttpRequest) -> str:
+    """
+    The make_key function takes as an argument the request. Canonicalizes its query parameters by dropping
+    the empty values and sorting the names and values, so that equivalent requests share an entry, and adds
+    the scheme, the host and the path, which the absolute links of the pages are built from, so the endpoints
+    serving the same pages do not read each other's entries. Returns the cache key of the response, which includes
+    the version of the requested category.
+    """
+    query_params: QueryDict = request.GET
+    canonical: str = urlencode(sorted(
+        (name, sorted(value for value in values if value))
+        for name, values in query_params.lists()
+        if any(values)
+    ), doseq=True)
+    category: str = get_category(query_params)
+    origin: str = f"{request.scheme}://{request.get_host()}{request.path}"
+
+    return ENTRY_KEY.format(
+        category=category,
+        version=get_version(category),
+        digest=hashlib.md5(f"{origin}?{canonical}".encode()).hexdigest()
+    )
+
+
+def record(hit: bool) -> None:
+    """
+    The record function takes as an argument the result of a cache lookup and increments the counter
+    of hits or misses. Returns None.
+    """
+    cache: BaseCache = get_cache()
+    key: str = HITS_KEY if hit else MISSES_KEY
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+
+
+def lookup(request: HttpRequest) -> Tuple[str, Any]:
+    """
+    The lookup function takes as an argument the request. Reads the cached data of its response and counts
+    the hit or the miss. Returns a tuple of the cache key and the data, None if the response is not cached.
+    """
+    key: str = make_key(request)
+    data: Any = get_cache().get(key)
+    record(hit=data is not None)
+    return key, data
+
+
+def store(key: str, data: Any) -> None:
+    """
+    The store function takes as arguments the cache key of a response and its data and caches the data.
+    Returns None.
+    """
+    get_cache().set(key, data)
+
+
+alookup = sync_to_async(lookup)
+astore = sync_to_async(store)
+
+
+def get_stats() -> Dict[str, int]:
+    """
+    The get_stats function returns a dictionary with the numbers of hits and misses of the ad list cache.
+    """
+    counters: Dict[str, int] = get_cache().get_many([HITS_KEY, MISSES_KEY])
+    return {"hits": counters.get(HITS_KEY, 0), "misses": counters.get(MISSES_KEY, 0)}
+
+
+class ResponseCacheMixin:
+    """
+    The ResponseCacheMixin class is a mixin for the list views of the rest_framework library.
+    Serves the repeated requests to the same address with the same canonical query parameters from the cache
+    and marks the responses with the X-Cache header.
+    """
+    def get(self, request, *args: Any, **kwargs: Any) -> Response:
+        """
+        The get function overrides the method of the parent class. Returns the cached data of the response
+        if present, otherwise calls the method of the parent class and caches its successful response.
+        """
+        key, data = lookup(request)
+        if data is not None:
+            return Response(data, headers={"X-Cache": "HIT"})
+
+        response: Response = super().get(request, *args, **kwargs)
+        if response.status_code == 200:
+            store(key, response.data)
+        response["X-Cache"] = "MISS"
+        return response
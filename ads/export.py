@@ -0,0 +1,74 @@
+import csv
+import json
+from typing import Any, Dict, Iterator, List, Tuple
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+
+from ads.models import Ad
+
+EXPORT_FIELDS: Dict[str, str] = {
+    "id": "id",
+    "name": "name",
+    "author": "author__username",
+    "price": "price",
+    "description": "description",
+    "is_published": "is_published",
+    "image": "image",
+    "category": "category__name",
+}
+CONTENT_TYPES: Dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+class Echo:
+    """
+    The Echo class is a pseudo-buffer for the csv module, whose write method returns the written line
+    instead of storing it.
+    """
+    def write(self, value: str) -> str:
+        """
+        The write function takes as an argument a line formed by the csv module and returns it.
+        """
+        return value
+
+
+def iter_rows(queryset: QuerySet[Ad]) -> Iterator[Tuple[Any, ...]]:
+    """
+    The iter_rows function takes as an argument a queryset of ads. Reads the exported columns in chunks
+    of the ADS_EXPORT_CHUNK_SIZE setting through a server-side cursor, so the memory used does not depend
+    on the number of ads. Returns an iterator of tuples of the values.
+    """
+    if not queryset.query.order_by:
+        queryset = queryset.order_by("id")
+    return queryset.values_list(*EXPORT_FIELDS.values()).iterator(chunk_size=settings.ADS_EXPORT_CHUNK_SIZE)
+
+
+def ndjson_lines(queryset: QuerySet[Ad]) -> Iterator[str]:
+    """
+    The ndjson_lines function takes as an argument a queryset of ads. Returns an iterator of the lines
+    of the NDJSON document, one JSON object per ad.
+    """
+    names: List[str] = list(EXPORT_FIELDS)
+    for row in iter_rows(queryset):
+        yield json.dumps(dict(zip(names, row)), ensure_ascii=False, cls=DjangoJSONEncoder) + "\n"
+
+
+def csv_lines(queryset: QuerySet[Ad]) -> Iterator[str]:
+    """
+    The csv_lines function takes as an argument a queryset of ads. Returns an iterator of the lines
+    of the CSV document, starting with the header.
+    """
+    writer = csv.writer(Echo())
+    yield writer.writerow(list(EXPORT_FIELDS))
+    for row in iter_rows(queryset):
+        yield writer.writerow(row)
+
+
+EXPORTERS = {
+    "ndjson": ndjson_lines,
+    "csv": csv_lines,
+}
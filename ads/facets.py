@@ -0,0 +1,88 @@
+from typing import Any, Dict, List, Mapping, Optional
+
+from django.conf import settings
+from django.db.models import QuerySet, Count, Q
+
+from ads.filters import filter_ads
+from ads.models import Ad
+
+FACETS_ENABLED: List[str] = ["1", "true"]
+
+
+def facets_requested(params: Mapping[str, str]) -> bool:
+    """
+    The facets_requested function takes as an argument the query parameters of the request.
+    Returns True if the facets of the ad list are requested by the facets parameter.
+    """
+    return params.get("facets", "").lower() in FACETS_ENABLED
+
+
+def count_categories(queryset: QuerySet[Ad]) -> List[Dict[str, Any]]:
+    """
+    The count_categories function takes as an argument a queryset of ads. Counts the ads by categories
+    with a single grouped query. Returns a list of dictionaries with the identifier, the name
+    and the number of ads of each category, the largest first.
+    """
+    rows: QuerySet = queryset.exclude(category=None).order_by().values(
+        "category_id", "category__name"
+    ).annotate(count=Count("id")).order_by("-count", "category__name")
+
+    return [{"id": row["category_id"], "name": row["category__name"], "count": row["count"]} for row in rows]
+
+
+def count_locations(queryset: QuerySet[Ad]) -> List[Dict[str, Any]]:
+    """
+    The count_locations function takes as an argument a queryset of ads. Counts the ads by locations
+    of their authors with a single grouped query. Returns a list of dictionaries with the identifier,
+    the name and the number of ads of each location, the largest first.
+    """
+    rows: QuerySet = queryset.exclude(author__location=None).order_by().values(
+        "author__location_id", "author__location__name"
+    ).annotate(count=Count("id")).order_by("-count", "author__location__name")
+
+    return [
+        {"id": row["author__location_id"], "name": row["author__location__name"], "count": row["count"]}
+        for row in rows
+    ]
+
+
+def count_prices(queryset: QuerySet[Ad]) -> List[Dict[str, Any]]:
+    """
+    The count_prices function takes as an argument a queryset of ads. Counts the ads in the price ranges
+    bounded by the ADS_FACETS_PRICE_BUCKETS setting with a single aggregate query, the last range being open.
+    Returns a list of dictionaries with the bounds and the number of ads of each range.
+    """
+    bounds: List[int] = settings.ADS_FACETS_PRICE_BUCKETS
+    buckets: List[Dict[str, Optional[int]]] = [
+        {"from": lower, "to": upper} for lower, upper in zip(bounds, bounds[1:] + [None])
+    ]
+    counts: Dict[str, int] = queryset.order_by().aggregate(**{
+        f"bucket_{index}": Count(
+            "id",
+            filter=Q(price__gte=bucket["from"]) if bucket["to"] is None
+            else Q(price__gte=bucket["from"], price__lt=bucket["to"])
+        )
+        for index, bucket in enumerate(buckets)
+    })
+
+    return [{**bucket, "count": counts[f"bucket_{index}"]} for index, bucket in enumerate(buckets)]
+
+
+def get_facets(queryset: QuerySet[Ad], params: Mapping[str, str]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    The get_facets function takes as arguments the unfiltered queryset of ads and the query parameters
+    of the request. Computes the counts of the ads matching the filters by categories, by locations and
+    by price ranges with three queries regardless of the number of categories. The counts by categories
+    ignore the category filter, so that the counts of the other categories are shown alongside the selected one.
+    Returns a dictionary of the facets.
+    """
+    filtered: QuerySet[Ad] = filter_ads(queryset, params)
+    without_category: QuerySet[Ad] = filter_ads(queryset, {
+        name: value for name, value in params.items() if name != "cat"
+    })
+
+    return {
+        "categories": count_categories(without_category),
+        "locations": count_locations(filtered),
+        "price": count_prices(filtered),
+    }
@@ -0,0 +1,68 @@
+from typing import Mapping, Tuple
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import QuerySet, F
+
+from ads.geo import parse_near, parse_radius, filter_near
+from ads.models import Ad
+from author.models import Location
+
+RANKED_PARAMS: Tuple[str, ...] = ("text", "near")
+
+
+def is_ranked(params: Mapping[str, str]) -> bool:
+    """
+    The is_ranked function takes as an argument the query parameters of the request. Returns True if the ads
+    are ordered by the relevance of the full-text search or by the distance from the near point, otherwise False.
+    """
+    return any(params.get(param) for param in RANKED_PARAMS)
+
+
+def filter_ads(queryset: QuerySet[Ad], params: Mapping[str, str]) -> QuerySet[Ad]:
+    """
+    The filter_ads function takes as arguments a queryset of ads and the query parameters of the request.
+    Implements the search of ads by category, by price, a full-text search over the name and description fields,
+    ranked by relevance, and a search of ads within the radius_km kilometers from the near point,
+    ordered by distance. Returns the filtered queryset.
+    """
+    category_id_req: str = params.get('cat', None)
+    if category_id_req:
+        queryset = queryset.filter(
+            category_id__exact=category_id_req
+        )
+
+    text_req: str = params.get('text', None)
+    if text_req:
+        search_query: SearchQuery = SearchQuery(text_req, config="russian", search_type="websearch")
+        queryset = queryset.filter(
+            search_vector=search_query
+        ).annotate(
+            rank=SearchRank(F("search_vector"), search_query)
+        ).order_by("-rank", "id")
+
+    location_req: str = params.get('location', None)
+    if location_req:
+        queryset = queryset.filter(
+            author__location_id__in=Location.objects.filter(name__icontains=location_req).values("id")
+        )
+
+    near_req: str = params.get('near', None)
+    if near_req:
+        lat, lng = parse_near(near_req)
+        radius_km: float = parse_radius(params.get('radius_km', str(settings.ADS_NEAR_DEFAULT_RADIUS_KM)))
+        queryset = filter_near(queryset, lat, lng, radius_km)
+
+    price_frome_req: int = params.get('price_from', None)
+    if price_frome_req:
+        queryset = queryset.filter(
+            price__gte=int(price_frome_req)
+        )
+
+    price_to_req: int = params.get('price_to', None)
+    if price_to_req:
+        queryset = queryset.filter(
+            price__lte=int(price_to_req)
+        )
+
+    return queryset
@@ -0,0 +1,102 @@
+import math
+from typing import List, Tuple
+
+from django.db.models import QuerySet, F, FloatField, ExpressionWrapper, Q, Value
+from django.db.models.functions import ASin, Cos, Least, Radians, Sin, Sqrt, Power
+from rest_framework.exceptions import ValidationError
+
+EARTH_RADIUS_KM: float = 6371.0
+KM_PER_DEGREE_LAT: float = 111.32
+
+
+def parse_near(value: str) -> Tuple[float, float]:
+    """
+    The parse_near function takes as an argument the value of the near query parameter as a string
+    in the format '<lat>,<lng>'. Returns a tuple of the latitude and longitude. In case of an incorrect value,
+    raises a ValidationError exception from the rest_framework.exceptions module.
+    """
+    try:
+        lat, lng = (float(coordinate) for coordinate in value.split(","))
+    except ValueError:
+        raise ValidationError({"near": "The value must be in the format '<lat>,<lng>'."})
+
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        raise ValidationError({"near": "The coordinates are out of range."})
+
+    return lat, lng
+
+
+def parse_radius(value: str) -> float:
+    """
+    The parse_radius function takes as an argument the value of the radius_km query parameter as a string.
+    Returns the radius in kilometers. In case of an incorrect value, raises a ValidationError exception
+    from the rest_framework.exceptions module.
+    """
+    try:
+        radius_km: float = float(value)
+    except ValueError:
+        raise ValidationError({"radius_km": "The value must be a number."})
+
+    if radius_km <= 0:
+        raise ValidationError({"radius_km": "The value must be greater than 0."})
+
+    return radius_km
+
+
+def bounding_box(lat: float, lng: float, radius_km: float) -> Tuple[float, float, List[Tuple[float, float]]]:
+    """
+    The bounding_box function takes as arguments the latitude and longitude of the center and the radius
+    in kilometers. Returns a tuple of the minimum and maximum latitude, clamped to the poles, and the list
+    of the ranges of longitude of the box containing the circle. A box crossing the antimeridian is split
+    into two ranges on both sides of it, a box reaching a pole covers all the longitudes.
+    """
+    delta_lat: float = radius_km / KM_PER_DEGREE_LAT
+    min_lat: float = max(lat - delta_lat, -90.0)
+    max_lat: float = min(lat + delta_lat, 90.0)
+    delta_lng: float = radius_km / (KM_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 0.01))
+    if min_lat == -90.0 or max_lat == 90.0 or delta_lng >= 180:
+        return min_lat, max_lat, [(-180.0, 180.0)]
+
+    min_lng: float = lng - delta_lng
+    max_lng: float = lng + delta_lng
+    if min_lng < -180:
+        return min_lat, max_lat, [(min_lng + 360, 180.0), (-180.0, max_lng)]
+    if max_lng > 180:
+        return min_lat, max_lat, [(min_lng, 180.0), (-180.0, max_lng - 360)]
+    return min_lat, max_lat, [(min_lng, max_lng)]
+
+
+def filter_near(queryset: QuerySet, lat: float, lng: float, radius_km: float,
+                location_path: str = "author__location") -> QuerySet:
+    """
+    The filter_near function takes as arguments a queryset, the latitude and longitude of the center, the radius
+    in kilometers and the path to the location of the objects. Selects the objects inside the bounding box
+    of the circle, which is resolved by the index on the coordinates of the locations, then checks the exact
+    distance by the haversine formula. Returns the queryset annotated with the distance in kilometers
+    and ordered by it.
+    """
+    min_lat, max_lat, lng_ranges = bounding_box(lat, lng, radius_km)
+    location_lat = F(f"{location_path}__lat")
+    location_lng = F(f"{location_path}__lng")
+
+    haversine = (
+        Power(Sin((Radians(location_lat) - math.radians(lat)) / 2), 2)
+        + math.cos(math.radians(lat)) * Cos(Radians(location_lat))
+        * Power(Sin((Radians(location_lng) - math.radians(lng)) / 2), 2)
+    )
+    distance = ExpressionWrapper(
+        2 * EARTH_RADIUS_KM * ASin(Least(Sqrt(haversine), Value(1.0))),
+        output_field=FloatField()
+    )
+
+    lng_lookup: Q = Q()
+    for lng_range in lng_ranges:
+        lng_lookup |= Q(**{f"{location_path}__lng__range": lng_range})
+
+    return queryset.filter(
+        lng_lookup, **{f"{location_path}__lat__range": (min_lat, max_lat)}
+    ).annotate(
+        distance=distance
+    ).filter(
+        distance__lte=radius_km
+    ).order_by("distance", "id")
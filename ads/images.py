@@ -0,0 +1,128 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage, Storage
+from django.db import transaction, connections
+from django.db.models import Q
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+VARIANTS: Dict[str, Tuple[int, int]] = {
+    "thumb": (200, 200),
+    "card": (600, 600),
+    "full": (1600, 1600),
+}
+FORMATS: Dict[str, str] = {
+    "webp": "WEBP",
+    "jpeg": "JPEG",
+}
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    The get_executor function returns the pool of worker threads processing the images,
+    creating it on the first call with the number of workers set by the IMAGE_VARIANTS_WORKERS setting.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=settings.IMAGE_VARIANTS_WORKERS, thread_name_prefix="ad-images")
+    return _executor
+
+
+def variant_name(image_name: str, variant: str, image_format: str) -> str:
+    """
+    The variant_name function takes as arguments the name of the original image in the storage, the name
+    of the variant and the format. Returns the name of the file of the variant in the storage.
+    """
+    directory, file_name = os.path.split(image_name)
+    stem: str = os.path.splitext(file_name)[0]
+    return os.path.join(directory, "variants", f"{stem}_{variant}.{image_format}")
+
+
+def media_lookup(name: str) -> Q:
+    """
+    The media_lookup function takes as an argument the name of a file in the storage. Returns the condition
+    selecting the ad whose original image or variant of the image is stored under this name. The name
+    of the original image is derived from the name of a variant up to its extension, so both conditions
+    are served by the index of the image column.
+    """
+    lookup: Q = Q(image=name)
+    directory, file_name = os.path.split(name)
+    stem, extension = os.path.splitext(file_name)
+    original_stem, _, variant = stem.rpartition("_")
+    image_format: str = extension.lstrip(".")
+    if os.path.basename(directory) == "variants" and variant in VARIANTS and image_format in FORMATS:
+        original_prefix: str = os.path.join(os.path.dirname(directory), f"{original_stem}.")
+        lookup |= Q(image__startswith=original_prefix, **{f"image_variants__{variant}__{image_format}": name})
+    return lookup
+
+
+def generate_variants(image_name: str, source_storage: Storage) -> Dict[str, Dict[str, str]]:
+    """
+    The generate_variants function takes as arguments the name of the original image and the storage containing it.
+    Resizes the image to each of the variants keeping the proportions and saves it in WebP and JPEG formats.
+    Returns a dictionary of the names of the saved files by variants and formats.
+    """
+    with source_storage.open(image_name, "rb") as image_file:
+        original: Image.Image = ImageOps.exif_transpose(Image.open(image_file))
+        original = original.convert("RGB")
+
+    variants: Dict[str, Dict[str, str]] = {}
+    for variant, size in VARIANTS.items():
+        resized: Image.Image = original.copy()
+        resized.thumbnail(size, Image.Resampling.LANCZOS)
+        variants[variant] = {}
+        for image_format, pillow_format in FORMATS.items():
+            buffer: BytesIO = BytesIO()
+            resized.save(buffer, pillow_format, quality=settings.IMAGE_VARIANTS_QUALITY)
+            name: str = variant_name(image_name, variant, image_format)
+            if default_storage.exists(name):
+                default_storage.delete(name)
+            variants[variant][image_format] = default_storage.save(name, ContentFile(buffer.getvalue()))
+
+    return variants
+
+
+def process_ad_image(ad_id: int, image_name: str) -> None:
+    """
+    The process_ad_image function takes as arguments the identifier of the ad and the name of its image.
+    Generates the variants of the image, or reuses the variants of another ad with the same image,
+    and stores their names in the ad, unless the image of the ad has been replaced in the meantime. Is executed in a worker thread. Returns None.
+    """
+    from ads.cache import invalidate_categories
+    from ads.models import Ad
+
+    try:
+        variants: Optional[Dict[str, Dict[str, str]]] = Ad.objects.filter(image=image_name).exclude(
+            image_variants={}
+        ).values_list("image_variants", flat=True).first()
+        if not variants:
+            variants = generate_variants(image_name, Ad._meta.get_field("image").storage)
+        updated: int = Ad.objects.filter(pk=ad_id, image=image_name).update(
+            image_variants=variants,
+            updated_at=timezone.now()
+        )
+        if updated:
+            invalidate_categories(Ad.objects.filter(pk=ad_id).values_list("category_id", flat=True))
+    except Exception:
+        logger.exception("Failed to generate the variants of the image %s of the ad %s", image_name, ad_id)
+    finally:
+        connections.close_all()
+
+
+def schedule_ad_image(ad_id: int, image_name: str) -> None:
+    """
+    The schedule_ad_image function takes as arguments the identifier of the ad and the name of its image.
+    Submits the processing of the image to the worker pool after the current transaction is committed,
+    so the request saving the ad does not wait for it. Returns None.
+    """
+    transaction.on_commit(lambda: get_executor().submit(process_ad_image, ad_id, image_name))
@@ -0,0 +1,180 @@
+import os
+import shutil
+import tempfile
+from collections import defaultdict
+from typing import Any, Dict, List, Set
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from ads.cache import invalidate_categories
+from ads.images import FORMATS, VARIANTS, generate_variants, variant_name
+from ads.models import Ad, ImageBlob
+from ads.storage import content_name, hash_file, image_storage, is_content_name
+
+
+class Command(BaseCommand):
+    """
+    The Command class inherits from the BaseCommand class from the django management module.
+    Moves the existing ad images into the content-addressed layout, keeping one file per distinct content,
+    points the ads to the moved files and recounts the references to them.
+    """
+    help: str = "Deduplicates the ad images by content and stores them under their SHA-256 digest."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        The add_arguments function overrides the method of the parent class and declares the options
+        of the command: the directory of the images and the dry run flag.
+        """
+        parser.add_argument("--directory", default="images",
+                            help="The directory of the images relative to the media root, 'images' by default.")
+        parser.add_argument("--dry-run", action="store_true",
+                            help="Reports the duplicates without changing the files and the ads.")
+
+    def iter_images(self, directory: str) -> List[str]:
+        """
+        The iter_images function takes as an argument the directory of the images in the storage. Returns the sorted
+        list of the names of the images in it and its subdirectories, except the variants and the hidden files
+        of unfinished uploads and deletions.
+        """
+        directories, files = image_storage.listdir(directory)
+        names: List[str] = [
+            os.path.join(directory, file_name) for file_name in files if not file_name.startswith(".")
+        ]
+        for subdirectory in directories:
+            if subdirectory != "variants":
+                names.extend(self.iter_images(os.path.join(directory, subdirectory)))
+        return sorted(names)
+
+    def link(self, name: str, target: str) -> None:
+        """
+        The link function takes as arguments the name of an image and its content-addressed name. Stores the image
+        under the new name with a hard link, or with a copy moved into place where links are not supported,
+        keeping the old file for the ads still pointing to it. Returns None.
+        """
+        source: str = image_storage.path(name)
+        path: str = image_storage.path(target)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            os.link(source, path)
+        except FileExistsError:
+            pass
+        except OSError:
+            with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), prefix=".upload-", delete=False) as temporary:
+                with open(source, "rb") as image_file:
+                    shutil.copyfileobj(image_file, temporary)
+            os.replace(temporary.name, path)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """
+        The handle function overrides the method of the parent class. Hashes every image and links the first copy
+        of each content under its digest, generates the variants of the linked images, then points the ads
+        to them and recounts the references in one transaction. The old images and their variants are deleted
+        only after the transaction is committed, so an interrupted run leaves every ad with its file and can be
+        repeated. Reports the number of the removed duplicates and the bytes saved.
+        """
+        directory: str = options["directory"].strip("/")
+        dry_run: bool = options["dry_run"]
+        renamed: Dict[str, str] = {}
+        stored: Set[str] = set()
+        duplicates: int = 0
+        saved: int = 0
+
+        for name in self.iter_images(directory):
+            if is_content_name(name):
+                continue
+            with image_storage.open(name, "rb") as image_file:
+                digest, size = hash_file(image_file)
+            target: str = content_name(directory, digest, os.path.splitext(name)[1])
+            renamed[name] = target
+
+            if target in stored or image_storage.exists(target):
+                duplicates += 1
+                saved += size
+                self.stdout.write(f"{name} duplicates {target}")
+            else:
+                stored.add(target)
+                self.stdout.write(f"{name} -> {target}")
+                if not dry_run:
+                    self.link(name, target)
+
+        if not dry_run and renamed:
+            variants: Dict[str, Dict[str, Dict[str, str]]] = self.generate_variants(renamed)
+            with transaction.atomic():
+                category_ids: Set[int] = self.update_ads(renamed, variants)
+                self.count_references()
+                transaction.on_commit(lambda: self.delete_images(renamed, category_ids))
+
+        prefix: str = "Would remove" if dry_run else "Removed"
+        self.stdout.write(self.style.SUCCESS(f"{prefix} {duplicates} duplicate images, {saved} bytes saved."))
+
+    def generate_variants(self, renamed: Dict[str, str]) -> Dict[str, Dict[str, Dict[str, str]]]:
+        """
+        The generate_variants function takes as an argument a dictionary of the new names of the images by their
+        old names. Generates the variants of each new image referenced by the ads once, reporting the images
+        whose variants fail. Returns a dictionary of the variants by the new names.
+        """
+        referenced: Set[str] = set(Ad.objects.filter(image__in=list(renamed)).values_list("image", flat=True))
+        variants: Dict[str, Dict[str, Dict[str, str]]] = {}
+        for new_name in sorted({renamed[name] for name in referenced}):
+            try:
+                variants[new_name] = generate_variants(new_name, image_storage)
+            except Exception as error:
+                self.stderr.write(f"Failed to generate the variants of {new_name}: {error}")
+        return variants
+
+    def update_ads(self, renamed: Dict[str, str], variants: Dict[str, Dict[str, Dict[str, str]]]) -> Set[int]:
+        """
+        The update_ads function takes as arguments a dictionary of the new names of the images by their old names
+        and a dictionary of the variants by the new names. Points the ads to the new names with their variants.
+        Returns the set of the ids of the categories of the changed ads.
+        """
+        old_names: Dict[str, List[str]] = defaultdict(list)
+        for old_name, new_name in renamed.items():
+            old_names[new_name].append(old_name)
+
+        category_ids: Set[int] = set()
+        for new_name, names in old_names.items():
+            ads = Ad.objects.filter(image__in=names)
+            category_ids.update(ads.values_list("category_id", flat=True))
+            ads.update(image=new_name, image_variants=variants.get(new_name, {}), updated_at=timezone.now())
+        return category_ids
+
+    def delete_images(self, renamed: Dict[str, str], category_ids: Set[int]) -> None:
+        """
+        The delete_images function takes as arguments a dictionary of the new names of the images by their old names
+        and the set of the ids of the categories of the changed ads. Deletes the old images and their variants
+        and invalidates the cached ad lists of the categories. Returns None.
+        """
+        for old_name in renamed:
+            image_storage.delete(old_name)
+            for variant in VARIANTS:
+                for image_format in FORMATS:
+                    image_storage.delete(variant_name(old_name, variant, image_format))
+        invalidate_categories(category_ids)
+
+    def count_references(self) -> None:
+        """
+        The count_references function recounts the ads referencing every image of the content-addressed layout
+        and stores the numbers in the ImageBlob model, removing the records of the unreferenced images.
+        Returns None.
+        """
+        counts: Dict[str, int] = {
+            row["image"]: row["refcount"]
+            for row in Ad.objects.values("image").annotate(refcount=Count("id")).order_by()
+            if is_content_name(row["image"])
+        }
+
+        with transaction.atomic():
+            ImageBlob.objects.exclude(name__in=counts).delete()
+            existing: Dict[str, ImageBlob] = ImageBlob.objects.in_bulk(counts, field_name="name")
+            for blob in existing.values():
+                blob.refcount = counts[blob.name]
+            ImageBlob.objects.bulk_update(existing.values(), ["refcount"])
+            ImageBlob.objects.bulk_create([
+                ImageBlob(name=name, size=image_storage.size(name) if image_storage.exists(name) else 0,
+                          refcount=refcount)
+                for name, refcount in counts.items() if name not in existing
+            ])
@@ -0,0 +1,49 @@
+from typing import Any, Dict, List
+
+from django.core.management.base import BaseCommand, CommandParser, CommandError
+from rest_framework.exceptions import ValidationError
+
+from ads.export import EXPORTERS
+from ads.filters import filter_ads
+from ads.models import Ad
+
+FILTER_OPTIONS: List[str] = ["cat", "text", "location", "near", "radius_km", "price_from", "price_to"]
+
+
+class Command(BaseCommand):
+    """
+    The Command class inherits from the BaseCommand class from the django management module.
+    Exports all the published ads matching the filters of the ad list in NDJSON or CSV format.
+    """
+    help: str = "Streams the published ads matching the ad list filters as NDJSON or CSV."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        The add_arguments function overrides the method of the parent class and declares the options
+        of the command: the format, the output file and the filters of the ad list.
+        """
+        parser.add_argument("--format", choices=list(EXPORTERS), default="ndjson")
+        parser.add_argument("--output", help="The path of the output file, the standard output by default.")
+        for option in FILTER_OPTIONS:
+            parser.add_argument(f"--{option.replace('_', '-')}", dest=option)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """
+        The handle function overrides the method of the parent class. Writes the exported lines to the output
+        one by one, so the memory used does not depend on the number of ads.
+        """
+        params: Dict[str, str] = {option: options[option] for option in FILTER_OPTIONS if options[option] is not None}
+        try:
+            queryset = filter_ads(Ad.objects.filter(is_published=True), params)
+        except ValidationError as error:
+            raise CommandError(error.detail)
+
+        lines = EXPORTERS[options["format"]](queryset)
+        if not options["output"]:
+            for line in lines:
+                self.stdout.write(line, ending="")
+            return
+
+        with open(options["output"], "w", encoding="utf-8", newline="") as output:
+            for line in lines:
+                output.write(line)
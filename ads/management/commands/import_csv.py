@@ -0,0 +1,91 @@
+import os
+from typing import Any, Dict, List, Type
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser, CommandError
+from django.db import transaction
+from django.db.models import Model
+
+from ads.cache import invalidate_categories
+from ads.models import Ad
+from author.locations import invalidate_locations
+from author.models import Location
+from categories.cache import invalidate_snapshot
+from categories.models import Category
+from home_work.csv_import import TABLES, CsvImport, CsvTable, get_table, reset_sequences
+
+DEFAULT_PATHS: List[str] = [
+    os.path.join(settings.BASE_DIR, "categories", "fixtures", "category.csv"),
+    os.path.join(settings.BASE_DIR, "author", "fixtures", "location.csv"),
+    os.path.join(settings.BASE_DIR, "author", "fixtures", "user.csv"),
+    os.path.join(settings.BASE_DIR, "ads", "fixtures", "ad.csv"),
+]
+
+
+class Command(BaseCommand):
+    """
+    The Command class inherits from the BaseCommand class from the django management module.
+    Streams the category.csv, location.csv, user.csv and ad.csv files into the database with the COPY statement,
+    validating the rows and resolving the foreign keys in batches, in a single transaction.
+    """
+    help: str = "Loads the categories, locations, users and ads from CSV files with the PostgreSQL COPY statement."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        The add_arguments function overrides the method of the parent class and declares the options
+        of the command: the paths of the files, the size of a batch, the number of the tolerated invalid rows
+        and the hashing of the passwords.
+        """
+        parser.add_argument("paths", nargs="*",
+                            help="The paths of the CSV files, named after their tables, the fixtures by default.")
+        parser.add_argument("--batch-size", type=int, default=settings.IMPORT_CSV_BATCH_SIZE)
+        parser.add_argument("--max-errors", type=int, default=100,
+                            help="The number of the skipped invalid rows after which the import is rolled back.")
+        parser.add_argument("--hash-passwords", action="store_true",
+                            help="Hashes the passwords of the users instead of copying them as they are.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """
+        The handle function overrides the method of the parent class. Loads the files in the order of the references
+        between the tables and reports the progress after every batch. Rolls back the import if there are more invalid
+        rows than allowed, otherwise resets the sequences of the tables and invalidates the cached locations, categories and ad lists.
+        """
+        tables: Dict[str, CsvTable] = {}
+        for path in options["paths"] or DEFAULT_PATHS:
+            table = get_table(os.path.basename(path), hash_passwords=options["hash_passwords"])
+            if table is None:
+                raise CommandError(f"Unknown file {path}, expected one of: "
+                                   f"{', '.join(table.file_name for table in TABLES)}.")
+            tables[path] = table
+
+        order: List[Type[CsvTable]] = list(TABLES)
+        paths: List[str] = sorted(tables, key=lambda path: order.index(type(tables[path])))
+        errors: int = 0
+        models: List[Type[Model]] = []
+
+        with transaction.atomic():
+            for path in paths:
+                with open(path, encoding="utf-8", newline="") as file:
+                    csv_import: CsvImport = CsvImport(tables[path], file, options["batch_size"])
+                    for copied, failed in csv_import.run():
+                        self.stdout.write(f"{tables[path].file_name}: {copied} rows copied, {failed} skipped")
+                        if errors + failed > options["max_errors"]:
+                            for error in csv_import.errors:
+                                self.stderr.write(error)
+                            raise CommandError(f"More than {options['max_errors']} invalid rows, nothing imported.")
+
+                for error in csv_import.errors:
+                    self.stderr.write(error)
+                errors += len(csv_import.errors)
+                models.append(tables[path].model)
+
+            reset_sequences(models)
+
+        if Location in models:
+            invalidate_locations()
+        if Category in models:
+            invalidate_snapshot()
+        if Ad in models:
+            invalidate_categories(Category.objects.values_list("id", flat=True))
+        self.stdout.write(self.style.SUCCESS(f"Imported {', '.join(tables[path].file_name for path in paths)}, "
+                                             f"{errors} invalid rows skipped."))
@@ -0,0 +1,50 @@
+# Generated by Django 4.1.7 on 2026-10-17 18:36
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+SEARCH_VECTOR_TRIGGER_SQL = """
+CREATE FUNCTION ads_ad_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('russian', coalesce(NEW.name, '')), 'A') ||
+        setweight(to_tsvector('russian', coalesce(NEW.description, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER ads_ad_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF name, description ON ads_ad
+    FOR EACH ROW EXECUTE FUNCTION ads_ad_search_vector_update();
+
+UPDATE ads_ad SET search_vector =
+    setweight(to_tsvector('russian', coalesce(name, '')), 'A') ||
+    setweight(to_tsvector('russian', coalesce(description, '')), 'B');
+"""
+
+SEARCH_VECTOR_TRIGGER_REVERSE_SQL = """
+DROP TRIGGER IF EXISTS ads_ad_search_vector_trigger ON ads_ad;
+DROP FUNCTION IF EXISTS ads_ad_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ads', '0003_alter_ad_category_alter_ad_description_alter_ad_name_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ad',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='ad',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='ad_search_vector_gin'),
+        ),
+        migrations.RunSQL(SEARCH_VECTOR_TRIGGER_SQL, SEARCH_VECTOR_TRIGGER_REVERSE_SQL),
+    ]
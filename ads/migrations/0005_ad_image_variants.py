@@ -0,0 +1,18 @@
+# Generated by Django 4.1.7 on 2026-10-17 18:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ads', '0004_ad_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ad',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.1.7 on 2026-10-17 18:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ads', '0006_ad_updated_at'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    "ALTER TABLE ads_ad ALTER COLUMN is_published TYPE boolean "
+                    "USING is_published = 'TRUE'",
+                    "ALTER TABLE ads_ad ALTER COLUMN is_published TYPE varchar(5) "
+                    "USING CASE WHEN is_published THEN 'TRUE' ELSE 'FALSE' END",
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='ad',
+                    name='is_published',
+                    field=models.BooleanField(default=False),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='ad',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['category', 'price'], name='ad_published_cat_price_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.1.7 on 2026-10-17 18:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ads', '0007_ad_is_published_boolean'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ad',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['id'], name='ad_published_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ad',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['price', 'id'], name='ad_published_price_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.1.7 on 2026-10-17 19:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ads', '0009_image_blobs'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ad',
+            index=models.Index(fields=['image'], name='ad_image_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
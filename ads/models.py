@@ -1,6 +1,10 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinLengthValidator, MinValueValidator
 from django.db import models
+from django.db.models import Q
 
+from ads.storage import get_image_storage
 from author.models import User
 from categories.models import Category
 
@@ -16,18 +20,59 @@ class Ad(models.Model):
     author = models.ForeignKey(User, on_delete=models.CASCADE)
     price = models.DecimalField(max_digits=10, decimal_places=0, null=True, validators=[MinValueValidator(0)])
     description = models.CharField(max_length=2000, blank=True, null=True)
-    is_published = models.CharField(max_length=5, choices=STATUS, default="FALSE")
-    image = models.ImageField(upload_to="images/")
+    is_published = models.BooleanField(default=False)
+    image = models.ImageField(upload_to="images/", storage=get_image_storage)
     category = models.ForeignKey(Category, on_delete=models.PROTECT)
-
+    search_vector = SearchVectorField(null=True, editable=False)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         """
         The Meta class is used to change the behavior of model fields,
-        such as verbose_name - a human-readable model name.
+        such as verbose_name - a human-readable model name
+        and indexes to declare the database indexes of the table.
+        The search_vector column is maintained by a database trigger from the name and description fields,
+        the partial indexes serve the public listing of the published ads ordered by id, filtered by category
+        and price and filtered by price, the index of the image names serves the lookups of the media files
+        by the exact name and by the prefix of the name of the original image of a variant.
         """
         verbose_name = 'Объявление'
         verbose_name_plural = 'Объявления'
+        indexes = [
+            GinIndex(fields=["search_vector"], name="ad_search_vector_gin"),
+            models.Index(fields=["id"], condition=Q(is_published=True), name="ad_published_id_idx"),
+            models.Index(fields=["category", "price"], condition=Q(is_published=True),
+                         name="ad_published_cat_price_idx"),
+            models.Index(fields=["price", "id"], condition=Q(is_published=True), name="ad_published_price_idx"),
+            models.Index(fields=["image"], opclasses=["varchar_pattern_ops"], name="ad_image_idx"),
+        ]
+
+    def __str__(self) -> str:
+        """
+        The __str__ function overrides the method of the parent class Model and creates
+        an output format for instances of this class.
+        """
+        return self.name
+
+
+class ImageBlob(models.Model):
+    """
+    The ImageBlob class is an inheritor of the Model class from the models library. It is a data model contained
+    in the ads_imageblob database table. Describes a file of the content-addressed storage of the ad images
+    and counts the ads referencing it, so the file is deleted with the last of them.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    size = models.PositiveBigIntegerField(default=0)
+    refcount = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        """
+        The Meta class is used to change the behavior of model fields,
+        such as verbose_name - a human-readable model name.
+        """
+        verbose_name = 'Файл изображения'
+        verbose_name_plural = 'Файлы изображений'
 
     def __str__(self) -> str:
         """
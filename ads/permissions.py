@@ -1,23 +1,31 @@
-from rest_framework.permissions import BasePermission
-
 from ads.models import Ad
+from home_work.permissions import OwnerEditPermission
 
 
-class AdEditPermission(BasePermission):
+class AdEditPermission(OwnerEditPermission):
     """
-    The AdEditPermission class inherits from the BasePermission class from the permissions module
-    of the rest_framework library. Controls access to protected endpoints.
+    The AdEditPermission class inherits from the OwnerEditPermission class. Controls access to protected endpoints:
+    the ads are edited only by their creators and users with the role of administrator or moderator.
     """
     message: str = "Only owners, administrators, and moderators are allowed to edit the ad."
+    owner_field: str = "author"
+
+
+class AdMediaPermission(AdEditPermission):
+    """
+    The AdMediaPermission class inherits from the AdEditPermission class. Controls access to the images of the ads:
+    the images of the published ads are available to everyone, the images of the unpublished ones only to their
+    creators and users with the role of administrator or moderator.
+    """
+    message: str = "Only owners, administrators, and moderators are allowed to view the images of unpublished ads."
 
     def has_object_permission(self, request, view, obj: Ad) -> bool:
         """
-        The has_object_permission function overrides the method of the base class. Accepts as arguments
-        a request object, a view object, and a database object requested for editing.
-        Checks the user's access rights to the requested actions. Returns True if the test result
-        is positive, otherwise False.
+        The has_object_permission function overrides the method of the parent class. Accepts as arguments
+        a request object, a view object, and the ad whose image is requested. Returns True if the ad is published
+        or the user is allowed to edit it, otherwise False.
         """
-        if bool(request.user and (request.user.role in ["moderator", "admin"])):
+        if obj.is_published:
             return True
 
-        return obj.author == request.user
+        return request.user.is_authenticated and super().has_object_permission(request, view, obj)
@@ -1,15 +1,113 @@
-from typing import List
+from typing import List, Dict, Optional, Tuple
 
+from django.core.files.storage import default_storage
 from django.db.models import Model
 from rest_framework import serializers
 
+from ads.images import VARIANTS, FORMATS
 from ads.models import Ad
 from ads.validators import check_status_not_TRUE
 from author.models import User
 from categories.models import Category
+from categories.serializers import CategoryNameField
+from home_work.sparse_fields import SparseFieldsSerializerMixin
 
 
-class AdListSerializer(serializers.ModelSerializer):
+class AdImageVariantsField(serializers.Field):
+    """
+    The AdImageVariantsField class inherits from the Field class from the rest_framework serializers module.
+    Displays the URLs of the resized variants of the ad image by variants and formats. Until the variants
+    are generated in the background, the URL of the original image is displayed in their place.
+    """
+    model_fields: Tuple[str, ...] = ("image", "image_variants")
+
+    def __init__(self, **kwargs) -> None:
+        """
+        The __init__ function overrides the method of the parent class and declares the field read-only,
+        built from the whole ad object.
+        """
+        super().__init__(source="*", read_only=True, **kwargs)
+
+    def to_representation(self, ad: Ad) -> Optional[Dict[str, Dict[str, str]]]:
+        """
+        The to_representation function overrides the method of the parent class. Accepts the ad object
+        as an argument. Returns a dictionary of the URLs of the variants of its image, or None if the ad
+        has no image.
+        """
+        return self.to_representation_from_values(ad.image.name, ad.image_variants)
+
+    def to_representation_from_values(self, image: str,
+                                      image_variants: Dict[str, Dict[str, str]]) -> Optional[Dict[str, Dict[str, str]]]:
+        """
+        The to_representation_from_values function accepts as arguments the values of the image and image_variants
+        fields of the ad. Returns a dictionary of the URLs of the variants of the image, or None if there is no image.
+        """
+        if not image:
+            return None
+
+        request = self.context.get("request")
+        original_url: str = Ad._meta.get_field("image").storage.url(image)
+        urls: Dict[str, Dict[str, str]] = {}
+        for variant in VARIANTS:
+            names: Dict[str, str] = image_variants.get(variant, {})
+            urls[variant] = {}
+            for image_format in FORMATS:
+                url: str = default_storage.url(names[image_format]) if image_format in names else original_url
+                urls[variant][image_format] = request.build_absolute_uri(url) if request else url
+        return urls
+
+
+class PrefetchedSlugRelatedField(serializers.SlugRelatedField):
+    """
+    The PrefetchedSlugRelatedField class inherits from the SlugRelatedField class from the rest_framework
+    serializers module. If the context of the serializer contains the objects prefetched for its field,
+    resolves the slug among them instead of querying the database for every value.
+    """
+    def to_internal_value(self, data: str) -> Model:
+        """
+        The to_internal_value function overrides the method of the parent class. Accepts the slug as an argument.
+        Returns the related object with this slug.
+        """
+        prefetched: Optional[Dict[str, Model]] = self.context.get("prefetched", {}).get(self.field_name)
+        if prefetched is None:
+            return super().to_internal_value(data)
+        if not isinstance(data, str):
+            self.fail("invalid")
+        if data not in prefetched:
+            self.fail("does_not_exist", slug_name=self.slug_field, value=data)
+        return prefetched[data]
+
+
+class PublishedStatusField(serializers.ChoiceField):
+    """
+    The PublishedStatusField class inherits from the ChoiceField class from the rest_framework serializers module.
+    Displays the boolean is_published field of the Ad model as the strings 'TRUE' and 'FALSE'
+    and accepts these strings or booleans as input.
+    """
+    def __init__(self, **kwargs) -> None:
+        """
+        The __init__ function overrides the method of the parent class and sets the choices of the publication status.
+        """
+        super().__init__(choices=Ad.STATUS, **kwargs)
+
+    def to_internal_value(self, data) -> bool:
+        """
+        The to_internal_value function overrides the method of the parent class. Accepts the status as an argument.
+        Returns True for the published status, otherwise False.
+        """
+        if isinstance(data, bool):
+            return data
+        return super().to_internal_value(data) == "TRUE"
+
+    def to_representation(self, value: bool) -> str:
+        """
+        The to_representation function overrides the method of the parent class. Accepts the value of the field
+        as an argument. Returns the status as a string.
+        """
+        return "TRUE" if value else "FALSE"
+
+
+class AdListSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """
     The AdListSerializer class inherits from the serializer class.ModelSerializer is a class for convenient
     serialization and deserialization of objects of the Ad class when processing GET requests at the address '/ad/'.
@@ -19,57 +117,60 @@ class AdListSerializer(serializers.ModelSerializer):
         read_only=True,
         slug_field="username"
     )
+    images = AdImageVariantsField()
 
     class Meta:
         """
         The Meta class is an internal service class of the serializer,
-        defines the necessary parameters for the serializer to function.
+        defines the necessary parameters for the serializer to function
+        and the relations to be joined when loading the serialized objects.
         """
         model: Model = Ad
-        fields: List[str] = ["id", "name", "price", "author"]
+        fields: List[str] = ["id", "name", "price", "author", "images"]
+        select_related: List[str] = ["author"]
 
 
-class AdDetailSerializer(serializers.ModelSerializer):
+class AdDetailSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """
     The AdDetailSerializer class inherits from the serializer class.ModelSerializer is a class for convenient
     serialization and deserialization of objects of the Ad class when processing GET requests
-    at the address '/ad/<int: pk>/'. Overrides the value of the author and category fields for comfortable display.
+    at the address '/ad/<int: pk>/'. Overrides the value of the author, category and is_published fields
+    for comfortable display.
     """
     author = serializers.SlugRelatedField(
         read_only=True,
         slug_field="username"
     )
-    category = serializers.SlugRelatedField(
-        read_only=True,
-        slug_field="name"
-    )
+    category = CategoryNameField(read_only=True)
+    is_published = PublishedStatusField(read_only=True)
+    images = AdImageVariantsField()
 
     class Meta:
         """
         The Meta class is an internal service class of the serializer,
-        defines the necessary parameters for the serializer to function.
+        defines the necessary parameters for the serializer to function
+        and the relations to be joined when loading the serialized objects.
         """
         model: Model = Ad
-        fields: str = '__all__'
+        fields: List[str] = ["id", "name", "author", "price", "description", "is_published", "image", "images",
+                             "category"]
+        select_related: List[str] = ["author"]
 
 
 class AdCreateSerializer(serializers.ModelSerializer):
     """
     The AdDetailSerializer class inherits from the serializer class.ModelSerializer is a class for convenient
     serialization and deserialization of objects of the Ad class when processing POST requests
-    at the address '/ad/create/'. Overrides the value of the author and category fields for comfortable display.
+    at the address '/ad/create/'. Overrides the value of the author, category and is_published fields
+    for comfortable display.
     """
-    author = serializers.SlugRelatedField(
+    author = PrefetchedSlugRelatedField(
         queryset=User.objects.all(),
         slug_field="username"
     )
-    category = serializers.SlugRelatedField(
-        queryset=Category.objects.all(),
-        slug_field="name"
-    )
-    is_published = serializers.CharField(
-        max_length=5,
-        default="FALSE",
+    category = CategoryNameField(queryset=Category.objects.all())
+    is_published = PublishedStatusField(
+        default=False,
         validators=[check_status_not_TRUE]
     )
 
@@ -86,17 +187,15 @@ class AdUpdateSerializer(serializers.ModelSerializer):
     """
     The AdUpdateSerializer class inherits from the serializer class.ModelSerializer is a class for convenient
     serialization and deserialization of objects of the Ad class when processing PATCH requests
-    at the address '/ad/<int: pk>/update/'. Overrides the value of the author
-    and category fields for comfortable display.
+    at the address '/ad/<int: pk>/update/'. Overrides the value of the author, category
+    and is_published fields for comfortable display.
     """
-    author = serializers.SlugRelatedField(
+    author = PrefetchedSlugRelatedField(
         queryset=User.objects.all(),
         slug_field="username"
     )
-    category = serializers.SlugRelatedField(
-        queryset=Category.objects.all(),
-        slug_field="name"
-    )
+    category = CategoryNameField(queryset=Category.objects.all())
+    is_published = PublishedStatusField(required=False)
 
     class Meta:
         """
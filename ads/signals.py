@@ -0,0 +1,96 @@
+from typing import Any
+
+from django.db.models.signals import post_init, pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from ads.blobs import add_reference, release_reference
+from ads.cache import invalidate_categories
+from ads.images import schedule_ad_image
+from ads.models import Ad
+
+
+@receiver(post_init, sender=Ad)
+def remember_loaded_state(sender: Any, instance: Ad, **kwargs: Any) -> None:
+    """
+    The remember_loaded_state function is a receiver of the post_init signal of the Ad model. Remembers the category
+    the ad was loaded with, so that moving the ad to another category invalidates the responses of both,
+    and the name of its image, so that replacing the image is detected. Does not load the deferred fields.
+    Returns None.
+    """
+    instance._loaded_category_id = instance.__dict__.get("category_id")
+    instance._loaded_image = getattr(instance.__dict__.get("image"), "name", instance.__dict__.get("image"))
+
+
+def image_replaced(instance: Ad, adding: bool) -> bool:
+    """
+    The image_replaced function takes as arguments the ad object and a flag of its creation.
+    Returns True if the ad is saved with a new image, otherwise False.
+    """
+    if "image" not in instance.__dict__:
+        return False
+    return adding or instance.image.name != instance._loaded_image
+
+
+@receiver(pre_save, sender=Ad)
+def reset_image_variants(sender: Any, instance: Ad, **kwargs: Any) -> None:
+    """
+    The reset_image_variants function is a receiver of the pre_save signal of the Ad model. Drops the variants
+    of the previous image if the image of the ad has been replaced. Returns None.
+    """
+    if image_replaced(instance, instance._state.adding):
+        instance.image_variants = {}
+
+
+@receiver(post_save, sender=Ad)
+def invalidate_on_save(sender: Any, instance: Ad, **kwargs: Any) -> None:
+    """
+    The invalidate_on_save function is a receiver of the post_save signal of the Ad model. Invalidates
+    the cached ad list responses of the previous and the current category of the saved ad. Returns None.
+    """
+    invalidate_categories([instance._loaded_category_id, instance.__dict__.get("category_id")])
+    instance._loaded_category_id = instance.__dict__.get("category_id")
+
+
+@receiver(post_save, sender=Ad)
+def count_image_references(sender: Any, instance: Ad, **kwargs: Any) -> None:
+    """
+    The count_image_references function is a receiver of the post_save signal of the Ad model. Counts a reference
+    to the new image of the saved ad and releases the reference to its previous image. Is connected before
+    the process_image_on_save receiver, which remembers the new image as loaded. Returns None.
+    """
+    if image_replaced(instance, kwargs["created"]):
+        if instance.image:
+            add_reference(instance.image.name)
+        if not kwargs["created"] and instance._loaded_image:
+            release_reference(instance._loaded_image)
+
+
+@receiver(post_save, sender=Ad)
+def process_image_on_save(sender: Any, instance: Ad, **kwargs: Any) -> None:
+    """
+    The process_image_on_save function is a receiver of the post_save signal of the Ad model. Schedules
+    the generation of the variants of a new image of the saved ad in the background. Returns None.
+    """
+    if image_replaced(instance, kwargs["created"]):
+        if instance.image:
+            schedule_ad_image(instance.pk, instance.image.name)
+        instance._loaded_image = instance.image.name
+
+
+@receiver(post_delete, sender=Ad)
+def invalidate_on_delete(sender: Any, instance: Ad, **kwargs: Any) -> None:
+    """
+    The invalidate_on_delete function is a receiver of the post_delete signal of the Ad model. Invalidates
+    the cached ad list responses of the category of the deleted ad. Returns None.
+    """
+    invalidate_categories([instance._loaded_category_id])
+
+
+@receiver(post_delete, sender=Ad)
+def release_image_on_delete(sender: Any, instance: Ad, **kwargs: Any) -> None:
+    """
+    The release_image_on_delete function is a receiver of the post_delete signal of the Ad model. Releases
+    the reference of the deleted ad to its image. Returns None.
+    """
+    if instance._loaded_image:
+        release_reference(instance._loaded_image)
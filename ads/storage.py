@@ -0,0 +1,129 @@
+import hashlib
+import os
+import re
+import tempfile
+import time
+from typing import IO, Optional, Tuple
+
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+
+DIGEST_NAME_RE = re.compile(r"(^|/)[0-9a-f]{2}/[0-9a-f]{64}(\.[0-9a-z]+)?$")
+CHUNK_SIZE: int = 64 * 1024
+
+
+def content_name(directory: str, digest: str, extension: str) -> str:
+    """
+    The content_name function takes as arguments the directory of the upload, the SHA-256 digest of the content
+    and the extension of the file. Returns the name under which the content is stored, sharded by the first
+    two characters of the digest.
+    """
+    return os.path.join(directory, digest[:2], f"{digest}{extension.lower()}")
+
+
+def is_content_name(name: str) -> bool:
+    """
+    The is_content_name function takes as an argument the name of a file. Returns True if the file is stored
+    under the digest of its content, otherwise False.
+    """
+    return DIGEST_NAME_RE.search(name) is not None
+
+
+def hash_file(file: IO[bytes]) -> Tuple[str, int]:
+    """
+    The hash_file function takes as an argument a file open for reading in binary mode. Returns a tuple
+    of the SHA-256 digest of its content and its size in bytes.
+    """
+    hasher = hashlib.sha256()
+    size: int = 0
+    for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+        hasher.update(chunk)
+        size += len(chunk)
+    return hasher.hexdigest(), size
+
+
+def touch(path: str) -> bool:
+    """
+    The touch function takes as an argument the path of a stored file. Sets its modification time to the current
+    time in nanoseconds. Returns True if the file exists, otherwise False.
+    """
+    now: int = time.time_ns()
+    try:
+        os.utime(path, ns=(now, now))
+    except FileNotFoundError:
+        return False
+    return True
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    The ContentAddressedStorage class inherits from the FileSystemStorage class from the django storage module.
+    Stores every uploaded file under the SHA-256 digest of its content, computed while the upload is written
+    to a temporary file, so identical uploads share one file instead of getting random suffixes.
+    The references to the files are counted by the ImageBlob model.
+    """
+    def get_available_name(self, name: str, max_length: Optional[int] = None) -> str:
+        """
+        The get_available_name function overrides the method of the parent class. Returns the name unchanged,
+        since the final name of the file depends only on its content.
+        """
+        return name
+
+    def _save(self, name: str, content: File) -> str:
+        """
+        The _save function overrides the method of the parent class. Accepts the name of the upload and its content.
+        Writes the content to a temporary file computing its digest, then moves the file under the name derived
+        from the digest, unless a file with the same content is already stored, in which case only its modification
+        time is refreshed, so that a pending deletion of the released file is skipped. Returns the name
+        of the stored file.
+        """
+        directory: str = os.path.dirname(name)
+        os.makedirs(self.path(directory), exist_ok=True)
+        hasher = hashlib.sha256()
+
+        with tempfile.NamedTemporaryFile(dir=self.path(directory), prefix=".upload-", delete=False) as temporary:
+            for chunk in content.chunks(CHUNK_SIZE):
+                hasher.update(chunk)
+                temporary.write(chunk)
+
+        final_name: str = content_name(directory, hasher.hexdigest(), os.path.splitext(name)[1])
+        final_path: str = self.path(final_name)
+        if touch(final_path):
+            os.unlink(temporary.name)
+            return final_name
+
+        os.makedirs(os.path.dirname(final_path), exist_ok=True)
+        os.replace(temporary.name, final_path)
+        if self.file_permissions_mode is not None:
+            os.chmod(final_path, self.file_permissions_mode)
+        return final_name
+
+    def delete_unless_modified(self, name: str, since: int) -> bool:
+        """
+        The delete_unless_modified function takes as arguments the name of a stored file and a time in nanoseconds.
+        Moves the file aside first, so that an upload of the same content stores it again instead of reusing it,
+        then deletes it unless it has been modified at or after the given time, in which case it is moved back.
+        Returns True if the file has been deleted, otherwise False.
+        """
+        path: str = self.path(name)
+        aside: str = os.path.join(os.path.dirname(path), f".delete-{os.path.basename(path)}")
+        try:
+            os.replace(path, aside)
+        except FileNotFoundError:
+            return False
+
+        if os.stat(aside).st_mtime_ns >= since:
+            os.replace(aside, path)
+            return False
+        os.unlink(aside)
+        return True
+
+
+image_storage: ContentAddressedStorage = ContentAddressedStorage()
+
+
+def get_image_storage() -> ContentAddressedStorage:
+    """
+    The get_image_storage function returns the storage of the images of the ads.
+    """
+    return image_storage
@@ -6,6 +6,9 @@ from ads import views
 urlpatterns = [
     path('', views.AdsListView.as_view()),
     path('create/', views.AdCreateView.as_view()),
+    path('bulk/', views.AdBulkView.as_view()),
+    path('export/', views.AdsExportView.as_view()),
+    path('cache/stats/', views.AdsListCacheStatsView.as_view()),
     path('<int:pk>/', views.AdDetailView.as_view()),
     path('<int:pk>/update/', views.AdUpdateView.as_view()),
     path('<int:pk>/delete/', views.AdDeleteView.as_view()),
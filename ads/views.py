@@ -1,74 +1,200 @@
-from typing import Any
+from typing import Any, Dict, Optional, Tuple
 
-from django.db.models import QuerySet
+from asgiref.sync import sync_to_async
+
+from django.db.models import QuerySet, Aggregate, Max
+from django.core.files.storage import default_storage, Storage
+from django.http import StreamingHttpResponse, HttpResponse
+from rest_framework import status
+from rest_framework.exceptions import ValidationError, NotFound
 from rest_framework.generics import ListAPIView, RetrieveAPIView, CreateAPIView, UpdateAPIView, DestroyAPIView
+from rest_framework.pagination import BasePagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.serializers import ModelSerializer
+from rest_framework.views import APIView
 
+from ads.bulk import validate_items, save_items
+from ads.cache import ResponseCacheMixin, alookup, astore, get_stats, invalidate_categories
+from ads.export import EXPORTERS, CONTENT_TYPES
+from ads.facets import facets_requested, get_facets
+from ads.filters import RANKED_PARAMS, filter_ads, is_ranked
+from ads.images import media_lookup
 from ads.models import Ad
-from ads.permissions import AdEditPermission
+from ads.permissions import AdEditPermission, AdMediaPermission
 from ads.serializers import AdListSerializer, AdDetailSerializer, AdCreateSerializer, AdUpdateSerializer, \
     AdDeleteSerializer
+from categories.cache import CategorySnapshot, SNAPSHOT_CONTEXT_KEY, aget_snapshot
+from home_work.async_views import AsyncListView, AsyncRetrieveView
+from home_work.conditional import ConditionalRetrieveMixin
+from home_work.fast_serialization import FastListMixin
+from home_work.guarded_writes import GuardedUpdateMixin, GuardedDestroyMixin
+from home_work.media import serve_media
+from home_work.pagination import OptionalCursorPagination
+from home_work.sparse_fields import SparseFieldsMixin
 
 
-class AdsListView(ListAPIView):
+class AdsListView(ResponseCacheMixin, SparseFieldsMixin, FastListMixin, ListAPIView):
     """
     The Abslistview class inherits from the Listview class from the rest_framework module generics
     and is a class-based representation for processing requests by the GET method at the address '/ad/'.
+    Displays only the published ads.
     """
-    queryset: QuerySet[Ad] = Ad.objects.all()
+    queryset: QuerySet[Ad] = Ad.objects.filter(is_published=True).order_by("id")
     serializer_class: ModelSerializer = AdListSerializer
+    pagination_class: BasePagination = OptionalCursorPagination
+    fast_list: bool = True
 
     def get(self, request, *args: Any, **kwargs: Any) -> Response:
         """
         The get function overrides the method of the parent class. It is intended for processing GET requests
         at the address '/ad/'. Accepts the request object and any other positional and named parameters as arguments.
-        Adds functionality to implement the display of ad search results by category, the content of the name field,
-        and by price. Returns a Response object.
-        """
-        category_id_req: str = request.GET.get('cat', None)
-        if category_id_req:
-            self.queryset: QuerySet[Ad] = self.queryset.filter(
-                category_id__exact=category_id_req
-            )
-
-        text_req: str = request.GET.get('text', None)
-        if text_req:
-            self.queryset: QuerySet[Ad] = self.queryset.filter(
-                name__icontains=text_req
-            )
-
-        location_req: str = request.GET.get('location', None)
-        if location_req:
-            self.queryset: QuerySet[Ad] = self.queryset.filter(
-                author__location__name__icontains=location_req
-            )
-
-        price_frome_req: int = request.GET.get('price_from', None)
-        if price_frome_req:
-            self.queryset: QuerySet[Ad] = self.queryset.filter(
-                price__gte=int(price_frome_req)
-            )
-
-        price_to_req: int = request.GET.get('price_to', None)
-        if price_to_req:
-            self.queryset: QuerySet[Ad] = self.queryset.filter(
-                price__lte=int(price_to_req)
-            )
+        Adds functionality to implement the display of ad search results by category, by price,
+        a full-text search over the name and description fields, ranked by relevance, and a search of ads
+        within the radius_km kilometers from the near point, ordered by distance, and the facets of the results.
+        The keyset pagination orders the ads by id, so it is refused for the ranked searches. Returns a Response
+        object.
+        """
+        if self.paginator.is_cursor_mode(request) and is_ranked(request.GET):
+            raise ValidationError({"pagination": "The keyset pagination cannot be combined with the parameters "
+                                                 f"{', '.join(RANKED_PARAMS)}, ordered by relevance and distance."})
+        self.queryset: QuerySet[Ad] = filter_ads(self.queryset, request.GET)
 
         return super().get(request, *args, **kwargs)
 
+    def list(self, request, *args: Any, **kwargs: Any) -> Response:
+        """
+        The list function overrides the method of the parent class. If the facets query parameter is set,
+        adds to the response the counts of the matching ads by categories, by locations and by price ranges.
+        Returns a Response object.
+        """
+        response: Response = super().list(request, *args, **kwargs)
+        if facets_requested(request.query_params):
+            response.data["facets"] = get_facets(Ad.objects.filter(is_published=True), request.query_params)
+
+        return response
+
+
+class AdsListAsyncView(AsyncListView):
+    """
+    The AdsListAsyncView class inherits from the AsyncListView class and is an asynchronous class-based view
+    for processing requests by the GET method at the address '/async/ad/'. Displays the same filtered, cached
+    pages of the published ads as the AdsListView class with the page number pagination.
+    """
+    queryset: QuerySet[Ad] = AdsListView.queryset
+    serializer_class: ModelSerializer = AdListSerializer
+
+    async def get(self, request, *args: Any, **kwargs: Any) -> HttpResponse:
+        """
+        The get function is intended for processing GET requests at the address '/async/ad/'. Accepts the request
+        object and any other positional and named parameters as arguments. Returns a JsonResponse object
+        with the cached page of the ads if present, otherwise loads the page and the requested facets
+        and caches them. The keyset pagination is served only by the synchronous view.
+        """
+        if OptionalCursorPagination().is_cursor_mode(request):
+            raise ValidationError({"pagination": "The keyset pagination is served at the address '/ad/'."})
+
+        key, data = await alookup(request)
+        if data is not None:
+            response: HttpResponse = self.render(data)
+            response["X-Cache"] = "HIT"
+            return response
+
+        data = await self.paginate(request, filter_ads(self.get_queryset(), request.GET))
+        if facets_requested(request.GET):
+            data["facets"] = await sync_to_async(get_facets)(Ad.objects.filter(is_published=True), request.GET)
+        await astore(key, data)
+
+        response = self.render(data)
+        response["X-Cache"] = "MISS"
+        return response
+
 
-class AdDetailView(RetrieveAPIView):
+class AdsListCacheStatsView(APIView):
+    """
+    The AdsListCacheStatsView class inherits from the APIView class from the rest_framework views module and is
+    a class-based view for processing requests with GET methods at the address '/ad/cache/stats/'.
+    Displays the counters of hits and misses of the ad list cache.
+    """
+    def get(self, request, *args: Any, **kwargs: Any) -> Response:
+        """
+        The get function is intended for processing GET requests at the address '/ad/cache/stats/'.
+        Returns a Response object with the numbers of hits and misses.
+        """
+        return Response(get_stats())
+
+
+class AdsExportView(APIView):
+    """
+    The AdsExportView class inherits from the APIView class from the rest_framework views module and is
+    a class-based view for processing requests with GET methods at the address '/ad/export/'.
+    Streams all the published ads matching the filters of the ad list in NDJSON or CSV format, chosen by
+    the export_format query parameter.
+    """
+    def get(self, request, *args: Any, **kwargs: Any) -> StreamingHttpResponse:
+        """
+        The get function is intended for processing GET requests at the address '/ad/export/'.
+        Accepts the request object and any other positional and named parameters as arguments.
+        Returns a StreamingHttpResponse object producing the document row by row.
+        """
+        export_format: str = request.query_params.get("export_format", "ndjson")
+        if export_format not in EXPORTERS:
+            raise ValidationError({"export_format": f"Supported formats: {', '.join(EXPORTERS)}."})
+
+        queryset: QuerySet[Ad] = filter_ads(Ad.objects.filter(is_published=True), request.query_params)
+        response: StreamingHttpResponse = StreamingHttpResponse(
+            EXPORTERS[export_format](queryset),
+            content_type=CONTENT_TYPES[export_format]
+        )
+        response["Content-Disposition"] = f'attachment; filename="ads.{export_format}"'
+        return response
+
+
+class AdDetailView(ConditionalRetrieveMixin, SparseFieldsMixin, RetrieveAPIView):
     """
     The AdDetailView class inherits from the RetrieveAPIView class from the rest_framework generic module and is
     a class-based view for processing requests with GET methods at the address '/ad/<int: pk>'.
-    The endpoint is available only to authenticated users.
+    The endpoint is available only to authenticated users. Answers the conditional requests of an unchanged ad,
+    its author and category with the status 304.
     """
     queryset: QuerySet[Ad] = Ad.objects.all()
     serializer_class: ModelSerializer = AdDetailSerializer
     permission_classes = [IsAuthenticated]
+    conditional_aggregates: Dict[str, Aggregate] = {
+        "updated_at": Max("updated_at"),
+        "author_updated_at": Max("author__updated_at"),
+        "category_updated_at": Max("category__updated_at"),
+    }
+
+
+class AdDetailAsyncView(AsyncRetrieveView):
+    """
+    The AdDetailAsyncView class inherits from the AsyncRetrieveView class and is an asynchronous class-based view
+    for processing requests with GET methods at the address '/async/ad/<int: pk>/'. Displays the same data
+    and validators as the AdDetailView class. The endpoint is available only to authenticated users.
+    """
+    queryset: QuerySet[Ad] = Ad.objects.all()
+    serializer_class: ModelSerializer = AdDetailSerializer
+    permission_classes = [IsAuthenticated]
+    conditional_aggregates: Dict[str, Aggregate] = AdDetailView.conditional_aggregates
+    category_snapshot: Optional[CategorySnapshot] = None
+
+    async def get(self, request, pk: int, *args: Any, **kwargs: Any) -> HttpResponse:
+        """
+        The get function overrides the method of the parent class. Loads the snapshot of the categories
+        displayed by the serializer in a thread before calling the method of the parent class.
+        """
+        self.category_snapshot = await aget_snapshot()
+        return await super().get(request, pk, *args, **kwargs)
+
+    def get_serializer_context(self) -> Dict[str, Any]:
+        """
+        The get_serializer_context function overrides the method of the parent class. Adds the loaded snapshot
+        of the categories to the context of the serializer.
+        """
+        context: Dict[str, Any] = super().get_serializer_context()
+        context[SNAPSHOT_CONTEXT_KEY] = self.category_snapshot
+        return context
 
 
 class AdCreateView(CreateAPIView):
@@ -80,19 +206,52 @@ class AdCreateView(CreateAPIView):
     serializer_class: ModelSerializer = AdCreateSerializer
 
 
-class AdUpdateView(UpdateAPIView):
+class AdBulkView(APIView):
+    """
+    The AdBulkView class inherits from the APIView class from the rest_framework views module and is
+    a class-based view for processing requests with POST methods at the address '/ad/bulk/'.
+    Creates the ads without an id and updates the ads with an id in a single transaction.
+    The endpoint is available only to authenticated users, the ads are updated only by their creators
+    and users with the role of administrator or moderator.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args: Any, **kwargs: Any) -> Response:
+        """
+        The post function is intended for processing POST requests at the address '/ad/bulk/'. Accepts the request
+        object with a list of ads and any other positional and named parameters as arguments. Returns a Response
+        object with the saved ads, or with the errors by items if any of the ads is invalid, in which case
+        nothing is saved.
+        """
+        serializers, errors = validate_items(request, self, request.data)
+        if any(errors):
+            return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(save_items(serializers), status=status.HTTP_201_CREATED)
+
+
+class AdUpdateView(GuardedUpdateMixin, UpdateAPIView):
     """
     The AdUpdateView class inherits from the UpdateAPIView class from the rest_framework generic module and is
     a class-based view for processing requests with PATCH methods at the address '/ad/<int:pk>/update/'.
     The endpoint is available only to the creator of the ad and authorized users with the role
-    of administrator or moderator.
+    of administrator or moderator. The changes of the image and the category are saved through the model,
+    whose signals process the image and invalidate the cached lists of both categories.
     """
     queryset: QuerySet[Ad] = Ad.objects.all()
     serializer_class: ModelSerializer = AdUpdateSerializer
     permission_classes = [AdEditPermission]
+    guarded_update_fields: Tuple[str, ...] = ("name", "price", "description", "is_published", "author")
 
+    def perform_guarded_update(self, instance: Ad) -> None:
+        """
+        The perform_guarded_update function overrides the method of the parent class. Invalidates the cached
+        ad list responses of the category of the updated ad. Returns None.
+        """
+        invalidate_categories([instance.category_id])
 
-class AdDeleteView(DestroyAPIView):
+
+class AdDeleteView(GuardedDestroyMixin, DestroyAPIView):
     """
     The AdDeleteView class inherits from the DestroyAPIView class from the rest_framework generic module and is
     a class-based view for processing requests with DELETE methods at the address '/ad/int:pk>/delete/'.
@@ -102,3 +261,39 @@ class AdDeleteView(DestroyAPIView):
     queryset: QuerySet[Ad] = Ad.objects.all()
     serializer_class: ModelSerializer = AdDeleteSerializer
     permission_classes = [AdEditPermission]
+
+
+class AdMediaView(APIView):
+    """
+    The AdMediaView class inherits from the APIView class from the rest_framework views module and is
+    a class-based view for processing requests with GET methods at the address '/media/<path>'.
+    Serves the images of the ads and their variants to the users allowed to view the ads, handing the transfer
+    to the front server when it is configured.
+    """
+    permission_classes = [AdMediaPermission]
+
+    def perform_content_negotiation(self, request, force: bool = False) -> Any:
+        """
+        The perform_content_negotiation function overrides the method of the parent class, so the requests
+        accepting only images are not rejected.
+        """
+        return super().perform_content_negotiation(request, force=True)
+
+    def get(self, request, path: str, *args: Any, **kwargs: Any) -> HttpResponse:
+        """
+        The get function is intended for processing GET requests at the address '/media/<path>'. Accepts the request
+        object and the name of the file in the storage. Returns the response with the file. If the file does not
+        belong to an ad or does not exist, raises a NotFound exception from the rest_framework.exceptions module.
+        """
+        ad: Optional[Ad] = Ad.objects.filter(media_lookup(path)).only(
+            "id", "author_id", "is_published", "image"
+        ).first()
+        if ad is None:
+            raise NotFound()
+        self.check_object_permissions(request, ad)
+
+        storage: Storage = ad.image.storage if ad.image.name == path else default_storage
+        try:
+            return serve_media(request, storage, path)
+        except FileNotFoundError:
+            raise NotFound()
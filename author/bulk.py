@@ -0,0 +1,105 @@
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from django.db import IntegrityError, connection, transaction
+from rest_framework.exceptions import ValidationError
+
+from author.locations import get_location, invalidate_locations, is_stale_location, normalize_location_name, \
+    resolve_locations
+from author.models import User
+from author.passwords import hash_passwords
+from author.serializers import UserImportSerializer
+
+UNIQUE_MESSAGES: Dict[str, str] = {
+    "username": "A user with that username already exists.",
+    "email": "A user with this email already exists.",
+}
+
+
+def check_unique(serializers: List[UserImportSerializer], errors: List[Dict[str, Any]]) -> None:
+    """
+    The check_unique function takes as arguments the list of the serializers of the imported users and the list
+    of their errors. Checks the usernames and the emails of the valid users against the stored users with one
+    query per field and against the preceding users of the list, adding the errors of the repeated values.
+    Returns None.
+    """
+    valid: List[Tuple[int, UserImportSerializer]] = [
+        (index, serializer) for index, serializer in enumerate(serializers) if not errors[index]
+    ]
+    for field, message in UNIQUE_MESSAGES.items():
+        values: Set[str] = {serializer.validated_data[field] for _, serializer in valid}
+        seen: Set[str] = set(
+            User.objects.filter(**{f"{field}__in": values}).values_list(field, flat=True)
+        ) if values else set()
+        for index, serializer in valid:
+            value: str = serializer.validated_data[field]
+            if value in seen:
+                errors[index].setdefault(field, []).append(message)
+            seen.add(value)
+
+
+def validate_users(items: Any, max_items: Optional[int] = None) -> Tuple[List[UserImportSerializer],
+                                                                         List[Dict[str, Any]]]:
+    """
+    The validate_users function takes as arguments the list of the imported users and the largest allowed number
+    of them. Validates every user with the serializer of the import and checks the uniqueness of the usernames
+    and the emails of all the users at once. Returns a tuple of the list of serializers and the list of errors
+    by users, empty for the valid ones.
+    """
+    if not isinstance(items, list) or not items:
+        raise ValidationError({"non_field_errors": ["Expected a non-empty list of users."]})
+    if max_items is not None and len(items) > max_items:
+        raise ValidationError({"non_field_errors": [f"At most {max_items} users per request."]})
+    if not all(isinstance(item, dict) for item in items):
+        raise ValidationError({"non_field_errors": ["Every user must be an object."]})
+
+    serializers: List[UserImportSerializer] = [UserImportSerializer(data=item) for item in items]
+    errors: List[Dict[str, Any]] = [
+        {} if serializer.is_valid() else dict(serializer.errors) for serializer in serializers
+    ]
+    check_unique(serializers, errors)
+    return serializers, errors
+
+
+def insert_users(serializers: List[UserImportSerializer], passwords: List[str], names: List[str],
+                 use_cache: bool) -> None:
+    """
+    The insert_users function takes as arguments the list of the validated serializers of the imported users,
+    the list of their hashed passwords, the names of their locations and the flag of the use of the locations
+    resolved by the process. Resolves the locations with one query and inserts the users with one bulk_create
+    in a transaction, checking the deferred foreign keys before its end. Returns None.
+    """
+    with transaction.atomic():
+        locations: Dict[str, Tuple[int, str]] = resolve_locations(names, use_cache=use_cache)
+        users: List[User] = []
+        for serializer, password in zip(serializers, passwords):
+            values: Dict[str, Any] = dict(serializer.validated_data, password=password)
+            if "location" in values:
+                values["location"] = get_location(locations[normalize_location_name(values["location"])])
+            serializer.instance = User(**values)
+            users.append(serializer.instance)
+        User.objects.bulk_create(users)
+        connection.check_constraints(table_names=[User._meta.db_table])
+
+
+def save_users(serializers: List[UserImportSerializer]) -> List[Dict[str, Any]]:
+    """
+    The save_users function takes as an argument the list of the validated serializers of the imported users.
+    Hashes their passwords with the pool of worker processes, then resolves all their locations with one query
+    and inserts the users with one bulk_create. If a location remembered by the process has been deleted
+    by another process, inserts the users again with the locations resolved from the database. Returns the list
+    of the representations of the created users in the order of the serializers.
+    """
+    names: List[str] = [
+        serializer.validated_data["location"] for serializer in serializers if "location" in serializer.validated_data
+    ]
+    passwords: List[str] = hash_passwords([serializer.validated_data["password"] for serializer in serializers])
+
+    try:
+        insert_users(serializers, passwords, names, use_cache=True)
+    except IntegrityError as error:
+        if not is_stale_location(error):
+            raise
+        invalidate_locations()
+        insert_users(serializers, passwords, names, use_cache=False)
+
+    return [serializer.data for serializer in serializers]
@@ -0,0 +1,200 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches, BaseCache
+from django.db import connection, transaction, IntegrityError
+
+from author.models import Location
+
+VERSION_KEY: str = "locations:version"
+FOREIGN_KEY_VIOLATION: str = "23503"
+
+_resolved: "OrderedDict[str, Tuple[int, str]]" = OrderedDict()
+_version: Optional[int] = None
+_lock: threading.Lock = threading.Lock()
+
+
+def normalize_location_name(name: str) -> str:
+    """
+    The normalize_location_name function takes as an argument the name of a location. Returns the name with
+    the whitespace collapsed and the case folded, under which the location is stored once.
+    """
+    return " ".join(name.split()).casefold()
+
+
+def get_cache() -> BaseCache:
+    """
+    The get_cache function returns the cache backend storing the version of the locations, configured
+    by the LOCATION_CACHE_ALIAS setting. The backend must be shared by all the processes serving the application.
+    """
+    return caches[settings.LOCATION_CACHE_ALIAS]
+
+
+def get_version() -> int:
+    """
+    The get_version function returns the current version of the locations. A missing version is started
+    from the current time, so the names resolved before an eviction of the version are never used again.
+    """
+    cache: BaseCache = get_cache()
+    version: Optional[int] = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def invalidate_locations() -> None:
+    """
+    The invalidate_locations function replaces the version of the locations in the shared cache with a new one,
+    so every process forgets the names it has resolved. Returns None.
+    """
+    get_cache().set(VERSION_KEY, time.time_ns(), timeout=None)
+    with _lock:
+        _resolved.clear()
+
+
+def get_resolved(normalized_name: str) -> Optional[Tuple[int, str]]:
+    """
+    The get_resolved function takes as an argument a normalized name of a location. Returns a tuple
+    of the identifier and the name of the location if the name has been resolved by the process
+    since the last change of the locations, otherwise None.
+    """
+    global _version
+    version: int = get_version()
+    with _lock:
+        if version != _version:
+            _resolved.clear()
+            _version = version
+            return None
+        location: Optional[Tuple[int, str]] = _resolved.get(normalized_name)
+        if location is not None:
+            _resolved.move_to_end(normalized_name)
+        return location
+
+
+def remember(normalized_name: str, location: Tuple[int, str]) -> Tuple[int, str]:
+    """
+    The remember function takes as arguments a normalized name of a location and a tuple of its identifier
+    and name. Stores them in the cache of the process, dropping the least recently used names beyond
+    the LOCATION_CACHE_SIZE setting. Returns the tuple.
+    """
+    with _lock:
+        _resolved[normalized_name] = location
+        _resolved.move_to_end(normalized_name)
+        while len(_resolved) > settings.LOCATION_CACHE_SIZE:
+            _resolved.popitem(last=False)
+    return location
+
+
+def remember_on_commit(normalized_name: str, location: Tuple[int, str]) -> Tuple[int, str]:
+    """
+    The remember_on_commit function takes as arguments a normalized name of a location and a tuple of its
+    identifier and name. Stores them in the cache of the process after the current transaction is committed,
+    so a location inserted by a rolled back transaction is never remembered. Returns the tuple.
+    """
+    transaction.on_commit(lambda: remember(normalized_name, location))
+    return location
+
+
+def find_location(name: str) -> Optional[Tuple[int, str]]:
+    """
+    The find_location function takes as an argument the name of a location. Returns a tuple of the identifier
+    and the name of the stored location with the same normalized name, or None if there is none.
+    """
+    normalized_name: str = normalize_location_name(name)
+    location: Optional[Tuple[int, str]] = get_resolved(normalized_name)
+    if location is not None:
+        return location
+
+    row: Optional[Tuple[int, str]] = Location.objects.filter(
+        normalized_name=normalized_name
+    ).values_list("id", "name").first()
+    return remember_on_commit(normalized_name, row) if row is not None else None
+
+
+def resolve_location(name: str, use_cache: bool = True) -> Tuple[int, str]:
+    """
+    The resolve_location function takes as arguments the name of a location and the flag of the use of the names
+    resolved by the process. Returns a tuple of the identifier and the name of the stored location with the same
+    normalized name, inserting the location if there is none with a single INSERT ... ON CONFLICT statement,
+    so the concurrent requests never create duplicates.
+    """
+    normalized_name: str = normalize_location_name(name)
+    location: Optional[Tuple[int, str]] = get_resolved(normalized_name) if use_cache else None
+    if location is not None:
+        return location
+
+    quote_name = connection.ops.quote_name
+    table: str = quote_name(Location._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} ({quote_name('name')}, {quote_name('normalized_name')}) VALUES (%s, %s) "
+            f"ON CONFLICT ({quote_name('normalized_name')}) "
+            f"DO UPDATE SET {quote_name('normalized_name')} = EXCLUDED.{quote_name('normalized_name')} "
+            f"RETURNING {quote_name('id')}, {quote_name('name')}",
+            [" ".join(name.split()), normalized_name]
+        )
+        row: Tuple[int, str] = cursor.fetchone()
+    return remember_on_commit(normalized_name, (row[0], row[1]))
+
+
+def resolve_locations(names: Iterable[str], use_cache: bool = True) -> Dict[str, Tuple[int, str]]:
+    """
+    The resolve_locations function takes as arguments the names of the locations and the flag of the use
+    of the names resolved by the process. Returns a dictionary of the tuples of the identifiers and the names
+    of the stored locations by the normalized names. The names not resolved by the process yet are inserted,
+    or found, with a single INSERT ... ON CONFLICT statement for all of them.
+    """
+    locations: Dict[str, Tuple[int, str]] = {}
+    missing: Dict[str, str] = {}
+    for name in names:
+        normalized_name: str = normalize_location_name(name)
+        if normalized_name in locations or normalized_name in missing:
+            continue
+        location: Optional[Tuple[int, str]] = get_resolved(normalized_name) if use_cache else None
+        if location is not None:
+            locations[normalized_name] = location
+        else:
+            missing[normalized_name] = " ".join(name.split())
+    if not missing:
+        return locations
+
+    quote_name = connection.ops.quote_name
+    table: str = quote_name(Location._meta.db_table)
+    params: List[str] = []
+    for normalized_name, name in missing.items():
+        params.extend([name, normalized_name])
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} ({quote_name('name')}, {quote_name('normalized_name')}) "
+            f"VALUES {', '.join(['(%s, %s)'] * len(missing))} "
+            f"ON CONFLICT ({quote_name('normalized_name')}) "
+            f"DO UPDATE SET {quote_name('normalized_name')} = EXCLUDED.{quote_name('normalized_name')} "
+            f"RETURNING {quote_name('id')}, {quote_name('name')}, {quote_name('normalized_name')}",
+            params
+        )
+        for pk, name, normalized_name in cursor.fetchall():
+            locations[normalized_name] = remember_on_commit(normalized_name, (pk, name))
+    return locations
+
+
+def get_location(location: Tuple[int, str]) -> Location:
+    """
+    The get_location function takes as an argument a tuple of the identifier and the name of a stored location.
+    Returns the location built from them without loading it.
+    """
+    instance: Location = Location(pk=location[0], name=location[1])
+    instance._state.adding = False
+    return instance
+
+
+def is_stale_location(error: IntegrityError) -> bool:
+    """
+    The is_stale_location function takes as an argument an IntegrityError exception raised by saving the users.
+    Returns True if a saved user references a missing location, which happens when the location remembered
+    by the process has been deleted by another one, otherwise False.
+    """
+    return getattr(error.__cause__, "pgcode", None) == FOREIGN_KEY_VIOLATION
@@ -0,0 +1,76 @@
+import csv
+import json
+import os
+from itertools import islice
+from typing import Any, Dict, Iterator, List
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser, CommandError
+
+from author.bulk import save_users, validate_users
+from author.serializers import UserImportSerializer
+
+
+class Command(BaseCommand):
+    """
+    The Command class inherits from the BaseCommand class from the django management module.
+    Imports the users from a JSON or CSV file in chunks, validating every user by the rules of the user creation,
+    hashing the passwords in parallel and inserting every chunk with one query.
+    """
+    help: str = "Imports the users from a JSON list or a CSV file with the fields of the user creation."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        The add_arguments function overrides the method of the parent class and declares the options
+        of the command: the path of the file and the size of a chunk.
+        """
+        parser.add_argument("path", help="The path of a .json file with a list of users or of a .csv file.")
+        parser.add_argument("--chunk-size", type=int, default=settings.USERS_IMPORT_CHUNK_SIZE,
+                            help="The number of the users validated and inserted together.")
+
+    def read_users(self, path: str) -> Iterator[Dict[str, Any]]:
+        """
+        The read_users function takes as an argument the path of the file. Returns an iterator of the users
+        in it. The empty values of the CSV file are left out, as the missing fields of a request.
+        """
+        extension: str = os.path.splitext(path)[1].lower()
+        if extension == ".json":
+            with open(path, encoding="utf-8") as file:
+                yield from json.load(file)
+        elif extension == ".csv":
+            with open(path, encoding="utf-8", newline="") as file:
+                for row in csv.DictReader(file):
+                    yield {name.strip(): value for name, value in row.items() if value != ""}
+        else:
+            raise CommandError(f"Unknown format of {path}, expected a .json or .csv file.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """
+        The handle function overrides the method of the parent class. Validates and saves the users chunk by chunk,
+        skipping the invalid ones and reporting their errors. Reports the number of the imported users.
+        """
+        users: Iterator[Dict[str, Any]] = self.read_users(options["path"])
+        imported: int = 0
+        skipped: int = 0
+        line: int = 1
+
+        while True:
+            chunk: List[Dict[str, Any]] = list(islice(users, options["chunk_size"]))
+            if not chunk:
+                break
+            serializers, errors = validate_users(chunk)
+            valid: List[UserImportSerializer] = []
+            for number, (serializer, error) in enumerate(zip(serializers, errors), start=line):
+                if error:
+                    self.stderr.write(f"User {number}: {json.dumps(error, ensure_ascii=False)}")
+                else:
+                    valid.append(serializer)
+            if valid:
+                save_users(valid)
+
+            imported += len(valid)
+            skipped += len(chunk) - len(valid)
+            line += len(chunk)
+            self.stdout.write(f"{imported} users imported, {skipped} skipped")
+
+        self.stdout.write(self.style.SUCCESS(f"Imported {imported} users, {skipped} invalid users skipped."))
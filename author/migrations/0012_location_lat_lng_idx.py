@@ -0,0 +1,17 @@
+# Generated by Django 4.1.7 on 2026-10-17 18:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('author', '0011_alter_user_location'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='location',
+            index=models.Index(fields=['lat', 'lng'], name='location_lat_lng_idx'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 4.1.7 on 2026-10-17 21:05
+
+from collections import defaultdict
+
+from django.db import migrations, models
+
+
+def normalize(name):
+    return " ".join(name.split()).casefold()
+
+
+def merge_locations(apps, schema_editor):
+    """
+    Fills the normalized names and merges the locations sharing one into the location with the smallest id.
+    """
+    Location = apps.get_model("author", "Location")
+    User = apps.get_model("author", "User")
+
+    groups = defaultdict(list)
+    for location in Location.objects.order_by("id"):
+        groups[normalize(location.name)].append(location)
+
+    for normalized_name, locations in groups.items():
+        kept, duplicates = locations[0], [location.id for location in locations[1:]]
+        if duplicates:
+            User.objects.filter(location_id__in=duplicates).update(location_id=kept.id)
+            Location.objects.filter(id__in=duplicates).delete()
+        Location.objects.filter(id=kept.id).update(normalized_name=normalized_name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('author', '0013_user_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='location',
+            name='normalized_name',
+            field=models.CharField(editable=False, max_length=150, null=True),
+        ),
+        migrations.RunPython(merge_locations, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='location',
+            name='normalized_name',
+            field=models.CharField(editable=False, max_length=150, unique=True),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.1.7 on 2026-10-17 20:03
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+import django.db.models.functions.text
+
+TRIGRAM_INDEX = django.contrib.postgres.indexes.GinIndex(
+    django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'),
+    name='location_name_trgm_idx',
+)
+
+
+def create_trigram_index(apps, schema_editor):
+    """
+    The create_trigram_index function creates the pg_trgm extension and the trigram index of the names
+    of the locations, if the extension is installed on the database server. Without it the locations are searched
+    by name with a scan of their table.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.add_index(apps.get_model('author', 'Location'), TRIGRAM_INDEX)
+
+
+def drop_trigram_index(apps, schema_editor):
+    """
+    The drop_trigram_index function drops the trigram index of the names of the locations, if it was created.
+    """
+    schema_editor.execute(f'DROP INDEX IF EXISTS "{TRIGRAM_INDEX.name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('author', '0014_location_normalized_name'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(create_trigram_index, drop_trigram_index),
+            ],
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='location',
+                    index=TRIGRAM_INDEX,
+                ),
+            ],
+        ),
+    ]
@@ -1,7 +1,9 @@
 from typing import List, Tuple
 
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 from author.validators import validate_email
 
@@ -10,18 +12,29 @@ class Location(models.Model):
     """
     The Location class is an inheritor of the Model class from the models library. It is a data model contained
     in the ads database table. Contains a description of the types and constraints of the model fields.
+    The normalized_name field holds the name in the form compared by the location resolver and keeps
+    the names unique regardless of the case and the whitespace. It is three times as long as the name,
+    as folding the case may replace a character with up to three.
     """
     name = models.CharField(max_length=50, default='Не указана')
+    normalized_name = models.CharField(max_length=150, unique=True, editable=False)
     lat = models.DecimalField(max_digits=10, decimal_places=6, null=True)
     lng = models.DecimalField(max_digits=10, decimal_places=6, null=True)
 
     class Meta:
         """
         The Meta class is used to change the behavior of model fields,
-        such as verbose_name - a human-readable model name.
+        such as verbose_name - a human-readable model name
+        and indexes to declare the database indexes of the table.
+        The trigram index of the upper-cased names serves the case-insensitive search of the ads by a part
+        of the name of the location, the index of the coordinates serves the search of the ads near a point.
         """
         verbose_name = 'Локация'
         verbose_name_plural = 'Локации'
+        indexes = [
+            models.Index(fields=["lat", "lng"], name="location_lat_lng_idx"),
+            GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="location_name_trgm_idx"),
+        ]
 
     def __str__(self) -> str:
         """
@@ -46,6 +59,7 @@ class User(AbstractUser):
     birth_date = models.DateField(null=True)
     email = models.EmailField(unique=True, validators=[validate_email])
     location = models.ForeignKey(Location, on_delete=models.PROTECT, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         """
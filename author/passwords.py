@@ -0,0 +1,63 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import connections
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def setup_worker(settings_module: str) -> None:
+    """
+    The setup_worker function takes as an argument the name of the settings module of the project.
+    Is run by every worker process of the pool and configures django, so the hashers of the project
+    are available to the processes started without copying the parent, then closes the database connections,
+    which the workers never use. Returns None.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    django.setup()
+    connections.close_all()
+
+
+def get_workers() -> int:
+    """
+    The get_workers function returns the number of the worker processes hashing the passwords, set by
+    the PASSWORD_HASH_WORKERS setting or equal to the number of the processors if the setting is None.
+    """
+    return settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """
+    The get_executor function returns the pool of worker processes hashing the passwords shared by the requests
+    of the process, creating it on the first call with the number of workers returned by the get_workers function.
+    The workers are spawned as fresh interpreters rather than forked, since a fork of a web server worker
+    would copy its database connections, its threads and their locks.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=get_workers(),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=setup_worker,
+            initargs=(os.environ.get("DJANGO_SETTINGS_MODULE", "home_work.settings"),),
+        )
+    return _executor
+
+
+def hash_passwords(passwords: List[str]) -> List[str]:
+    """
+    The hash_passwords function takes as an argument the list of the raw passwords. Returns the list of their
+    hashes in the same order. The passwords are hashed by the pool of worker processes, so the hashing uses
+    all the processors instead of one, unless there is a single worker or a single password.
+    """
+    workers: int = get_workers()
+    if workers < 2 or len(passwords) < 2:
+        return [make_password(password) for password in passwords]
+
+    chunksize: int = max(1, len(passwords) // (workers * 4))
+    return list(get_executor().map(make_password, passwords, chunksize=chunksize))
@@ -0,0 +1,17 @@
+from rest_framework.permissions import BasePermission
+
+
+class UserImportPermission(BasePermission):
+    """
+    The UserImportPermission class inherits from the BasePermission class from the permissions module
+    of the rest_framework library. Controls access to the import of the users: the users are imported
+    only by the users with the role of administrator.
+    """
+    message: str = "Only administrators are allowed to import users."
+
+    def has_permission(self, request, view) -> bool:
+        """
+        The has_permission function overrides the method of the base class. Accepts as arguments a request object
+        and a view object. Returns True if the user has the role of administrator, otherwise False.
+        """
+        return getattr(request.user, "role", None) == "admin"
@@ -1,13 +1,86 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 
+from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.db import IntegrityError, connection, transaction
 from django.db.models import Model
 from rest_framework import serializers
 
+from author.locations import find_location, get_location, invalidate_locations, is_stale_location, \
+    resolve_location
 from author.models import User, Location
-from author.validators import check_age_new_user
+from author.validators import check_age_new_user, validate_email
+from home_work.sparse_fields import SparseFieldsSerializerMixin
 
 
-class UserListSerializer(serializers.ModelSerializer):
+class LocationNameField(serializers.SlugRelatedField):
+    """
+    The LocationNameField class inherits from the SlugRelatedField class from the rest_framework serializers module.
+    Accepts the name of a location, or a list of its parts joined with commas, and resolves it with the location
+    resolver, which creates the missing location atomically and remembers the resolved names.
+    """
+    def clean_name(self, data: Any) -> str:
+        """
+        The clean_name function takes as an argument the name of the location or the list of its parts.
+        Returns the name, raising a ValidationError exception if it is blank or too long.
+        """
+        if isinstance(data, list):
+            data = ", ".join(str(part) for part in data)
+        if not isinstance(data, str) or not data.strip():
+            self.fail("invalid")
+        if len(" ".join(data.split())) > Location._meta.get_field("name").max_length:
+            self.fail("invalid")
+        return data
+
+    def to_internal_value(self, data: Any) -> Location:
+        """
+        The to_internal_value function overrides the method of the parent class. Accepts the name of the location
+        as an argument. Returns the location with the same normalized name, without loading it.
+        """
+        return get_location(resolve_location(self.clean_name(data)))
+
+
+class LocationNameImportField(LocationNameField):
+    """
+    The LocationNameImportField class inherits from the LocationNameField class. Only checks the name
+    of the location, which is resolved later together with the names of the other imported users.
+    """
+    def to_internal_value(self, data: Any) -> str:
+        """
+        The to_internal_value function overrides the method of the parent class. Accepts the name of the location
+        as an argument. Returns the checked name.
+        """
+        return self.clean_name(data)
+
+
+class LocationSaveMixin:
+    """
+    The LocationSaveMixin class is a mixin for the serializers saving the users with a LocationNameField.
+    If the location remembered by the process has been deleted by another process, saves the user again
+    with the location resolved from the database. The deferred foreign keys are checked right after saving,
+    so the missing location is found before the end of the transaction.
+    """
+    def save(self, **kwargs: Any) -> User:
+        """
+        The save function overrides the method of the parent class. Returns the saved user.
+        """
+        location: Optional[Location] = self.validated_data.get("location")
+        if location is None:
+            return super().save(**kwargs)
+
+        try:
+            with transaction.atomic():
+                user: User = super().save(**kwargs)
+                connection.check_constraints(table_names=[User._meta.db_table])
+                return user
+        except IntegrityError as error:
+            if not is_stale_location(error):
+                raise
+        invalidate_locations()
+        self.validated_data["location"] = get_location(resolve_location(location.name, use_cache=False))
+        return super().save(**kwargs)
+
+
+class UserListSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """
     The UserListSerializer class inherits from the serializer class.ModelSerializer is a class for convenient
     serialization and deserialization of objects of the User class when processing GET requests
@@ -21,13 +94,15 @@ class UserListSerializer(serializers.ModelSerializer):
     class Meta:
         """
         The Meta class is an internal service class of the serializer,
-        defines the necessary parameters for the serializer to function.
+        defines the necessary parameters for the serializer to function
+        and the relations to be joined when loading the serialized objects.
         """
         model: Model = User
         fields: List[str] = ["id", "username", "first_name", "last_name", "role", "age", "location"]
+        select_related: List[str] = ["location"]
 
 
-class UserDetailSerializer(serializers.ModelSerializer):
+class UserDetailSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """
     The UserDetailSerializer class inherits from the serializer class.ModelSerializer is a class for convenient
     serialization and deserialization of objects of the User class when processing GET requests
@@ -41,19 +116,21 @@ class UserDetailSerializer(serializers.ModelSerializer):
     class Meta:
         """
         The Meta class is an internal service class of the serializer,
-        defines the necessary parameters for the serializer to function.
+        defines the necessary parameters for the serializer to function
+        and the relations to be joined when loading the serialized objects.
         """
         model: Model = User
-        fields: str = '__all__'
+        exclude: List[str] = ["updated_at"]
+        select_related: List[str] = ["location"]
 
 
-class UserCreateSerializer(serializers.ModelSerializer):
+class UserCreateSerializer(LocationSaveMixin, serializers.ModelSerializer):
     """
     The UserCreateSerializer class inherits from the serializer class.ModelSerializer is a class for convenient
     serialization and deserialization of objects of the User class when processing POST requests
     at the address '/user/create/'. Overrides the value of the location field, for a comfortable display.
     """
-    location = serializers.SlugRelatedField(
+    location = LocationNameField(
         required=False,
         queryset=Location.objects.all(),
         slug_field="name"
@@ -69,21 +146,7 @@ class UserCreateSerializer(serializers.ModelSerializer):
         defines the necessary parameters for the serializer to function.
         """
         model: Model = User
-        fields: str = '__all__'
-
-    def is_valid(self, *, raise_exception=False):
-        """
-        The is_valid function overrides the method of the parent class. Accepts the request object
-        and any positional and named arguments as arguments. Adds functionality for converting incoming data
-        to a format supported by the model. Returns the method of the parent class.
-        """
-        if "location" in self.initial_data:
-            self._location = self.initial_data.pop("location")
-            if type(self._location) == list:
-                self._location = ", ".join(self._location)
-            location_object, _ = Location.objects.get_or_create(name=self._location)
-            self.initial_data["location"] = self._location
-        return super().is_valid(raise_exception=raise_exception)
+        exclude: List[str] = ["updated_at"]
 
     def create(self, validated_data) -> User:
         """
@@ -97,13 +160,45 @@ class UserCreateSerializer(serializers.ModelSerializer):
         return user
 
 
-class UserUpdateSerializer(serializers.ModelSerializer):
+class UserImportSerializer(serializers.ModelSerializer):
+    """
+    The UserImportSerializer class inherits from the serializer class.ModelSerializer is a class for convenient
+    serialization and deserialization of objects of the User class when processing POST requests
+    at the address '/user/bulk/' and the import_users command. Applies the rules of the user creation,
+    except the uniqueness of the username and the email, which is checked for all the imported users at once.
+    """
+    location = LocationNameImportField(
+        required=False,
+        queryset=Location.objects.all(),
+        slug_field="name"
+    )
+    birth_date = serializers.DateField(
+        required=True,
+        validators=[check_age_new_user]
+    )
+
+    class Meta:
+        """
+        The Meta class is an internal service class of the serializer,
+        defines the necessary parameters for the serializer to function.
+        """
+        model: Model = User
+        fields: List[str] = ["id", "username", "password", "first_name", "last_name", "email", "role", "age",
+                             "birth_date", "location"]
+        extra_kwargs: Dict[str, Dict[str, Any]] = {
+            "username": {"validators": [UnicodeUsernameValidator()]},
+            "email": {"validators": [validate_email]},
+            "password": {"write_only": True},
+        }
+
+
+class UserUpdateSerializer(LocationSaveMixin, serializers.ModelSerializer):
     """
     The UserUpdateSerializer class inherits from the serializer class.ModelSerializer is a class for convenient
     serialization and deserialization of objects of the User class when processing PATCH requests
     at the address '/user/<int: pk/update/'. Overrides the value of the location field, for a comfortable display.
     """
-    location = serializers.SlugRelatedField(
+    location = LocationNameField(
         required=False,
         queryset=Location.objects.all(),
         slug_field="name"
@@ -116,21 +211,7 @@ class UserUpdateSerializer(serializers.ModelSerializer):
         defines the necessary parameters for the serializer to function.
         """
         model: Model = User
-        fields: str = '__all__'
-
-    def is_valid(self, *, raise_exception=False):
-        """
-        The is_valid function overrides the method of the parent class. Accepts the request object
-        and any positional and named arguments as arguments. Adds functionality for converting incoming data
-        to a format supported by the model. Returns the method of the parent class.
-        """
-        if "location" in self.initial_data:
-            self._location = self.initial_data.pop("location")
-            if type(self._location) == list:
-                self._location = ", ".join(self._location)
-            location_object, _ = Location.objects.get_or_create(name=self._location)
-            self.initial_data["location"] = self._location
-        return super().is_valid(raise_exception=raise_exception)
+        exclude: List[str] = ["updated_at"]
 
 
 class UserDeleteSerializer(serializers.ModelSerializer):
@@ -160,4 +241,14 @@ class LocationSerializer(serializers.ModelSerializer):
         defines the necessary parameters for the serializer to function.
         """
         model: Model = Location
-        fields: str = '__all__'
+        exclude: List[str] = ["normalized_name"]
+
+    def validate_name(self, value: str) -> str:
+        """
+        The validate_name function takes as an argument the name of the location. Checks with the location resolver
+        that no other location has the same normalized name. Returns the name.
+        """
+        location = find_location(value)
+        if location is not None and (self.instance is None or location[0] != self.instance.pk):
+            raise serializers.ValidationError("A location with this name already exists.")
+        return value
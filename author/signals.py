@@ -0,0 +1,29 @@
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from author.locations import invalidate_locations, normalize_location_name
+from author.models import Location
+
+
+@receiver(pre_save, sender=Location)
+def normalize_name(sender: Any, instance: Location, **kwargs: Any) -> None:
+    """
+    The normalize_name function is a receiver of the pre_save signal of the Location model. Fills the normalized
+    name of the saved location from its name. Returns None.
+    """
+    instance.normalized_name = normalize_location_name(instance.name)
+
+
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_on_change(sender: Any, instance: Location, **kwargs: Any) -> None:
+    """
+    The invalidate_on_change function is a receiver of the post_save and post_delete signals of the Location model.
+    Makes every process forget the resolved names of the locations at once and once more after the transaction
+    is committed. Returns None.
+    """
+    invalidate_locations()
+    transaction.on_commit(invalidate_locations)
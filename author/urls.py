@@ -1,12 +1,13 @@
 from django.urls import path
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
-from author.views import UserDeleteView, UserUpdateView, UserDetailView, UserCreateView, UsersListView
+from author.views import UserBulkView, UserDeleteView, UserUpdateView, UserDetailView, UserCreateView, UsersListView
 
 
 urlpatterns = [
     path('', UsersListView.as_view()),
     path('create/', UserCreateView.as_view()),
+    path('bulk/', UserBulkView.as_view()),
     path('<int:pk>/', UserDetailView.as_view()),
     path('<int:pk>/update/', UserUpdateView.as_view()),
     path('<int:pk>/delete/', UserDeleteView.as_view()),
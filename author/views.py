@@ -1,31 +1,49 @@
 from typing import Dict, Any, List
 
-from django.db.models import QuerySet
+from django.conf import settings
+from django.db.models import QuerySet, Aggregate, Max
+from rest_framework import status
 from rest_framework.generics import CreateAPIView, ListAPIView, RetrieveAPIView, DestroyAPIView, UpdateAPIView
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
 from rest_framework.serializers import ModelSerializer
+from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 
+from author.bulk import save_users, validate_users
 from author.models import User, Location
+from author.permissions import UserImportPermission
 from author.serializers import UserCreateSerializer, LocationSerializer, UserListSerializer, UserDetailSerializer, \
     UserDeleteSerializer, UserUpdateSerializer
+from home_work.conditional import ConditionalRetrieveMixin
+from home_work.fast_serialization import FastListMixin
+from home_work.pagination import OptionalCursorPagination
+from home_work.sparse_fields import SparseFieldsMixin
 
 
-class UsersListView(ListAPIView):
+class UsersListView(SparseFieldsMixin, FastListMixin, ListAPIView):
     """
     The UserListView class inherits from the ListView class from the django generic module and is a class-based view
     for processing requests by GET methods at the address '/user/'.
     """
     queryset = User.objects.all()
     serializer_class: ModelSerializer = UserListSerializer
+    pagination_class: BasePagination = OptionalCursorPagination
+    fast_list: bool = True
 
 
-class UserDetailView(RetrieveAPIView):
+class UserDetailView(ConditionalRetrieveMixin, SparseFieldsMixin, RetrieveAPIView):
     """
     The UserDetailView class inherits from the DetailView class from the django generic module and is
     a class-based view for processing requests with GET methods at the address '/user/<int: pk>'.
+    Answers the conditional requests of an unchanged user with the status 304.
     """
     queryset = User.objects.all()
     serializer_class: ModelSerializer = UserDetailSerializer
+    conditional_aggregates: Dict[str, Aggregate] = {
+        "updated_at": Max("updated_at"),
+        "location": Max("location__name"),
+    }
 
 class UserCreateView(CreateAPIView):
     """
@@ -36,6 +54,29 @@ class UserCreateView(CreateAPIView):
     serializer_class: ModelSerializer = UserCreateSerializer
 
 
+class UserBulkView(APIView):
+    """
+    The UserBulkView class inherits from the APIView class from the rest_framework views module and is
+    a class-based view for processing requests with POST methods at the address '/user/bulk/'.
+    Creates the users in a single transaction, hashing their passwords in parallel.
+    The endpoint is available only to users with the role of administrator.
+    """
+    permission_classes = [UserImportPermission]
+
+    def post(self, request, *args: Any, **kwargs: Any) -> Response:
+        """
+        The post function is intended for processing POST requests at the address '/user/bulk/'. Accepts the request
+        object with a list of users and any other positional and named parameters as arguments. Returns a Response
+        object with the created users, or with the errors by items if any of the users is invalid, in which case
+        nothing is saved.
+        """
+        serializers, errors = validate_users(request.data, max_items=settings.USERS_BULK_MAX_ITEMS)
+        if any(errors):
+            return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(save_users(serializers), status=status.HTTP_201_CREATED)
+
+
 class UserUpdateView(UpdateAPIView):
     """
     The UserUpdateView class inherits from the UpdateView class from the django generic module and is
@@ -0,0 +1,199 @@
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches, BaseCache
+from django.db import connection, transaction
+
+from categories.models import Category
+
+VERSION_KEY: str = "categories:version"
+SNAPSHOT_CONTEXT_KEY: str = "category_snapshot"
+
+
+class CategorySnapshot:
+    """
+    The CategorySnapshot class holds all the categories loaded with one query together with the version
+    of the categories they were loaded at. Maps the identifiers to the categories and the names to the identifiers.
+    Is never changed after its creation, so it is shared by the threads without locking.
+    """
+    def __init__(self, version: int, rows: List[Tuple[Any, ...]]) -> None:
+        """
+        The __init__ function takes as arguments the version of the categories and the list of the tuples
+        of the values of the concrete fields of the categories ordered by identifier.
+        """
+        self.version: int = version
+        self.field_names: List[str] = [field.attname for field in Category._meta.concrete_fields]
+        self.rows: Dict[int, Tuple[Any, ...]] = {row[0]: row for row in rows}
+        self.names: Dict[int, str] = {row[0]: row[self.field_names.index("name")] for row in rows}
+        self.ids_by_name: Dict[str, Optional[int]] = {}
+        for pk, name in self.names.items():
+            self.ids_by_name[name] = None if name in self.ids_by_name else pk
+        updated_at: List[datetime] = [row[self.field_names.index("updated_at")] for row in rows]
+        self.updated_at: Optional[datetime] = max(updated_at) if updated_at else None
+
+    def get(self, pk: int) -> Optional[Category]:
+        """
+        The get function takes as an argument the identifier of a category. Returns a new instance of the category
+        built from the cached values, or None if there is no such category.
+        """
+        row: Optional[Tuple[Any, ...]] = self.rows.get(pk)
+        return Category.from_db(Category.objects.db, self.field_names, row) if row is not None else None
+
+    def values(self, field_names: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        The values function takes as an argument the names of the fields of the categories. Returns the list
+        of the dictionaries of the values of these fields of all the categories, as the values method
+        of the queryset does.
+        """
+        indexes: List[Tuple[str, int]] = [(name, self.field_names.index(name)) for name in field_names]
+        return [{name: row[index] for name, index in indexes} for row in self.rows.values()]
+
+
+_snapshot: Optional[CategorySnapshot] = None
+_lock: threading.Lock = threading.Lock()
+_local: threading.local = threading.local()
+
+
+def get_cache() -> BaseCache:
+    """
+    The get_cache function returns the cache backend storing the version of the categories, configured
+    by the CATEGORY_CACHE_ALIAS setting. The backend must be shared by all the processes serving the application,
+    otherwise the changes made by one process are never seen by the snapshots of the others.
+    """
+    return caches[settings.CATEGORY_CACHE_ALIAS]
+
+
+def get_pending_invalidations() -> Set[Callable[[], None]]:
+    """
+    The get_pending_invalidations function returns the set of the invalidations of the categories registered
+    by the current thread to be run after the commit of its transaction.
+    """
+    if not hasattr(_local, "pending"):
+        _local.pending = set()
+    return _local.pending
+
+
+def get_version() -> int:
+    """
+    The get_version function returns the current version of the categories. A missing version is started
+    from the current time, so a snapshot loaded before an eviction of the version is never used again.
+    """
+    cache: BaseCache = get_cache()
+    version: Optional[int] = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def invalidate_snapshot() -> None:
+    """
+    The invalidate_snapshot function replaces the version of the categories in the shared cache with a new one,
+    so every process reloads its snapshot on the next access. The version is set rather than incremented,
+    as the increments of the file and database backends are not atomic and two concurrent ones may produce
+    the same version. Returns None.
+    """
+    global _snapshot
+    get_cache().set(VERSION_KEY, time.time_ns(), timeout=None)
+    _snapshot = None
+
+
+def invalidate_on_commit() -> None:
+    """
+    The invalidate_on_commit function invalidates the snapshots of the categories after the current transaction
+    is committed, or at once outside of a transaction. Until then the categories read by the thread include
+    its uncommitted changes, so they are not shared with the other threads. Returns None.
+    """
+    pending: Set[Callable[[], None]] = get_pending_invalidations()
+
+    def invalidate() -> None:
+        pending.discard(invalidate)
+        invalidate_snapshot()
+
+    pending.add(invalidate)
+    transaction.on_commit(invalidate)
+
+
+def has_uncommitted_changes() -> bool:
+    """
+    The has_uncommitted_changes function returns True if the current transaction has changed the categories
+    and is neither committed nor rolled back, otherwise False. The invalidations of the rolled back transactions
+    and savepoints are dropped by django with the callbacks registered in them.
+    """
+    pending: Set[Callable[[], None]] = get_pending_invalidations()
+    if pending:
+        pending.intersection_update(entry[1] for entry in connection.run_on_commit)
+    return bool(pending)
+
+
+def load_snapshot(version: int) -> CategorySnapshot:
+    """
+    The load_snapshot function takes as an argument the version of the categories. Loads all the categories
+    with one query. Returns their snapshot.
+    """
+    field_names: List[str] = [field.attname for field in Category._meta.concrete_fields]
+    return CategorySnapshot(version, list(Category.objects.order_by("id").values_list(*field_names)))
+
+
+def get_snapshot() -> CategorySnapshot:
+    """
+    The get_snapshot function returns the snapshot of the categories of the current version, loading all
+    the categories with one query if the snapshot of the process is missing or outdated. Inside a transaction
+    that has changed the categories the snapshot is loaded for every call and kept out of the process,
+    so a rollback never leaves the uncommitted categories in it.
+    """
+    global _snapshot
+    version: int = get_version()
+    if has_uncommitted_changes():
+        return load_snapshot(version)
+    snapshot: Optional[CategorySnapshot] = _snapshot
+    if snapshot is not None and snapshot.version == version:
+        return snapshot
+
+    with _lock:
+        if _snapshot is None or _snapshot.version != version:
+            _snapshot = load_snapshot(version)
+        return _snapshot
+
+
+async def aget_snapshot() -> CategorySnapshot:
+    """
+    The aget_snapshot function is the asynchronous version of the get_snapshot function.
+    """
+    return await sync_to_async(get_snapshot)()
+
+
+def get_category_name(pk: Optional[int]) -> Optional[str]:
+    """
+    The get_category_name function takes as an argument the identifier of a category. Returns the name
+    of the category, or None if there is no such category.
+    """
+    return get_snapshot().names.get(pk)
+
+
+def get_categories_by_name(names: Iterable[str]) -> Dict[str, Category]:
+    """
+    The get_categories_by_name function takes as an argument the names of the categories. Returns a dictionary
+    of the categories by the names that belong to exactly one category.
+    """
+    snapshot: CategorySnapshot = get_snapshot()
+    categories: Dict[str, Category] = {}
+    for name in names:
+        pk: Optional[int] = snapshot.ids_by_name.get(name)
+        if pk is not None:
+            categories[name] = snapshot.get(pk)
+    return categories
+
+
+def get_list_aggregates() -> Dict[str, Any]:
+    """
+    The get_list_aggregates function returns a dictionary of the aggregates describing the state of all
+    the categories, equal to the ones computed by the database for the conditional requests of the category list.
+    """
+    snapshot: CategorySnapshot = get_snapshot()
+    return {"updated_at": snapshot.updated_at, "count": len(snapshot.rows)}
+
@@ -13,6 +13,7 @@ class Category(models.Model):
         unique=True,
         validators=[MinLengthValidator(5), MaxLengthValidator(10)],
         default='name')
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         """
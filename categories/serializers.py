@@ -1,9 +1,59 @@
+from typing import Any, List, Optional
+
 from django.db.models import Model
 from rest_framework import serializers
 
+from categories.cache import get_snapshot, CategorySnapshot, SNAPSHOT_CONTEXT_KEY
 from categories.models import Category
 
 
+class CategoryNameField(serializers.RelatedField):
+    """
+    The CategoryNameField class inherits from the RelatedField class from the rest_framework serializers module.
+    Is bound to the category_id field of the model. Displays the name of the category and accepts the name
+    of a category as input, resolving both through the process-wide cache of the categories instead
+    of the database, or through the snapshot of the categories passed in the context of the serializer.
+    """
+    default_error_messages = serializers.SlugRelatedField.default_error_messages
+
+    def __init__(self, **kwargs: Any) -> None:
+        """
+        The __init__ function overrides the method of the parent class and binds the field to the identifier
+        of the category.
+        """
+        kwargs.setdefault("source", "category_id")
+        super().__init__(**kwargs)
+
+    def get_snapshot(self) -> CategorySnapshot:
+        """
+        The get_snapshot function returns the snapshot of the categories from the context of the serializer
+        if present, otherwise from the cache.
+        """
+        return self.context.get(SNAPSHOT_CONTEXT_KEY) or get_snapshot()
+
+    def to_internal_value(self, data: Any) -> int:
+        """
+        The to_internal_value function overrides the method of the parent class. Accepts the name
+        of the category as an argument. Returns the identifier of the category.
+        """
+        if not isinstance(data, str):
+            self.fail("invalid")
+        snapshot: CategorySnapshot = self.get_snapshot()
+        if data not in snapshot.ids_by_name:
+            self.fail("does_not_exist", slug_name="name", value=data)
+        pk: Optional[int] = snapshot.ids_by_name[data]
+        if pk is None:
+            self.fail("invalid")
+        return pk
+
+    def to_representation(self, value: int) -> Optional[str]:
+        """
+        The to_representation function overrides the method of the parent class. Accepts the identifier
+        of the category as an argument. Returns the name of the category.
+        """
+        return self.get_snapshot().names.get(value)
+
+
 class CategorySerializer(serializers.ModelSerializer):
     """
     The CategorySerializer class inherits from the serializer class.ModelSerializer is a class for convenient
@@ -16,4 +66,4 @@ class CategorySerializer(serializers.ModelSerializer):
         defines the necessary parameters for the serializer to function.
         """
         model: Model = Category
-        fields: str = '__all__'
+        exclude: List[str] = ["updated_at"]
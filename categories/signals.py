@@ -0,0 +1,18 @@
+from typing import Any
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from categories.cache import invalidate_on_commit
+from categories.models import Category
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_on_change(sender: Any, instance: Category, **kwargs: Any) -> None:
+    """
+    The invalidate_on_change function is a receiver of the post_save and post_delete signals of the Category model.
+    Bumps the version of the cached categories after the transaction is committed, so no process keeps
+    the categories loaded before the commit and none of them loads the uncommitted ones. Returns None.
+    """
+    invalidate_on_commit()
@@ -1,15 +1,42 @@
-from django.db.models import QuerySet
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from django.db.models import QuerySet, Aggregate, Max, Count
 from rest_framework.serializers import ModelSerializer
 from rest_framework.viewsets import ModelViewSet
 
+from categories.cache import get_list_aggregates, get_snapshot
 from categories.models import Category
 from categories.serializers import CategorySerializer
+from home_work.conditional import ConditionalRetrieveMixin, ConditionalListMixin, get_variant, \
+    make_validators
 
 
-class CategoryViewSet(ModelViewSet):
+class CategoryViewSet(ConditionalRetrieveMixin, ConditionalListMixin, ModelViewSet):
     """
     The CategoryViewSet class inherits from the ModelViewSet class, designed to handle all requests
-    defined by CRUD methods at the address '/cat/'.
+    defined by CRUD methods at the address '/cat/'. Answers the conditional requests of an unchanged category
+    or list of categories with the status 304. The list of the categories and its validators are served
+    from the process-wide cache of the categories.
     """
     queryset: QuerySet[Category] = Category.objects.all()
     serializer_class: ModelSerializer = CategorySerializer
+    conditional_list_aggregates: Dict[str, Aggregate] = {
+        "updated_at": Max("updated_at"),
+        "count": Count("id"),
+    }
+
+    def get_queryset(self) -> Union[QuerySet[Category], List[Dict[str, Any]]]:
+        """
+        The get_queryset function overrides the method of the parent class. Returns the list of the values
+        of the displayed fields of the cached categories for the list action, otherwise the queryset of the view.
+        """
+        if self.action == "list":
+            return get_snapshot().values(self.get_serializer().fields)
+        return super().get_queryset()
+
+    def get_list_validators(self) -> Optional[Tuple[str, Optional[int]]]:
+        """
+        The get_list_validators function overrides the method of the parent class. Returns the validators
+        of the list computed from the cached categories.
+        """
+        return make_validators(get_list_aggregates(), get_variant(self.request))
@@ -0,0 +1,11 @@
+from django.urls import path
+
+from ads.views import AdsListAsyncView, AdDetailAsyncView
+from selection.views import SelectionDetailAsyncView
+
+
+urlpatterns = [
+    path('ad/', AdsListAsyncView.as_view()),
+    path('ad/<int:pk>/', AdDetailAsyncView.as_view()),
+    path('selection/<int:pk>/', SelectionDetailAsyncView.as_view()),
+]
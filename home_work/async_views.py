@@ -0,0 +1,192 @@
+from math import ceil
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AnonymousUser
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Aggregate, Max, Model, QuerySet
+from django.http import HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response
+from django.views import View
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.exceptions import APIException, NotAuthenticated, NotFound, PermissionDenied
+from rest_framework.permissions import AllowAny, BasePermission
+from rest_framework.serializers import ModelSerializer
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from home_work.conditional import aget_validators, get_variant, set_validators
+from home_work.eager_loading import setup_eager_loading
+from home_work.sparse_fields import SparseFieldsSerializerMixin, get_field_names
+
+
+class AsyncAPIView(View):
+    """
+    The AsyncAPIView class inherits from the View class from the django views module and is the base class
+    of the asynchronous read-only views served through the ASGI application. Authenticates the request with
+    the authentication classes of the rest_framework settings, checks the permissions listed in the
+    permission_classes attribute and renders the exceptions of the rest_framework library as JSON responses
+    of the same shape as the synchronous views, without holding a worker thread while the database is queried.
+    """
+    authentication_classes: List[Type[BaseAuthentication]] = api_settings.DEFAULT_AUTHENTICATION_CLASSES
+    permission_classes: List[Type[BasePermission]] = [AllowAny]
+
+    async def dispatch(self, request, *args: Any, **kwargs: Any) -> HttpResponse:
+        """
+        The dispatch function overrides the method of the parent class. Authenticates the request, checks
+        the permissions and calls the handler of the request method. Returns the response of the handler,
+        or a JSON response with the details and the status of the raised exception of the rest_framework library.
+        """
+        try:
+            await self.authenticate(request)
+            self.check_permissions(request)
+            return await super().dispatch(request, *args, **kwargs)
+        except APIException as exc:
+            data: Any = exc.detail if isinstance(exc.detail, (list, dict)) else {"detail": exc.detail}
+            return self.render(data, status=exc.status_code)
+
+    async def authenticate(self, request) -> None:
+        """
+        The authenticate function takes a request object as an argument. Sets the user and auth attributes
+        of the request from the first authentication class recognizing its credentials, or the anonymous user.
+        The lookups of the user are run outside the event loop. Returns None.
+        """
+        request.user, request.auth = AnonymousUser(), None
+        for authentication_class in self.authentication_classes:
+            result: Optional[Tuple[Any, Any]] = await sync_to_async(authentication_class().authenticate)(request)
+            if result is not None:
+                request.user, request.auth = result
+                return
+
+    def check_permissions(self, request) -> None:
+        """
+        The check_permissions function takes a request object as an argument. Raises a NotAuthenticated
+        exception for an anonymous user or a PermissionDenied exception for an authenticated one
+        if any of the permissions is not granted. Returns None.
+        """
+        for permission_class in self.permission_classes:
+            permission: BasePermission = permission_class()
+            if not permission.has_permission(request, self):
+                if request.auth is None:
+                    raise NotAuthenticated()
+                raise PermissionDenied(getattr(permission, "message", None))
+
+    @staticmethod
+    def render(data: Any, status: int = 200) -> JsonResponse:
+        """
+        The render function takes as arguments the data of the response and its status.
+        Returns a JsonResponse object with the data encoded as by the synchronous views.
+        """
+        return JsonResponse(data, status=status, safe=False, encoder=DjangoJSONEncoder,
+                            json_dumps_params={"ensure_ascii": False})
+
+
+class AsyncGenericView(AsyncAPIView):
+    """
+    The AsyncGenericView class inherits from the AsyncAPIView class and is the base class of the asynchronous
+    views displaying the objects of the queryset attribute with the serializer_class attribute. Restricts both
+    the displayed fields and the loaded columns to the fields listed in the fields query parameter.
+    """
+    queryset: QuerySet = None
+    serializer_class: Type[ModelSerializer] = None
+    sparse_fields_param: str = "fields"
+
+    def get_field_names(self) -> Optional[Tuple[str, ...]]:
+        """
+        The get_field_names function returns a tuple of the names of the fields requested by the query parameter,
+        or None to display all the fields.
+        """
+        return get_field_names(self.request.GET, self.serializer_class, self.sparse_fields_param)
+
+    def get_queryset(self) -> QuerySet:
+        """
+        The get_queryset function returns the queryset of the view with the eager loading of the requested fields.
+        """
+        return setup_eager_loading(self.queryset.all(), self.serializer_class, self.get_field_names())
+
+    def get_serializer_context(self) -> Dict[str, Any]:
+        """
+        The get_serializer_context function returns the context of the serializer with the request object
+        and the names of the requested fields.
+        """
+        return {"request": self.request, SparseFieldsSerializerMixin.sparse_fields_context_key: self.get_field_names()}
+
+
+class AsyncListView(AsyncGenericView):
+    """
+    The AsyncListView class inherits from the AsyncGenericView class and is the base class of the asynchronous
+    list views. Loads a page of the objects of the queryset returned by the get_queryset method with
+    the asynchronous ORM and displays it in the format of the page number pagination of the rest_framework library.
+    """
+    page_size: int = api_settings.PAGE_SIZE
+    page_query_param: str = "page"
+
+    async def get(self, request, *args: Any, **kwargs: Any) -> HttpResponse:
+        """
+        The get function is intended for processing GET requests. Returns a JsonResponse object
+        with the requested page of the serialized objects.
+        """
+        return self.render(await self.paginate(request, self.get_queryset()))
+
+    async def paginate(self, request, queryset: QuerySet) -> Dict[str, Any]:
+        """
+        The paginate function takes as arguments a request object and a queryset. Counts the objects and loads
+        the requested page of them with the asynchronous ORM. Returns a dictionary with the count, the links
+        to the next and previous pages and the serialized results. In case of an incorrect page number,
+        raises a NotFound exception from the rest_framework.exceptions module.
+        """
+        try:
+            page_number: int = int(request.GET.get(self.page_query_param, 1))
+        except ValueError:
+            raise NotFound("Invalid page.")
+
+        count: int = await queryset.acount()
+        pages: int = max(ceil(count / self.page_size), 1)
+        if not 1 <= page_number <= pages:
+            raise NotFound("Invalid page.")
+
+        offset: int = (page_number - 1) * self.page_size
+        objects: List[Model] = [obj async for obj in queryset[offset:offset + self.page_size]]
+        url: str = request.build_absolute_uri()
+
+        return {
+            "count": count,
+            "next": replace_query_param(url, self.page_query_param, page_number + 1) if page_number < pages else None,
+            "previous": None if page_number == 1
+            else remove_query_param(url, self.page_query_param) if page_number == 2
+            else replace_query_param(url, self.page_query_param, page_number - 1),
+            "results": self.serializer_class(objects, many=True, context=self.get_serializer_context()).data,
+        }
+
+
+class AsyncRetrieveView(AsyncGenericView):
+    """
+    The AsyncRetrieveView class inherits from the AsyncGenericView class and is the base class of the asynchronous
+    detail views. Loads the object by the pk parameter of the path with the asynchronous ORM and displays it.
+    Answers the conditional requests of an object that has not changed according to the conditional_aggregates
+    attribute with the status 304.
+    """
+    conditional_aggregates: Dict[str, Aggregate] = {"updated_at": Max("updated_at")}
+
+    async def get(self, request, pk: int, *args: Any, **kwargs: Any) -> HttpResponse:
+        """
+        The get function is intended for processing GET requests. Accepts the request object and the primary key
+        of the object. Returns a JsonResponse object with the serialized object, or a response with the status 304
+        if it has not changed since the version known to the client. If the object does not exist,
+        raises a NotFound exception from the rest_framework.exceptions module.
+        """
+        queryset: QuerySet = self.get_queryset().filter(pk=pk)
+        validators: Optional[Tuple[str, Optional[int]]] = await aget_validators(
+            queryset.order_by(), self.conditional_aggregates, get_variant(request)
+        )
+        if validators is not None:
+            not_modified: Optional[HttpResponse] = get_conditional_response(request, *validators)
+            if not_modified is not None:
+                return set_validators(not_modified, *validators)
+
+        obj: Optional[Model] = await queryset.afirst()
+        if obj is None:
+            raise NotFound()
+
+        response: HttpResponse = self.render(self.serializer_class(obj, context=self.get_serializer_context()).data)
+        return set_validators(response, *validators) if validators is not None else response
@@ -0,0 +1,127 @@
+import hashlib
+from calendar import timegm
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from django.db.models import Aggregate, Max, QuerySet
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, urlencode
+
+
+def get_variant(request) -> str:
+    """
+    The get_variant function takes a request object as an argument. Returns the query parameters of the request
+    in a canonical form. The parameters choose the representation of the objects, such as the displayed fields
+    of the objects and of their items, so they are a part of the ETag of the response.
+    """
+    return urlencode(sorted(request.GET.lists()), doseq=True)
+
+
+def make_validators(values: Dict[str, Any], variant: str = "") -> Optional[Tuple[str, Optional[int]]]:
+    """
+    The make_validators function takes as arguments a dictionary of the computed aggregates, which must include
+    the maximum of the updated_at field under the same name, and the variant of the representation returned
+    by the get_variant function. Returns a tuple of the ETag, different for every variant, and the timestamp
+    of the last modification, or None if the aggregated queryset selects nothing.
+    """
+    if values["updated_at"] is None:
+        return None
+
+    dates = [value for value in values.values() if isinstance(value, datetime)]
+    digest: str = hashlib.md5(repr((sorted(values.items()), variant)).encode()).hexdigest()
+    return f'"{digest}"', timegm(max(dates).utctimetuple()) if dates else None
+
+
+def get_validators(queryset: QuerySet, aggregates: Dict[str, Aggregate],
+                   variant: str = "") -> Optional[Tuple[str, Optional[int]]]:
+    """
+    The get_validators function takes as arguments a queryset, a dictionary of the aggregates describing
+    the state of the objects selected by it, which must include the maximum of their updated_at field
+    under the same name, and the variant of the representation. Computes the aggregates with a single query.
+    Returns a tuple of the ETag and the timestamp of the last modification, or None if the queryset selects nothing.
+    """
+    return make_validators(queryset.aggregate(**aggregates), variant)
+
+
+async def aget_validators(queryset: QuerySet, aggregates: Dict[str, Aggregate],
+                          variant: str = "") -> Optional[Tuple[str, Optional[int]]]:
+    """
+    The aget_validators function is the asynchronous version of the get_validators function.
+    """
+    return make_validators(await queryset.aaggregate(**aggregates), variant)
+
+
+def set_validators(response: HttpResponse, etag: str, last_modified: Optional[int]) -> HttpResponse:
+    """
+    The set_validators function takes as arguments a response object, the ETag and the timestamp of the last
+    modification. Sets the ETag and Last-Modified headers of the response. Returns the response.
+    """
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+class ConditionalRetrieveMixin:
+    """
+    The ConditionalRetrieveMixin class is a mixin for the retrieve views of the rest_framework library.
+    Before loading and serializing the object, computes its validators from the updated_at fields listed in
+    the conditional_aggregates attribute of the view and the query parameters choosing its representation,
+    and answers the requests with a matching If-None-Match
+    or If-Modified-Since header with the status 304.
+    """
+    conditional_aggregates: Dict[str, Aggregate] = {"updated_at": Max("updated_at")}
+
+    def retrieve(self, request, *args: Any, **kwargs: Any) -> HttpResponse:
+        """
+        The retrieve function overrides the method of the parent class. Returns a response with the status 304
+        if the object has not changed since the version known to the client, otherwise calls the method
+        of the parent class and adds the validators to its response.
+        """
+        lookup_url_kwarg: str = self.lookup_url_kwarg or self.lookup_field
+        queryset: QuerySet = self.filter_queryset(self.get_queryset()).filter(
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+        validators: Optional[Tuple[str, Optional[int]]] = get_validators(
+            queryset.order_by(), self.conditional_aggregates, get_variant(request)
+        )
+        if validators is None:
+            return super().retrieve(request, *args, **kwargs)
+
+        not_modified: Optional[HttpResponse] = get_conditional_response(request, *validators)
+        if not_modified is not None:
+            return set_validators(not_modified, *validators)
+        return set_validators(super().retrieve(request, *args, **kwargs), *validators)
+
+
+class ConditionalListMixin:
+    """
+    The ConditionalListMixin class is a mixin for the list views of the rest_framework library.
+    Computes the validators of the whole list from the aggregates listed in the conditional_list_aggregates
+    attribute of the view and answers the requests of an unchanged list with the status 304.
+    """
+    conditional_list_aggregates: Dict[str, Aggregate] = {"updated_at": Max("updated_at")}
+
+    def get_list_validators(self) -> Optional[Tuple[str, Optional[int]]]:
+        """
+        The get_list_validators function returns a tuple of the ETag and the timestamp of the last modification
+        of the list, or None if the list is empty.
+        """
+        return get_validators(self.filter_queryset(self.get_queryset()).order_by(), self.conditional_list_aggregates,
+                              get_variant(self.request))
+
+    def list(self, request, *args: Any, **kwargs: Any) -> HttpResponse:
+        """
+        The list function overrides the method of the parent class. Returns a response with the status 304
+        if the list has not changed since the version known to the client, otherwise calls the method
+        of the parent class and adds the validators to its response.
+        """
+        validators: Optional[Tuple[str, Optional[int]]] = self.get_list_validators()
+        if validators is None:
+            return super().list(request, *args, **kwargs)
+
+        not_modified: Optional[HttpResponse] = get_conditional_response(request, *validators)
+        if not_modified is not None:
+            return set_validators(not_modified, *validators)
+        return set_validators(super().list(request, *args, **kwargs), *validators)
@@ -0,0 +1,394 @@
+import csv
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from io import StringIO
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Set, TextIO, Tuple, Type
+
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.management.color import no_style
+from django.db import connection
+from django.db.models import Field, Model
+from django.utils import timezone
+from django.utils.text import slugify
+
+from ads.models import Ad
+from author.locations import normalize_location_name
+from author.models import Location, User
+from categories.models import Category
+
+
+class CsvTable:
+    """
+    The CsvTable class describes the loading of a CSV file into the table of a model. Maps the columns of the file
+    to the fields of the model, fills the missing fields with their defaults, validates the rows with the fields
+    of the model and resolves the foreign keys given by identifiers or by the values of the lookup fields.
+    """
+    model: Type[Model]
+    file_name: str
+    columns: Dict[str, str] = {}
+    foreign_keys: Dict[str, Tuple[Type[Model], str]] = {}
+    unique_fields: Tuple[str, ...] = ()
+
+    def __init__(self, hash_passwords: bool = False) -> None:
+        """
+        The __init__ function takes as an argument the flag of hashing the passwords of the imported users.
+        """
+        self.hash_passwords: bool = hash_passwords
+        self.fields: Dict[str, Field] = {field.attname: field for field in self.model._meta.concrete_fields}
+
+    def get_field_names(self, header: List[str]) -> List[str]:
+        """
+        The get_field_names function takes as an argument the normalized header of the file. Returns the list
+        of the columns of the table written by the COPY statement, without the primary key if the file has none.
+        """
+        pk_name: str = self.model._meta.pk.attname
+        return [name for name in self.fields if name != pk_name or pk_name in header]
+
+    def prepare(self, row: Dict[str, str]) -> Dict[str, Any]:
+        """
+        The prepare function takes as an argument a row of the file by the normalized names of the columns.
+        Returns a dictionary of the raw values by the names of the fields of the model.
+        """
+        return {self.columns.get(column, column): value for column, value in row.items() if column}
+
+    def clean(self, row: Dict[str, str], field_names: List[str], now: datetime) -> Dict[str, Any]:
+        """
+        The clean function takes as arguments a row of the file, the list of the written columns and the time
+        of the import. Converts and validates the values with the fields of the model and fills the missing ones
+        with their defaults. Returns a dictionary of the values by the names of the columns. Raises
+        a ValidationError exception from the django.core.exceptions module if the row is invalid.
+        """
+        values: Dict[str, Any] = self.prepare(row)
+        cleaned: Dict[str, Any] = {}
+        errors: Dict[str, List[str]] = {}
+        for name in field_names:
+            field: Field = self.fields[name]
+            if name not in values:
+                if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+                    cleaned[name] = now
+                else:
+                    cleaned[name] = field.get_default() if field.has_default() else None
+                continue
+            if name in self.foreign_keys:
+                cleaned[name] = values[name].strip() or None
+                continue
+            value: Any = values[name]
+            if value == "" and not field.empty_strings_allowed and field.null:
+                cleaned[name] = None
+                continue
+            try:
+                cleaned[name] = field.clean(value, None)
+            except ValidationError as error:
+                errors[name] = error.messages
+
+        if errors:
+            raise ValidationError(errors)
+        return cleaned
+
+    def resolve_conflict(self, row: Dict[str, Any], field_name: str) -> bool:
+        """
+        The resolve_conflict function takes as arguments a cleaned row and the name of its field whose value
+        is already taken. Is a hook to replace the value. Returns True if the value has been replaced, otherwise False.
+        """
+        return False
+
+
+class CategoryTable(CsvTable):
+    """
+    The CategoryTable class inherits from the CsvTable class and describes the loading of the category.csv file.
+    The missing slugs are derived from the names, or from the identifiers if the names give no valid slug.
+    """
+    model: Type[Model] = Category
+    file_name: str = "category.csv"
+    unique_fields: Tuple[str, ...] = ("slug",)
+
+    def prepare(self, row: Dict[str, str]) -> Dict[str, Any]:
+        """
+        The prepare function overrides the method of the parent class. Derives the slug from the name.
+        """
+        values: Dict[str, Any] = super().prepare(row)
+        if not values.get("slug"):
+            values["slug"] = slugify(values.get("name", ""))[:10]
+        return values
+
+    def clean(self, row: Dict[str, str], field_names: List[str], now: datetime) -> Dict[str, Any]:
+        """
+        The clean function overrides the method of the parent class. Replaces a derived slug that is too short
+        with the slug built from the identifier.
+        """
+        try:
+            return super().clean(row, field_names, now)
+        except ValidationError as error:
+            if set(error.message_dict) != {"slug"} or not row.get("id", "").isdigit():
+                raise
+            return super().clean(dict(row, slug=f"cat{int(row['id']):04d}"), field_names, now)
+
+    def resolve_conflict(self, row: Dict[str, Any], field_name: str) -> bool:
+        """
+        The resolve_conflict function overrides the method of the parent class. Replaces a taken slug
+        with the slug built from the identifier.
+        """
+        if field_name != "slug" or row.get("id") is None or row["slug"] == f"cat{row['id']:04d}":
+            return False
+        row["slug"] = f"cat{row['id']:04d}"
+        return True
+
+
+class LocationTable(CsvTable):
+    """
+    The LocationTable class inherits from the CsvTable class and describes the loading of the location.csv file.
+    The locations whose normalized names are taken are skipped.
+    """
+    model: Type[Model] = Location
+    file_name: str = "location.csv"
+    unique_fields: Tuple[str, ...] = ("normalized_name",)
+
+    def prepare(self, row: Dict[str, str]) -> Dict[str, Any]:
+        """
+        The prepare function overrides the method of the parent class. Fills the normalized name from the name.
+        """
+        values: Dict[str, Any] = super().prepare(row)
+        values["normalized_name"] = normalize_location_name(values.get("name", ""))
+        return values
+
+
+class UserTable(CsvTable):
+    """
+    The UserTable class inherits from the CsvTable class and describes the loading of the user.csv file.
+    The location may be given by its identifier or name. The missing emails are replaced by placeholders
+    built from the usernames. The passwords are copied as they are, as the loaddata command does,
+    unless their hashing is requested.
+    """
+    model: Type[Model] = User
+    file_name: str = "user.csv"
+    columns: Dict[str, str] = {"location": "location_id"}
+    foreign_keys: Dict[str, Tuple[Type[Model], str]] = {"location_id": (Location, "name")}
+    unique_fields: Tuple[str, ...] = ("username", "email")
+
+    def prepare(self, row: Dict[str, str]) -> Dict[str, Any]:
+        """
+        The prepare function overrides the method of the parent class. Fills the missing email and hashes
+        the password if requested.
+        """
+        values: Dict[str, Any] = super().prepare(row)
+        if not values.get("email"):
+            values["email"] = f"{values.get('username', '')}@example.com"
+        if self.hash_passwords and values.get("password"):
+            values["password"] = make_password(values["password"])
+        return values
+
+
+class AdTable(CsvTable):
+    """
+    The AdTable class inherits from the CsvTable class and describes the loading of the ad.csv file.
+    The author may be given by its identifier or username, the category by its identifier or name.
+    """
+    model: Type[Model] = Ad
+    file_name: str = "ad.csv"
+    columns: Dict[str, str] = {"author": "author_id", "category": "category_id"}
+    foreign_keys: Dict[str, Tuple[Type[Model], str]] = {
+        "author_id": (User, "username"),
+        "category_id": (Category, "name"),
+    }
+
+    def get_field_names(self, header: List[str]) -> List[str]:
+        """
+        The get_field_names function overrides the method of the parent class. Leaves out the search vector,
+        which is filled by the trigger of the table.
+        """
+        return [name for name in super().get_field_names(header) if name != "search_vector"]
+
+    def prepare(self, row: Dict[str, str]) -> Dict[str, Any]:
+        """
+        The prepare function overrides the method of the parent class. Converts the TRUE and FALSE values
+        of the publication status.
+        """
+        values: Dict[str, Any] = super().prepare(row)
+        if "is_published" in values:
+            values["is_published"] = {"TRUE": True, "FALSE": False}.get(values["is_published"].upper(),
+                                                                        values["is_published"])
+        return values
+
+
+TABLES: List[Type[CsvTable]] = [CategoryTable, LocationTable, UserTable, AdTable]
+
+
+def copy_value(value: Any) -> str:
+    """
+    The copy_value function takes as an argument a cleaned value. Returns its representation in the CSV format
+    of the COPY statement, where only an unquoted empty value is NULL.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, ensure_ascii=False)
+    elif isinstance(value, (date, Decimal)):
+        value = value.isoformat() if isinstance(value, date) else str(value)
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+class CsvImport:
+    """
+    The CsvImport class loads a CSV file into the table of a model in batches. Every batch is validated,
+    its foreign keys and unique values are checked with one query per column, and the valid rows are written
+    with one COPY statement. The invalid rows are skipped and reported.
+    """
+    def __init__(self, table: CsvTable, file: TextIO, batch_size: int) -> None:
+        """
+        The __init__ function takes as arguments the description of the table, the open CSV file and the number
+        of the rows of a batch.
+        """
+        self.table: CsvTable = table
+        self.reader: csv.DictReader = csv.DictReader(file)
+        self.reader.fieldnames = [name.strip().lower() for name in self.reader.fieldnames or []]
+        self.field_names: List[str] = table.get_field_names(self.reader.fieldnames)
+        self.batch_size: int = batch_size
+        self.now: datetime = timezone.now()
+        self.copied: int = 0
+        self.errors: List[str] = []
+        self.foreign_key_values: Dict[str, Set[Any]] = {}
+
+    def numbered_rows(self) -> Iterator[Tuple[int, Dict[str, str]]]:
+        """
+        The numbered_rows function returns an iterator of the rows of the file with the numbers of their first lines.
+        """
+        line: int = self.reader.line_num + 1
+        for row in self.reader:
+            yield line, row
+            line = self.reader.line_num + 1
+
+    def batches(self) -> Iterator[List[Tuple[int, Dict[str, str]]]]:
+        """
+        The batches function returns an iterator of the batches of the rows of the file with their line numbers.
+        """
+        rows: Iterator[Tuple[int, Dict[str, str]]] = self.numbered_rows()
+        while True:
+            batch: List[Tuple[int, Dict[str, str]]] = list(islice(rows, self.batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def error(self, line: int, message: str) -> None:
+        """
+        The error function takes as arguments the line number of an invalid row and the description of the error
+        and records it. Returns None.
+        """
+        self.errors.append(f"{self.table.file_name}:{line}: {message}")
+
+    def resolve_foreign_keys(self, rows: List[Tuple[int, Dict[str, Any]]]) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        The resolve_foreign_keys function takes as an argument the list of the cleaned rows of a batch with their
+        line numbers. Replaces the values of the foreign keys given by the lookup fields with the identifiers
+        and checks that the referenced objects exist. Returns the list of the rows whose references are resolved.
+        """
+        for name, (model, lookup_field) in self.table.foreign_keys.items():
+            if name not in self.field_names:
+                continue
+            values: Set[str] = {row[name] for _, row in rows if row[name] is not None}
+            ids: Set[int] = {int(value) for value in values if value.isdigit()}
+            lookups: Set[str] = values - {str(value) for value in ids}
+            resolved: Dict[str, int] = {
+                str(pk): pk for pk in model.objects.filter(pk__in=ids).values_list("pk", flat=True)
+            } if ids else {}
+            if lookups:
+                resolved.update(model.objects.filter(**{f"{lookup_field}__in": lookups}).values_list(lookup_field, "pk"))
+
+            valid: List[Tuple[int, Dict[str, Any]]] = []
+            for line, row in rows:
+                if row[name] is not None and row[name] not in resolved:
+                    self.error(line, f"{name}: {model.__name__} {row[name]!r} does not exist.")
+                    continue
+                row[name] = resolved.get(row[name]) if row[name] is not None else None
+                valid.append((line, row))
+            rows = valid
+        return rows
+
+    def check_unique(self, rows: List[Tuple[int, Dict[str, Any]]]) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        The check_unique function takes as an argument the list of the cleaned rows of a batch with their line numbers.
+        Checks the primary key and the unique fields against the table and the previous rows of the batch,
+        letting the table replace a taken value. Returns the list of the rows with unique values.
+        """
+        names: List[str] = [self.table.model._meta.pk.attname, *self.table.unique_fields]
+        for name in names:
+            if name not in self.field_names:
+                continue
+            taken: Set[Any] = set(self.table.model.objects.filter(
+                **{f"{name}__in": [row[name] for _, row in rows if row[name] is not None]}
+            ).values_list(name, flat=True))
+
+            valid: List[Tuple[int, Dict[str, Any]]] = []
+            for line, row in rows:
+                if row[name] in taken and not (self.table.resolve_conflict(row, name) and row[name] not in taken
+                                               and not self.table.model.objects.filter(**{name: row[name]}).exists()):
+                    self.error(line, f"{name}: {row[name]!r} already exists.")
+                    continue
+                if row[name] is not None:
+                    taken.add(row[name])
+                valid.append((line, row))
+            rows = valid
+        return rows
+
+    def copy(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        The copy function takes as an argument the list of the valid rows of a batch and writes them to the table
+        with one COPY statement. Returns None.
+        """
+        buffer: StringIO = StringIO()
+        for row in rows:
+            buffer.write(",".join(copy_value(row[name]) for name in self.field_names) + "\n")
+        buffer.seek(0)
+
+        quote_name = connection.ops.quote_name
+        columns: str = ", ".join(quote_name(self.table.fields[name].column) for name in self.field_names)
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {quote_name(self.table.model._meta.db_table)} ({columns}) FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+        self.copied += len(rows)
+
+    def run(self) -> Iterator[Tuple[int, int]]:
+        """
+        The run function loads the file batch by batch. Returns an iterator of the numbers of the copied rows
+        and of the errors after every batch.
+        """
+        for batch in self.batches():
+            rows: List[Tuple[int, Dict[str, Any]]] = []
+            for line, row in batch:
+                try:
+                    rows.append((line, self.table.clean(row, self.field_names, self.now)))
+                except ValidationError as error:
+                    self.error(line, "; ".join(
+                        f"{name}: {' '.join(messages)}" for name, messages in error.message_dict.items()
+                    ))
+            rows = self.check_unique(self.resolve_foreign_keys(rows))
+            if rows:
+                self.copy([row for _, row in rows])
+            yield self.copied, len(self.errors)
+
+
+def reset_sequences(models: List[Type[Model]]) -> None:
+    """
+    The reset_sequences function takes as an argument the list of the models whose rows were copied with explicit
+    identifiers and moves their sequences past the largest identifier. Returns None.
+    """
+    with connection.cursor() as cursor:
+        for statement in connection.ops.sequence_reset_sql(no_style(), models):
+            cursor.execute(statement)
+
+
+def get_table(file_name: str, hash_passwords: bool = False) -> Optional[CsvTable]:
+    """
+    The get_table function takes as arguments the name of a CSV file and the flag of hashing the passwords.
+    Returns the description of the table loaded from the file, or None if the file is unknown.
+    """
+    for table in TABLES:
+        if table.file_name == file_name:
+            return table(hash_passwords=hash_passwords)
+    return None
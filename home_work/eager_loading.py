@@ -0,0 +1,94 @@
+from functools import lru_cache
+from typing import List, Optional, Tuple, Type
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import QuerySet
+from rest_framework import serializers
+
+
+@lru_cache(maxsize=None)
+def get_only_fields(serializer_class: Type[serializers.ModelSerializer],
+                    field_names: Optional[Tuple[str, ...]] = None) -> Optional[Tuple[str, ...]]:
+    """
+    The get_only_fields function takes as arguments a model serializer class and, optionally, a tuple of the names
+    of its fields to be displayed. Translates the serializer fields into the paths of the model fields that
+    have to be loaded from the database: a related field showing a slug is loaded through the relation,
+    a many-to-many field is left to prefetching, a field showing an annotation of the queryset is left to the
+    annotation, a field built from the whole object is loaded through the model
+    fields listed in its model_fields attribute. Returns a tuple of the paths for the only method of the queryset,
+    or None if some field gets its value from the whole object and the columns cannot be narrowed.
+    """
+    model = serializer_class.Meta.model
+    only_fields: List[str] = []
+
+    for name, field in serializer_class().fields.items():
+        if field_names is not None and name not in field_names:
+            continue
+        if field.source == "*":
+            if getattr(field, "model_fields", None) is None:
+                return None
+            only_fields.extend(field.model_fields)
+            continue
+        source: str = field.source.replace(".", "__")
+        try:
+            model_field = model._meta.get_field(source.split("__")[0])
+        except FieldDoesNotExist:
+            continue
+        if model_field.many_to_many or model_field.one_to_many:
+            continue
+        if isinstance(field, serializers.SlugRelatedField):
+            source = f"{source}__{field.slug_field}"
+        elif isinstance(field, serializers.ManyRelatedField):
+            continue
+        only_fields.append(source)
+
+    return tuple(only_fields)
+
+
+def setup_eager_loading(queryset: QuerySet, serializer_class: Type[serializers.ModelSerializer],
+                        field_names: Optional[Tuple[str, ...]] = None) -> QuerySet:
+    """
+    The setup_eager_loading function takes as arguments a queryset, a model serializer class and, optionally,
+    a tuple of the names of the fields to be displayed. Joins the relations declared in the select_related
+    attribute of the serializer's Meta class, prefetches the ones declared in the prefetch_related attribute and
+    restricts the loaded columns to the serialized ones. Returns the prepared queryset, so serializing a page
+    costs a constant number of queries regardless of its size.
+    """
+    meta = serializer_class.Meta
+    select_related: List[str] = list(getattr(meta, "select_related", []))
+    prefetch_related: List[str] = list(getattr(meta, "prefetch_related", []))
+    only_fields: Optional[Tuple[str, ...]] = get_only_fields(serializer_class, field_names)
+
+    if only_fields is not None:
+        select_related = [relation for relation in select_related
+                          if any(path.startswith(f"{relation}__") for path in only_fields)]
+
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+
+    if only_fields is not None:
+        queryset = queryset.only(*only_fields)
+
+    return queryset
+
+
+class EagerLoadingMixin:
+    """
+    The EagerLoadingMixin class is a mixin for the generic views of the rest_framework library.
+    Builds the queryset of the view from the relations declared by its serializer.
+    """
+    def get_field_names(self) -> Optional[Tuple[str, ...]]:
+        """
+        The get_field_names function returns a tuple of the names of the serialized fields to be loaded,
+        or None to load all the fields of the serializer.
+        """
+        return None
+
+    def get_queryset(self) -> QuerySet:
+        """
+        The get_queryset function overrides the method of the parent class. Returns the queryset of the view
+        with the eager loading declared by the serializer class.
+        """
+        return setup_eager_loading(super().get_queryset(), self.get_serializer_class(), self.get_field_names())
@@ -0,0 +1,118 @@
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db.models import Model, QuerySet
+from rest_framework import serializers
+from rest_framework.response import Response
+
+IDENTITY_FIELDS: Tuple[type, ...] = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.SlugRelatedField,
+)
+
+Getter = Callable[[Dict[str, Any]], Any]
+
+
+def compile_field(field: serializers.Field, model: Model) -> Tuple[Tuple[str, ...], Getter]:
+    """
+    The compile_field function takes as arguments a bound serializer field and the serialized model.
+    Returns a tuple of the paths of the model fields the value is read from with the values method
+    of the queryset and the function building the displayed value from a row of the values. A source that is not
+    a field of the model is read from the annotation of the queryset with the same name.
+    The values are displayed as by the to_representation method of the field, which is skipped for the fields
+    displaying the database values as they are. In case of a field that cannot be built from the values,
+    raises an ImproperlyConfigured exception.
+    """
+    if field.source == "*":
+        if getattr(field, "model_fields", None) is None or not hasattr(field, "to_representation_from_values"):
+            raise ImproperlyConfigured(f"The field {field.field_name} cannot be built from the values of the row.")
+        paths: Tuple[str, ...] = tuple(field.model_fields)
+        read_values: Callable = itemgetter(*paths) if len(paths) > 1 else lambda row: (row[paths[0]],)
+        return paths, lambda row: field.to_representation_from_values(*read_values(row))
+
+    source: str = field.source.replace(".", "__")
+    try:
+        model_field = model._meta.get_field(source.split("__")[0])
+    except FieldDoesNotExist:
+        model_field = None
+    if model_field is not None and (model_field.many_to_many or model_field.one_to_many) or isinstance(
+            field, (serializers.BaseSerializer, serializers.ManyRelatedField)):
+        raise ImproperlyConfigured(f"The field {field.field_name} cannot be built from the values of the row.")
+
+    if isinstance(field, serializers.SlugRelatedField):
+        source = f"{source}__{field.slug_field}"
+    if isinstance(field, IDENTITY_FIELDS) or (
+            isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is None):
+        return (source,), itemgetter(source)
+
+    to_representation: Callable = field.to_representation
+
+    def get_value(row: Dict[str, Any]) -> Any:
+        value: Any = row[source]
+        return None if value is None else to_representation(value)
+
+    return (source,), get_value
+
+
+class RowMapper:
+    """
+    The RowMapper class builds the representations of the objects from the rows of the values method
+    of the queryset instead of the model instances, producing the same data as the serializer whose bound fields
+    it is created from. The mapping of every field is compiled once, so a row costs a few dictionary lookups.
+    """
+    def __init__(self, serializer: serializers.ModelSerializer) -> None:
+        """
+        The __init__ function takes as an argument a model serializer with the context of the request
+        and compiles the mappings of its readable fields.
+        """
+        model = serializer.Meta.model
+        self.paths: List[str] = [model._meta.pk.name]
+        self.getters: List[Tuple[str, Getter]] = []
+        for field in serializer.fields.values():
+            if field.write_only:
+                continue
+            paths, getter = compile_field(field, model)
+            self.paths.extend(path for path in paths if path not in self.paths)
+            self.getters.append((field.field_name, getter))
+
+    def values(self, queryset: QuerySet) -> QuerySet:
+        """
+        The values function takes as an argument a queryset. Returns the queryset of the rows of the values
+        needed for the representations.
+        """
+        return queryset.values(*self.paths)
+
+    def map_rows(self, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        The map_rows function takes as an argument the rows of the values. Returns the list of the representations.
+        """
+        getters: List[Tuple[str, Getter]] = self.getters
+        return [{name: getter(row) for name, getter in getters} for row in rows]
+
+
+class FastListMixin:
+    """
+    The FastListMixin class is a mixin for the list views of the rest_framework library. If the fast_list
+    attribute of the view is set, displays the pages built by the RowMapper class from the rows of the values
+    method of the queryset instead of the model instances serialized field by field, with the same data.
+    """
+    fast_list: bool = True
+
+    def list(self, request, *args: Any, **kwargs: Any) -> Response:
+        """
+        The list function overrides the method of the parent class. Returns a Response object with the page
+        of the objects built from the rows of the values, or calls the method of the parent class
+        if the fast path is switched off.
+        """
+        if not self.fast_list:
+            return super().list(request, *args, **kwargs)
+
+        mapper: RowMapper = RowMapper(self.get_serializer())
+        queryset: QuerySet = mapper.values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(mapper.map_rows(page))
+        return Response(mapper.map_rows(queryset))
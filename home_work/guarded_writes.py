@@ -0,0 +1,119 @@
+from typing import Any, Dict, NoReturn, Optional, Tuple
+
+from django.db.models import Model, QuerySet
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.response import Response
+from rest_framework.serializers import BaseSerializer
+
+from home_work.permissions import OwnerEditPermission
+
+
+class GuardedWriteMixin:
+    """
+    The GuardedWriteMixin class is a base mixin for the update and delete views of the rest_framework library
+    protected by an OwnerEditPermission. If the guarded_write attribute of the view is set, the check of the right
+    to edit the object is made a part of the query writing it, instead of loading the object and its owner first.
+    When nothing is written, one more query tells a missing object from a forbidden one.
+    """
+    guarded_write: bool = True
+
+    def get_edit_permission(self) -> Optional[OwnerEditPermission]:
+        """
+        The get_edit_permission function returns the permission of the view checking the right to edit
+        the object, or None if the view has none.
+        """
+        for permission in self.get_permissions():
+            if isinstance(permission, OwnerEditPermission):
+                return permission
+        return None
+
+    def get_lookup_queryset(self) -> QuerySet:
+        """
+        The get_lookup_queryset function returns the queryset of the view filtered by the lookup field,
+        without the check of the permissions.
+        """
+        lookup_url_kwarg: str = self.lookup_url_kwarg or self.lookup_field
+        return self.get_queryset().filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+
+    def write_refused(self, queryset: QuerySet, permission: OwnerEditPermission) -> NoReturn:
+        """
+        The write_refused function takes as arguments the queryset of the requested object and the permission
+        of the view. Is called when the guarded query has written nothing. Raises a PermissionDenied exception
+        if the object exists, otherwise a NotFound exception from the rest_framework.exceptions module.
+        """
+        if queryset.exists():
+            self.permission_denied(self.request, message=permission.message, code=getattr(permission, "code", None))
+        raise NotFound()
+
+
+class GuardedUpdateMixin(GuardedWriteMixin):
+    """
+    The GuardedUpdateMixin class is a mixin for the update views of the rest_framework library. Writes the validated
+    fields listed in the guarded_update_fields attribute of the view with a single UPDATE statement whose WHERE
+    clause selects the object only if the user is allowed to edit it. The requests changing other fields
+    are processed by the method of the parent class.
+    """
+    guarded_update_fields: Tuple[str, ...] = ()
+
+    def update(self, request, *args: Any, **kwargs: Any) -> Response:
+        """
+        The update function overrides the method of the parent class. Returns a Response object with the updated
+        object. If the data is invalid, raises a ValidationError exception only after checking that the object
+        exists and may be edited by the user, as the method of the parent class does.
+        """
+        permission: Optional[OwnerEditPermission] = self.get_edit_permission()
+        if not self.guarded_write or permission is None:
+            return super().update(request, *args, **kwargs)
+
+        partial: bool = kwargs.get("partial", False)
+        queryset: QuerySet = self.get_lookup_queryset()
+        serializer: BaseSerializer = self.get_serializer(data=request.data, partial=partial)
+        if not serializer.is_valid():
+            if not queryset.filter(permission.get_edit_filter(request)).exists():
+                self.write_refused(queryset, permission)
+            raise ValidationError(serializer.errors)
+        if set(serializer.validated_data) - set(self.guarded_update_fields):
+            return super().update(request, *args, **kwargs)
+
+        values: Dict[str, Any] = dict(serializer.validated_data)
+        model: Model = queryset.model
+        for field in model._meta.concrete_fields:
+            if getattr(field, "auto_now", False):
+                values[field.name] = timezone.now()
+
+        if not queryset.filter(permission.get_edit_filter(request)).update(**values):
+            self.write_refused(queryset, permission)
+
+        instance: Model = queryset.get()
+        self.perform_guarded_update(instance)
+        return Response(self.get_serializer(instance).data)
+
+    def perform_guarded_update(self, instance: Model) -> None:
+        """
+        The perform_guarded_update function takes as an argument the object reloaded after the guarded update.
+        Is a hook for the work the signals of the model would do on saving it. Returns None.
+        """
+
+
+class GuardedDestroyMixin(GuardedWriteMixin):
+    """
+    The GuardedDestroyMixin class is a mixin for the delete views of the rest_framework library. Deletes the object
+    with a query whose WHERE clause selects it only if the user is allowed to edit it, so the object and its owner
+    are not loaded before the deletion.
+    """
+    def destroy(self, request, *args: Any, **kwargs: Any) -> Response:
+        """
+        The destroy function overrides the method of the parent class. Returns a Response object
+        with the status 204 if the object is deleted.
+        """
+        permission: Optional[OwnerEditPermission] = self.get_edit_permission()
+        if not self.guarded_write or permission is None:
+            return super().destroy(request, *args, **kwargs)
+
+        queryset: QuerySet = self.get_lookup_queryset()
+        deleted, _ = queryset.filter(permission.get_edit_filter(request)).delete()
+        if not deleted:
+            self.write_refused(queryset, permission)
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,117 @@
+import mimetypes
+import os
+import re
+from typing import Iterator, Optional, Tuple
+
+from django.conf import settings
+from django.core.files.storage import Storage
+from django.http import HttpResponse, StreamingHttpResponse, FileResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+CHUNK_SIZE: int = 64 * 1024
+
+
+class RangeNotSatisfiable(Exception):
+    """
+    The RangeNotSatisfiable class is an exception raised for a Range header that selects no byte of the file.
+    """
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    The parse_range function takes as arguments the value of the Range header and the size of the file.
+    Returns a tuple of the first and the last byte of the requested single range, or None if the whole file
+    is to be sent, which is also the answer to an invalid header or multiple ranges. In case of a range beyond
+    the end of the file, raises a RangeNotSatisfiable exception.
+    """
+    match = RANGE_RE.match(header or "")
+    if match is None or match.groups() == ("", ""):
+        return None
+
+    first, last = match.groups()
+    if first == "":
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start, end = int(first), min(int(last), size - 1) if last else size - 1
+    if start > end or start >= size:
+        raise RangeNotSatisfiable()
+    return start, end
+
+
+def iter_file_range(path: str, start: int, length: int) -> Iterator[bytes]:
+    """
+    The iter_file_range function takes as arguments the path of a file, the first byte and the number of bytes.
+    Returns an iterator of the chunks of the range of the file.
+    """
+    with open(path, "rb") as file:
+        file.seek(start)
+        while length > 0:
+            chunk: bytes = file.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def set_cache_headers(response: HttpResponse, mtime: float, etag: str) -> HttpResponse:
+    """
+    The set_cache_headers function takes as arguments a response object, the time of the last modification
+    and the ETag of the file. Sets the headers allowing the clients and proxies to cache the file
+    for the MEDIA_CACHE_MAX_AGE setting seconds. Returns the response.
+    """
+    response["Last-Modified"] = http_date(mtime)
+    response["ETag"] = etag
+    response["Cache-Control"] = f"public, max-age={settings.MEDIA_CACHE_MAX_AGE}"
+    response["Accept-Ranges"] = "bytes"
+    return response
+
+
+def serve_media(request, storage: Storage, name: str) -> HttpResponse:
+    """
+    The serve_media function takes as arguments a request object, the storage and the name of a file in it.
+    Hands the transfer of the file to the front server with the X-Accel-Redirect header for the 'nginx' value
+    of the MEDIA_SENDFILE_BACKEND setting or the X-Sendfile header for the 'xsendfile' value. Otherwise sends
+    the file from Python answering the conditional headers with the status 304 or 412, as the django cache
+    utilities evaluate them, and the Range header with the status 206. Returns the response object.
+    """
+    path: str = storage.path(name)
+    stat: os.stat_result = os.stat(path)
+    content_type: str = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    etag: str = quote_etag(f"{int(stat.st_mtime):x}-{stat.st_size:x}")
+
+    backend: str = settings.MEDIA_SENDFILE_BACKEND
+    if backend == "nginx":
+        response: HttpResponse = HttpResponse(content_type=content_type)
+        response["X-Accel-Redirect"] = settings.MEDIA_ACCEL_REDIRECT_PREFIX + name
+        return set_cache_headers(response, stat.st_mtime, etag)
+    if backend == "xsendfile":
+        response = HttpResponse(content_type=content_type)
+        response["X-Sendfile"] = path
+        return set_cache_headers(response, stat.st_mtime, etag)
+
+    conditional_response: Optional[HttpResponse] = get_conditional_response(
+        request, etag=etag, last_modified=int(stat.st_mtime)
+    )
+    if conditional_response is not None:
+        return set_cache_headers(conditional_response, stat.st_mtime, etag)
+
+    if_range: Optional[str] = request.META.get("HTTP_IF_RANGE")
+    try:
+        byte_range: Optional[Tuple[int, int]] = parse_range(request.META.get("HTTP_RANGE"), stat.st_size) \
+            if if_range in (None, etag) else None
+    except RangeNotSatisfiable:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{stat.st_size}"
+        return response
+
+    if byte_range is None:
+        response = FileResponse(open(path, "rb"), content_type=content_type)
+    else:
+        start, end = byte_range
+        response = StreamingHttpResponse(iter_file_range(path, start, end - start + 1), status=206,
+                                         content_type=content_type)
+        response["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+        response["Content-Length"] = str(end - start + 1)
+    return set_cache_headers(response, stat.st_mtime, etag)
@@ -0,0 +1,70 @@
+from typing import Any, List, Optional
+
+from django.db.models import QuerySet
+from rest_framework.pagination import PageNumberPagination, CursorPagination, BasePagination
+from rest_framework.response import Response
+
+
+class IdCursorPagination(CursorPagination):
+    """
+    The IdCursorPagination class inherits from the CursorPagination class from the rest_framework pagination module.
+    Orders the results by the primary key, so every page is a single index range scan without a COUNT(*)
+    and OFFSET, and the next and previous links carry opaque cursors.
+    """
+    ordering: str = "id"
+
+
+class OptionalCursorPagination(BasePagination):
+    """
+    The OptionalCursorPagination class inherits from the BasePagination class from the rest_framework pagination
+    module. By default it paginates by page number, like the global pagination class. The keyset (cursor) mode
+    is enabled by the query parameter pagination=cursor or by passing a cursor received in a previous response.
+    """
+    mode_query_param: str = "pagination"
+    cursor_mode: str = "cursor"
+
+    def __init__(self) -> None:
+        """
+        The __init__ function creates the page number and cursor paginators between which the requests are divided.
+        """
+        self.page_number_paginator: PageNumberPagination = PageNumberPagination()
+        self.cursor_paginator: IdCursorPagination = IdCursorPagination()
+        self.paginator: BasePagination = self.page_number_paginator
+
+    def is_cursor_mode(self, request) -> bool:
+        """
+        The is_cursor_mode function takes a request object of the rest_framework library or of django as an argument.
+        Returns True if the client requested the keyset pagination, otherwise False.
+        """
+        return (request.GET.get(self.mode_query_param) == self.cursor_mode
+                or self.cursor_paginator.cursor_query_param in request.GET)
+
+    def paginate_queryset(self, queryset: QuerySet, request, view: Any = None) -> Optional[List[Any]]:
+        """
+        The paginate_queryset function overrides the method of the base class. Selects the paginator according
+        to the request parameters and returns the page of objects received from it.
+        """
+        if self.is_cursor_mode(request):
+            self.paginator = self.cursor_paginator
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data: Any) -> Response:
+        """
+        The get_paginated_response function overrides the method of the base class. Returns the Response object
+        formed by the paginator that processed the request.
+        """
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema: Any) -> Any:
+        """
+        The get_paginated_response_schema function overrides the method of the base class
+        and returns the response schema of the page number paginator.
+        """
+        return self.page_number_paginator.get_paginated_response_schema(schema)
+
+    def to_html(self) -> str:
+        """
+        The to_html function overrides the method of the base class and renders the pagination controls
+        of the paginator that processed the request.
+        """
+        return self.paginator.to_html()
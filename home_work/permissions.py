@@ -0,0 +1,43 @@
+from django.db.models import Model, Q
+from rest_framework.permissions import BasePermission
+
+EDITOR_ROLES = ["moderator", "admin"]
+
+
+class OwnerEditPermission(BasePermission):
+    """
+    The OwnerEditPermission class inherits from the BasePermission class from the permissions module
+    of the rest_framework library. Allows editing an object to the user referenced by its owner_field
+    and to the users with the role of administrator or moderator. The ownership is checked by the identifier
+    of the owner, so the owner is never loaded.
+    """
+    owner_field: str = "owner"
+
+    def is_editor(self, request) -> bool:
+        """
+        The is_editor function takes as an argument a request object. Returns True if the user has the role
+        of administrator or moderator, otherwise False.
+        """
+        return getattr(request.user, "role", None) in EDITOR_ROLES
+
+    def has_object_permission(self, request, view, obj: Model) -> bool:
+        """
+        The has_object_permission function overrides the method of the base class. Accepts as arguments
+        a request object, a view object, and a database object requested for editing.
+        Checks the user's access rights to the requested actions. Returns True if the test result
+        is positive, otherwise False.
+        """
+        if self.is_editor(request):
+            return True
+
+        return request.user.pk is not None and getattr(obj, f"{self.owner_field}_id") == request.user.pk
+
+    def get_edit_filter(self, request) -> Q:
+        """
+        The get_edit_filter function takes as an argument a request object. Returns the condition selecting
+        the objects the user is allowed to edit, so the check can be a part of the query writing them.
+        """
+        if self.is_editor(request):
+            return Q()
+
+        return Q(**{f"{self.owner_field}_id": request.user.pk}) if request.user.pk is not None else Q(pk__in=[])
@@ -38,6 +38,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'rest_framework.authtoken',
     'rest_framework_simplejwt',
@@ -138,8 +139,94 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+MEDIA_SENDFILE_BACKEND = os.environ.get('MEDIA_SENDFILE_BACKEND', '')
+MEDIA_ACCEL_REDIRECT_PREFIX = '/protected-media/'
+MEDIA_CACHE_MAX_AGE = 60 * 60 * 24 * 30
+
 TOTAL_ON_PAGE = 10
 
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+
+# The locmem backend keeps the ad list responses in the memory of each process, the file backend shares them
+# between the processes of the host. Either way the versions of the responses, bumped when the ads change,
+# are kept in the shared VERSION_CACHE_ALIAS backend, so no process serves the responses of an outdated version.
+ADS_LIST_CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'ads-list',
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(BASE_DIR, 'cache', 'ads_list'),
+    },
+}
+
+ADS_LIST_CACHE_ALIAS = 'ads_list'
+
+# The versions of the process-wide caches of the categories and the locations must be seen by all the processes,
+# so they are kept in a backend shared by the processes of the host, or by all the hosts if configured so.
+# The default file backend needs no server, but costs a read of a small file on every request reading
+# the categories or the locations; the redis backend keeps the versions in the memory shared by all the hosts
+# and requires the redis package.
+VERSION_CACHE_BACKENDS = {
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(BASE_DIR, 'cache', 'versions'),
+    },
+    'db': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'cache_versions',
+    },
+    'redis': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ.get('REDIS_URL', 'redis://127.0.0.1:6379/1'),
+    },
+}
+
+VERSION_CACHE_ALIAS = 'versions'
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    ADS_LIST_CACHE_ALIAS: {
+        **ADS_LIST_CACHE_BACKENDS[os.environ.get('ADS_LIST_CACHE_BACKEND', 'locmem')],
+        'TIMEOUT': 300,
+    },
+    VERSION_CACHE_ALIAS: {
+        **VERSION_CACHE_BACKENDS[os.environ.get('VERSION_CACHE_BACKEND', 'file')],
+        'TIMEOUT': None,
+    },
+}
+
+ADS_LIST_VERSION_CACHE_ALIAS = VERSION_CACHE_ALIAS
+
+CATEGORY_CACHE_ALIAS = VERSION_CACHE_ALIAS
+
+LOCATION_CACHE_ALIAS = VERSION_CACHE_ALIAS
+LOCATION_CACHE_SIZE = 1024
+
+ADS_NEAR_DEFAULT_RADIUS_KM = 10
+
+ADS_EXPORT_CHUNK_SIZE = 2000
+
+ADS_BULK_MAX_ITEMS = 500
+
+ADS_FACETS_PRICE_BUCKETS = [0, 1000, 5000, 10000, 50000, 100000]
+
+IMAGE_VARIANTS_WORKERS = 2
+IMAGE_VARIANTS_QUALITY = 80
+
+IMPORT_CSV_BATCH_SIZE = 10000
+
+USERS_BULK_MAX_ITEMS = 500
+USERS_IMPORT_CHUNK_SIZE = 1000
+PASSWORD_HASH_WORKERS = None
+
+SELECTION_ITEMS_PAGE_SIZE = 50
+SELECTION_ITEMS_CHANGE_MAX_ITEMS = 1000
+
 REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
@@ -0,0 +1,82 @@
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional, Tuple, Type
+
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from home_work.eager_loading import EagerLoadingMixin
+
+
+@lru_cache(maxsize=None)
+def get_serializer_field_names(serializer_class: Type[serializers.Serializer]) -> Tuple[str, ...]:
+    """
+    The get_serializer_field_names function takes as an argument a serializer class.
+    Returns a tuple of the names of all its fields in the order of display.
+    """
+    return tuple(serializer_class().fields)
+
+
+def get_field_names(params: Mapping[str, str], serializer_class: Type[serializers.Serializer],
+                    param: str = "fields") -> Optional[Tuple[str, ...]]:
+    """
+    The get_field_names function takes as arguments the query parameters of the request, a serializer class
+    and the name of the parameter listing the requested fields separated by commas. Returns a tuple of the names
+    of the requested fields in the order of display, or None if the parameter is missing or empty.
+    In case of an unknown field, raises a ValidationError exception from the rest_framework.exceptions module.
+    """
+    requested: set = {name.strip() for name in params.get(param, "").split(",") if name.strip()}
+    if not requested:
+        return None
+
+    available: Tuple[str, ...] = get_serializer_field_names(serializer_class)
+    unknown: set = requested.difference(available)
+    if unknown:
+        raise ValidationError({param: f"Unknown fields: {', '.join(sorted(unknown))}."})
+
+    return tuple(name for name in available if name in requested)
+
+
+class SparseFieldsSerializerMixin:
+    """
+    The SparseFieldsSerializerMixin class is a mixin for the serializers of the rest_framework library.
+    Displays only the fields listed in the serializer context under the key of the sparse_fields_context_key
+    attribute, or all the fields if there is no such list. A nested serializer reads the context of the root one,
+    so it is given its own key.
+    """
+    sparse_fields_context_key: str = "fields"
+
+    def get_fields(self) -> Dict[str, serializers.Field]:
+        """
+        The get_fields function overrides the method of the parent class. Returns the dictionary of the fields
+        of the serializer restricted to the requested ones.
+        """
+        fields: Dict[str, serializers.Field] = super().get_fields()
+        field_names: Optional[Tuple[str, ...]] = self.context.get(self.sparse_fields_context_key)
+        if field_names is None:
+            return fields
+        return {name: field for name, field in fields.items() if name in field_names}
+
+
+class SparseFieldsMixin(EagerLoadingMixin):
+    """
+    The SparseFieldsMixin class inherits from the EagerLoadingMixin class and is a mixin for the generic views
+    of the rest_framework library. Restricts both the displayed fields and the loaded columns to the fields listed
+    in the fields query parameter, so the clients needing a few fields get smaller responses and narrower queries.
+    """
+    sparse_fields_param: str = "fields"
+
+    def get_field_names(self) -> Optional[Tuple[str, ...]]:
+        """
+        The get_field_names function overrides the method of the parent class. Returns a tuple of the names
+        of the fields requested by the query parameter, or None to display all the fields.
+        """
+        return get_field_names(self.request.query_params, self.get_serializer_class(), self.sparse_fields_param)
+
+    def get_serializer_context(self) -> Dict[str, Any]:
+        """
+        The get_serializer_context function overrides the method of the parent class. Adds the names
+        of the requested fields to the context of the serializer.
+        """
+        context: Dict[str, Any] = super().get_serializer_context()
+        context[SparseFieldsSerializerMixin.sparse_fields_context_key] = self.get_field_names()
+        return context
@@ -15,13 +15,12 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
-from django.conf.urls.static import static
 from rest_framework import routers
 
+from ads.views import AdMediaView
 from author.views import LocationViewSet
 from categories.views import CategoryViewSet
 from home_work import settings
-from home_work.settings import MEDIA_ROOT
 
 
 router = routers.SimpleRouter()
@@ -34,12 +33,8 @@ urlpatterns = [
     path('ad/', include('ads.urls')),
     path('selection/', include('selection.urls')),
     path('user/', include('author.urls')),
+    path('async/', include('home_work.async_urls')),
+    path(settings.MEDIA_URL.lstrip('/') + '<path:path>', AdMediaView.as_view()),
 ]
 
 urlpatterns += router.urls
-
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=MEDIA_ROOT)
-
-
-
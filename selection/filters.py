@@ -0,0 +1,32 @@
+from typing import Mapping
+
+from django.db.models import QuerySet
+from rest_framework.exceptions import NotAuthenticated, ValidationError
+
+from selection.models import Selection
+
+
+def filter_selections(queryset: QuerySet[Selection], params: Mapping[str, str], user) -> QuerySet[Selection]:
+    """
+    The filter_selections function takes as arguments a queryset of selections, the query parameters of the request
+    and the user of the request. Implements the search of the selections by owner, given by the identifier
+    of the owner or by the value 'me' for the selections of the user. Returns the filtered queryset.
+    In case of an incorrect owner, raises a ValidationError exception, in case of the value 'me'
+    of an anonymous user, a NotAuthenticated exception from the rest_framework.exceptions module.
+    """
+    owner_req: str = params.get('owner', None)
+    if owner_req:
+        if owner_req == "me":
+            if user.pk is None:
+                raise NotAuthenticated()
+            owner_id: int = user.pk
+        else:
+            try:
+                owner_id = int(owner_req)
+            except ValueError:
+                raise ValidationError({"owner": "The value must be an identifier of a user or 'me'."})
+        queryset = queryset.filter(
+            owner_id=owner_id
+        )
+
+    return queryset
@@ -0,0 +1,38 @@
+from typing import List
+
+from django.db import connection
+
+from ads.models import Ad
+from selection.models import Selection
+
+
+def add_items(selection_id: int, ad_ids: List[int]) -> int:
+    """
+    The add_items function takes as arguments the identifier of a selection and the list of the identifiers
+    of the ads. Adds the existing ads missing from the selection with a single INSERT ... SELECT ... ON CONFLICT
+    DO NOTHING statement, so the ads already in the selection and the unknown identifiers are skipped.
+    Returns the number of the added ads.
+    """
+    through = Selection.items.through
+    quote_name = connection.ops.quote_name
+    selection_column: str = quote_name(through._meta.get_field("selection").column)
+    ad_column: str = quote_name(through._meta.get_field("ad").column)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {quote_name(through._meta.db_table)} ({selection_column}, {ad_column}) "
+            f"SELECT %s, {quote_name('id')} FROM {quote_name(Ad._meta.db_table)} "
+            f"WHERE {quote_name('id')} = ANY(%s) "
+            f"ON CONFLICT ({selection_column}, {ad_column}) DO NOTHING",
+            [selection_id, list(set(ad_ids))]
+        )
+        return cursor.rowcount
+
+
+def remove_items(selection_id: int, ad_ids: List[int]) -> int:
+    """
+    The remove_items function takes as arguments the identifier of a selection and the list of the identifiers
+    of the ads. Removes the ads from the selection with a single DELETE statement. Returns the number
+    of the removed ads.
+    """
+    deleted, _ = Selection.items.through.objects.filter(selection_id=selection_id, ad_id__in=ad_ids).delete()
+    return deleted
@@ -0,0 +1,20 @@
+# Generated by Django 4.1.7 on 2026-10-17 19:10
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('selection', '0002_alter_selection_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='selection',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.1.7 on 2026-10-17 19:30
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('selection', '0003_selection_updated_at'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='selection',
+            options={'ordering': ['owner', 'id'], 'verbose_name': 'Пользовательская выборка объявлений', 'verbose_name_plural': 'Пользовательские выборки объявлений'},
+        ),
+        migrations.AddIndex(
+            model_name='selection',
+            index=models.Index(fields=['owner', 'id'], name='selection_owner_id_idx'),
+        ),
+        migrations.AlterField(
+            model_name='selection',
+            name='owner',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.1.7 on 2026-10-17 19:39
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('selection', '0004_owner_id_index'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='selection',
+            options={'ordering': ['owner_id', 'id'], 'verbose_name': 'Пользовательская выборка объявлений', 'verbose_name_plural': 'Пользовательские выборки объявлений'},
+        ),
+    ]
@@ -10,21 +10,27 @@ class Selection(models.Model):
     """
     The Selection class is an inheritor of the Model class from the django.db.models library.
     This is the data model contained in the selection database table. Contains the description
-    of the types and constraints of the fields of the base model.
+    of the types and constraints of the fields of the base model. The selections of an owner are read
+    in the order of their identifiers through the index of both columns.
     """
     name = models.CharField(max_length=50)
-    owner = models.ForeignKey(User, on_delete=models.CASCADE)
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, db_index=False)
     items = models.ManyToManyField(Ad)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         """
         The Meta class is used to change the behavior of model fields,
         such as verbose_name - a human-readable model name
-        and ordering to change the order of output of model instances.
+        ordering to change the order of output of model instances
+        and indexes to declare the database indexes of the table.
         """
         verbose_name: str = 'Пользовательская выборка объявлений'
         verbose_name_plural: str = 'Пользовательские выборки объявлений'
-        ordering: List[str] = ["owner"]
+        ordering: List[str] = ["owner_id", "id"]
+        indexes: List[models.Index] = [
+            models.Index(fields=["owner", "id"], name="selection_owner_id_idx"),
+        ]
 
     def __str__(self) -> str:
         """
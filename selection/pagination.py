@@ -0,0 +1,34 @@
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from rest_framework.pagination import Cursor
+
+from ads.models import Ad
+from home_work.pagination import IdCursorPagination
+
+
+class SelectionItemsPagination(IdCursorPagination):
+    """
+    The SelectionItemsPagination class inherits from the IdCursorPagination class. Paginates the ads of a selection
+    by their identifiers with the number of the ads per page set by the SELECTION_ITEMS_PAGE_SIZE setting.
+    The first page is also displayed by the selection detail views, with a link to the next page.
+    """
+    def get_page_size(self, request) -> int:
+        """
+        The get_page_size function overrides the method of the parent class. Returns the number of the ads per page.
+        """
+        return settings.SELECTION_ITEMS_PAGE_SIZE
+
+    def get_first_page(self, items: List[Ad], base_url: str) -> Tuple[List[Ad], Optional[str]]:
+        """
+        The get_first_page function takes as arguments the list of the first ads of a selection, loaded with one ad
+        more than a page, and the address of the list of the ads of the selection. Returns a tuple of the ads
+        of the first page and the link to the next page, or None if there is no next page.
+        """
+        page_size: int = self.get_page_size(None)
+        if len(items) <= page_size:
+            return items, None
+
+        self.base_url = base_url
+        return items[:page_size], self.encode_cursor(Cursor(offset=0, reverse=False,
+                                                            position=str(items[page_size - 1].id)))
@@ -1,23 +1,10 @@
-from rest_framework.permissions import BasePermission
+from home_work.permissions import OwnerEditPermission
 
-from selection.models import Selection
 
-
-class SelectionEditPermission(BasePermission):
+class SelectionEditPermission(OwnerEditPermission):
     """
-    The SelectionEditPermission class inherits from the BasePermission class from the permissions module
-    of the rest_framework library. Controls access to protected endpoints.
+    The SelectionEditPermission class inherits from the OwnerEditPermission class. Controls access to protected
+    endpoints: the selections are edited only by their owners and users with the role of administrator or moderator.
     """
     message: str = "Only owners, administrators, and moderators are allowed to edit the selection."
-
-    def has_object_permission(self, request, view, obj: Selection) -> bool:
-        """
-        The has_object_permission function overrides the method of the base class. Accepts as arguments
-        a request object, a view object, and a database object requested for editing.
-        Checks the user's access rights to the requested actions. Returns True if the test result
-        is positive, otherwise False.
-        """
-        if bool(request.user and (request.user.role in ["moderator", "admin"])):
-            return True
-
-        return obj.owner == request.user
+    owner_field: str = "owner"
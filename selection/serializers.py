@@ -1,19 +1,25 @@
-from typing import List
+from typing import Any, List, Optional, Tuple
 
+from django.conf import settings
 from django.db.models import Model
 from rest_framework import serializers, request
 
 from ads.models import Ad
+from ads.serializers import AdImageVariantsField, PublishedStatusField
 from author.models import User
+from home_work.sparse_fields import SparseFieldsSerializerMixin
 from selection.models import Selection
 
+ITEMS_CONTEXT_KEY: str = "selection_items"
 
-class SelectionListSerializer(serializers.ModelSerializer):
+
+class SelectionListSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """
     The SelectionListSerializer class inherits from the serializer class.ModelSerializer is a class for convenient
     serialization and deserialization of objects of the Selection class when processing GET requests
-    at the address '/selection/'.
+    at the address '/selection/'. Displays the number of the ads of the selection, annotated by the view.
     """
+    items_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         """
@@ -21,15 +27,18 @@ class SelectionListSerializer(serializers.ModelSerializer):
         defines the necessary parameters for the serializer to function.
         """
         model: Model = Selection
-        fields: List[str] = ["id", "name"]
+        fields: List[str] = ["id", "name", "items_count"]
 
 
-class AdForSelectionSerializer(serializers.ModelSerializer):
+class AdForSelectionSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """
     The Ad For Selection serializer class inherits from the serializer class.ModelSerializer is a class for convenient
     serialization and deserialization of Ad class objects for comfortable data display when
-    displaying detailed information in ad samples.
+    displaying detailed information in ad samples. Displays the fields listed in the item_fields query parameter.
     """
+    sparse_fields_context_key: str = "item_fields"
+    is_published = PublishedStatusField(read_only=True)
+    images = AdImageVariantsField()
 
     class Meta:
         """
@@ -37,16 +46,65 @@ class AdForSelectionSerializer(serializers.ModelSerializer):
         defines the necessary parameters for the serializer to function.
         """
         model: Model = Ad
-        fields: str = '__all__'
+        fields: List[str] = ["id", "name", "author", "price", "description", "is_published", "image", "images",
+                             "category"]
 
 
-class SelectionDetailSerializer(serializers.ModelSerializer):
+class SelectionItemsField(serializers.Field):
+    """
+    The SelectionItemsField class inherits from the Field class from the rest_framework serializers module.
+    Displays the first page of the ads of the selection, loaded by the view and passed in the serializer context,
+    or all the ads of the selection if the context has no page. Reads no columns of the selection.
+    """
+    model_fields: Tuple[str, ...] = ()
+
+    def __init__(self, **kwargs: Any) -> None:
+        """
+        The __init__ function overrides the method of the parent class. Makes the field read-only
+        and built from the whole selection.
+        """
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def get_page(self, selection: Selection) -> Tuple[List[Ad], Optional[str]]:
+        """
+        The get_page function takes as an argument the selection. Returns a tuple of its displayed ads
+        and the link to their next page.
+        """
+        page: Optional[Tuple[List[Ad], Optional[str]]] = self.context.get(ITEMS_CONTEXT_KEY)
+        return page if page is not None else (list(selection.items.order_by("id")), None)
+
+    def to_representation(self, selection: Selection) -> List[Any]:
+        """
+        The to_representation function overrides the method of the parent class. Returns the list
+        of the serialized ads of the page.
+        """
+        return AdForSelectionSerializer(self.get_page(selection)[0], many=True, context=self.context).data
+
+
+class SelectionItemsNextField(SelectionItemsField):
+    """
+    The SelectionItemsNextField class inherits from the SelectionItemsField class. Displays the link
+    to the next page of the ads of the selection at the address '/selection/<int: pk>/items/'.
+    """
+    def to_representation(self, selection: Selection) -> Optional[str]:
+        """
+        The to_representation function overrides the method of the parent class. Returns the link
+        to the next page, or None if all the ads are displayed.
+        """
+        return self.get_page(selection)[1]
+
+
+class SelectionDetailSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """
     The SelectionDetailSerializer class inherits from the serializer class.ModelSerializer is a class for convenient
     serialization and deserialization of objects of the Selection class when processing GET requests
-    at the address '/selection/<int: pk>/'. Overrides the value of the items field for comfortable display.
+    at the address '/selection/<int: pk>/'. Displays the first page of the ads of the selection
+    and the link to the next one.
     """
-    items = AdForSelectionSerializer(many=True, read_only=True)
+    items = SelectionItemsField()
+    items_next = SelectionItemsNextField()
 
     class Meta:
         """
@@ -54,7 +112,7 @@ class SelectionDetailSerializer(serializers.ModelSerializer):
         defines the necessary parameters for the serializer to function.
         """
         model: Model = Selection
-        fields: str = '__all__'
+        exclude: List[str] = ["updated_at"]
 
 
 class SelectionCreateSerializer(serializers.ModelSerializer):
@@ -77,7 +135,7 @@ class SelectionCreateSerializer(serializers.ModelSerializer):
         defines the necessary parameters for the serializer to function.
         """
         model: Model = Selection
-        fields: str = '__all__'
+        exclude: List[str] = ["updated_at"]
 
 
 class SelectionUpdateSerializer(serializers.ModelSerializer):
@@ -94,7 +152,7 @@ class SelectionUpdateSerializer(serializers.ModelSerializer):
         defines the necessary parameters for the serializer to function.
         """
         model: Model = Selection
-        fields: str = '__all__'
+        exclude: List[str] = ["updated_at"]
 
 
 class SelectionDeleteSerializer(serializers.ModelSerializer):
@@ -111,3 +169,16 @@ class SelectionDeleteSerializer(serializers.ModelSerializer):
         """
         model: Model = Selection
         fields: List[str] = ["id"]
+
+
+class SelectionItemsChangeSerializer(serializers.Serializer):
+    """
+    The SelectionItemsChangeSerializer class inherits from the Serializer class from the rest_framework serializers
+    module and validates the identifiers of the ads of the POST requests at the addresses
+    '/selection/<int: pk>/items/add/' and '/selection/<int: pk>/items/remove/'.
+    """
+    items = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=settings.SELECTION_ITEMS_CHANGE_MAX_ITEMS
+    )
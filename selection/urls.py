@@ -1,13 +1,16 @@
 from django.urls import path
 
 from selection.views import SelectionListView, SelectionDetailView, SelectionCreateView, SelectionUpdateView, \
-    SelectionDeleteView
+    SelectionDeleteView, SelectionItemsView, SelectionItemsAddView, SelectionItemsRemoveView
 
 
 urlpatterns = [
     path('', SelectionListView.as_view()),
     path('create/', SelectionCreateView.as_view()),
     path('<int:pk>/', SelectionDetailView.as_view()),
+    path('<int:pk>/items/', SelectionItemsView.as_view()),
+    path('<int:pk>/items/add/', SelectionItemsAddView.as_view()),
+    path('<int:pk>/items/remove/', SelectionItemsRemoveView.as_view()),
     path('<int:pk>/update/', SelectionUpdateView.as_view()),
     path('<int:pk>/delete/', SelectionDeleteView.as_view()),
 ]
@@ -1,33 +1,196 @@
-from typing import List
+from typing import Any, Callable, List, Dict, Optional, Tuple
 
-from django.db.models import QuerySet
-from rest_framework.generics import ListAPIView, RetrieveAPIView, CreateAPIView, UpdateAPIView, DestroyAPIView
+from django.conf import settings
+from django.db import transaction
+from django.db.models import QuerySet, Aggregate, Max, Count
+from django.http import HttpResponse
+from django.utils import timezone
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.generics import GenericAPIView, ListAPIView, RetrieveAPIView, CreateAPIView, UpdateAPIView, \
+    DestroyAPIView
+from rest_framework.pagination import BasePagination
 from rest_framework.permissions import IsAuthenticated, BasePermission
-from rest_framework.serializers import ModelSerializer
+from rest_framework.response import Response
+from rest_framework.serializers import ModelSerializer, Serializer
+from rest_framework.utils.urls import replace_query_param
 
+from ads.models import Ad
+from home_work.async_views import AsyncRetrieveView
+from home_work.conditional import ConditionalRetrieveMixin
+from home_work.eager_loading import setup_eager_loading
+from home_work.fast_serialization import FastListMixin
+from home_work.guarded_writes import GuardedUpdateMixin, GuardedDestroyMixin, GuardedWriteMixin
+from home_work.pagination import OptionalCursorPagination
+from home_work.sparse_fields import SparseFieldsMixin, get_field_names
+from selection.filters import filter_selections
+from selection.items import add_items, remove_items
 from selection.models import Selection
+from selection.pagination import SelectionItemsPagination
 from selection.permissions import SelectionEditPermission
 from selection.serializers import SelectionListSerializer, SelectionDetailSerializer, SelectionCreateSerializer, \
-    SelectionUpdateSerializer, SelectionDeleteSerializer
+    SelectionUpdateSerializer, SelectionDeleteSerializer, AdForSelectionSerializer, SelectionItemsChangeSerializer, \
+    ITEMS_CONTEXT_KEY
 
 
-class SelectionListView(ListAPIView):
+class SelectionItemsMixin:
+    """
+    The SelectionItemsMixin class is a mixin for the views displaying the ads of a selection. Loads the ads
+    in the order of their identifiers, restricting both the displayed fields of the ads and the loaded columns
+    to the fields listed in the item_fields query parameter. The detail views load only the first page of the ads,
+    with one query, and link the next one at the address '/selection/<int: pk>/items/'.
+    """
+    item_fields_param: str = "item_fields"
+    items_page: Optional[Tuple[List[Ad], Optional[str]]] = None
+
+    def get_item_field_names(self) -> Optional[Tuple[str, ...]]:
+        """
+        The get_item_field_names function returns a tuple of the names of the fields of the ads requested
+        by the query parameter, or None to display all the fields.
+        """
+        return get_field_names(self.request.GET, AdForSelectionSerializer, self.item_fields_param)
+
+    def get_items_queryset(self, pk: int) -> QuerySet[Ad]:
+        """
+        The get_items_queryset function takes as an argument the identifier of a selection. Returns the queryset
+        of its ads ordered by identifier, loading the requested fields.
+        """
+        return setup_eager_loading(Ad.objects.filter(selection=pk).order_by("id"), AdForSelectionSerializer,
+                                   self.get_item_field_names())
+
+    def get_items_url(self, pk: int) -> str:
+        """
+        The get_items_url function takes as an argument the identifier of a selection. Returns the absolute
+        address of the list of its ads, keeping the requested fields of the ads.
+        """
+        url: str = self.request.build_absolute_uri(f"/selection/{pk}/items/")
+        item_fields: Optional[str] = self.request.GET.get(self.item_fields_param)
+        return replace_query_param(url, self.item_fields_param, item_fields) if item_fields else url
+
+    def get_items_page(self, pk: int) -> Tuple[List[Ad], Optional[str]]:
+        """
+        The get_items_page function takes as an argument the identifier of a selection. Loads its first ads with
+        one query. Returns a tuple of the ads of the first page and the link to the next page.
+        """
+        items: List[Ad] = list(self.get_items_queryset(pk)[:settings.SELECTION_ITEMS_PAGE_SIZE + 1])
+        return SelectionItemsPagination().get_first_page(items, self.get_items_url(pk))
+
+    async def aget_items_page(self, pk: int) -> Tuple[List[Ad], Optional[str]]:
+        """
+        The aget_items_page function is the asynchronous version of the get_items_page function.
+        """
+        items: List[Ad] = [
+            ad async for ad in self.get_items_queryset(pk)[:settings.SELECTION_ITEMS_PAGE_SIZE + 1]
+        ]
+        return SelectionItemsPagination().get_first_page(items, self.get_items_url(pk))
+
+    def get_serializer_context(self) -> Dict[str, Any]:
+        """
+        The get_serializer_context function overrides the method of the parent class. Adds the names
+        of the requested fields of the ads and the loaded page of the ads to the context of the serializer.
+        """
+        context: Dict[str, Any] = super().get_serializer_context()
+        context[AdForSelectionSerializer.sparse_fields_context_key] = self.get_item_field_names()
+        if self.items_page is not None:
+            context[ITEMS_CONTEXT_KEY] = self.items_page
+        return context
+
+
+class SelectionListView(SparseFieldsMixin, FastListMixin, ListAPIView):
     """
     The Abslistview class inherits from the Listview class from the rest_framework module generics
     and is a class-based representation for processing requests by the GET method at the address '/ad/'.
+    Implements the search of the selections by owner with the owner query parameter, 'me' for the selections
+    of the user, and counts the ads of every selection in the query loading the page.
     """
     queryset: QuerySet[Selection] = Selection.objects.all()
     serializer_class: ModelSerializer = SelectionListSerializer
+    pagination_class: BasePagination = OptionalCursorPagination
+    fast_list: bool = True
+
+    def get_queryset(self) -> QuerySet[Selection]:
+        """
+        The get_queryset function overrides the method of the parent class. Returns the queryset of the selections
+        of the requested owner annotated with the numbers of their ads, ordered explicitly as the ordering
+        of the model is not applied to the grouped queries.
+        """
+        queryset: QuerySet[Selection] = filter_selections(super().get_queryset(), self.request.GET, self.request.user)
+        field_names: Optional[Tuple[str, ...]] = self.get_field_names()
+        if field_names is None or "items_count" in field_names:
+            queryset = queryset.annotate(items_count=Count("items")).order_by(*Selection._meta.ordering)
+        return queryset
 
 
-class SelectionDetailView(RetrieveAPIView):
+class SelectionDetailView(ConditionalRetrieveMixin, SelectionItemsMixin, SparseFieldsMixin, RetrieveAPIView):
     """
     The AdDetailView class inherits from the RetrieveAPIView class from the rest_framework generic module and is
     a class-based view for processing requests with GET methods at the address '/ad/<int: pk>'.
+    Answers the conditional requests of a selection with unchanged ads with the status 304.
     """
     queryset: QuerySet[Selection] = Selection.objects.all()
     serializer_class: ModelSerializer = SelectionDetailSerializer
     permission_classes: List[BasePermission] = [IsAuthenticated]
+    conditional_aggregates: Dict[str, Aggregate] = {
+        "updated_at": Max("updated_at"),
+        "items_updated_at": Max("items__updated_at"),
+        "items_count": Count("items"),
+    }
+
+    def get_object(self) -> Selection:
+        """
+        The get_object function overrides the method of the parent class. Loads the first page
+        of the ads of the returned selection.
+        """
+        selection: Selection = super().get_object()
+        self.items_page = self.get_items_page(selection.pk)
+        return selection
+
+
+class SelectionDetailAsyncView(SelectionItemsMixin, AsyncRetrieveView):
+    """
+    The SelectionDetailAsyncView class inherits from the AsyncRetrieveView class and is an asynchronous class-based
+    view for processing requests with GET methods at the address '/async/selection/<int: pk>/'. Displays the same
+    data and validators as the SelectionDetailView class. The endpoint is available only to authenticated users.
+    """
+    queryset: QuerySet[Selection] = Selection.objects.all()
+    serializer_class: ModelSerializer = SelectionDetailSerializer
+    permission_classes: List[BasePermission] = [IsAuthenticated]
+    conditional_aggregates: Dict[str, Aggregate] = SelectionDetailView.conditional_aggregates
+
+    async def get(self, request, pk: int, *args: Any, **kwargs: Any) -> HttpResponse:
+        """
+        The get function overrides the method of the parent class. Loads the first page of the ads
+        of the selection before calling the method of the parent class.
+        """
+        self.items_page = await self.aget_items_page(pk)
+        return await super().get(request, pk, *args, **kwargs)
+
+
+class SelectionItemsView(SelectionItemsMixin, ListAPIView):
+    """
+    The SelectionItemsView class inherits from the ListAPIView class from the rest_framework generic module and is
+    a class-based view for processing requests with GET methods at the address '/selection/<int: pk>/items/'.
+    Displays the ads of a selection by pages with cursors, for the selections too large for their detail page.
+    The endpoint is available only to authenticated users.
+    """
+    serializer_class: ModelSerializer = AdForSelectionSerializer
+    pagination_class: BasePagination = SelectionItemsPagination
+    permission_classes: List[BasePermission] = [IsAuthenticated]
+
+    def get_queryset(self) -> QuerySet[Ad]:
+        """
+        The get_queryset function overrides the method of the parent class. Returns the queryset
+        of the ads of the selection.
+        """
+        return self.get_items_queryset(self.kwargs["pk"])
+
+    def list(self, request, *args: Any, **kwargs: Any) -> Response:
+        """
+        The list function overrides the method of the parent class. If the selection does not exist,
+        raises a NotFound exception from the rest_framework.exceptions module.
+        """
+        if not Selection.objects.filter(pk=self.kwargs["pk"]).exists():
+            raise NotFound()
+        return super().list(request, *args, **kwargs)
 
 
 class SelectionCreateView(CreateAPIView):
@@ -40,7 +203,7 @@ class SelectionCreateView(CreateAPIView):
     permission_classes: List[BasePermission] = [IsAuthenticated]
 
 
-class SelectionUpdateView(UpdateAPIView):
+class SelectionUpdateView(GuardedUpdateMixin, UpdateAPIView):
     """
     The AdUpdateView class inherits from the UpdateAPIView class from the rest_framework generic module and is
     a class-based view for processing requests with PATCH methods at the address '/ad/<int:pk>/update/'.
@@ -48,9 +211,10 @@ class SelectionUpdateView(UpdateAPIView):
     queryset: QuerySet[Selection] = Selection.objects.all()
     serializer_class: ModelSerializer = SelectionUpdateSerializer
     permission_classes: List[BasePermission] = [SelectionEditPermission]
+    guarded_update_fields: Tuple[str, ...] = ("name", "owner")
 
 
-class SelectionDeleteView(DestroyAPIView):
+class SelectionDeleteView(GuardedDestroyMixin, DestroyAPIView):
     """
     The AdDeleteView class inherits from the DestroyAPIView class from the rest_framework generic module and is
     a class-based view for processing requests with DELETE methods at the address '/ad/int:pk>/delete/'.
@@ -58,3 +222,62 @@ class SelectionDeleteView(DestroyAPIView):
     queryset: QuerySet[Selection] = Selection.objects.all()
     serializer_class: ModelSerializer = SelectionDeleteSerializer
     permission_classes: List[BasePermission] = [SelectionEditPermission]
+
+
+class SelectionItemsChangeView(GuardedWriteMixin, GenericAPIView):
+    """
+    The SelectionItemsChangeView class inherits from the GenericAPIView class from the rest_framework generic module
+    and is the base class of the views adding and removing the ads of a selection by POST requests with a list
+    of their identifiers, without rewriting the other ads of the selection. The right to edit the selection
+    is checked by the UPDATE statement marking it as changed, which also serializes the concurrent changes.
+    The subclasses set the function writing the change and returning the number of the changed ads
+    as the writer attribute. The endpoints are available only to the owner of the selection and users
+    with the role of administrator or moderator.
+    """
+    queryset: QuerySet[Selection] = Selection.objects.all()
+    serializer_class: Serializer = SelectionItemsChangeSerializer
+    permission_classes: List[BasePermission] = [SelectionEditPermission]
+    result_key: str = ""
+    writer: Callable[[int, List[int]], int]
+
+    def post(self, request, *args: Any, **kwargs: Any) -> Response:
+        """
+        The post function is intended for processing POST requests. Accepts the request object with the list
+        of the identifiers of the ads and any other positional and named parameters as arguments. Returns
+        a Response object with the number of the changed ads. If the selection does not exist or may not be
+        edited by the user, raises a NotFound or PermissionDenied exception, even if the data is invalid.
+        """
+        permission: SelectionEditPermission = self.get_edit_permission()
+        queryset: QuerySet[Selection] = self.get_lookup_queryset()
+        serializer: Serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            if not queryset.filter(permission.get_edit_filter(request)).exists():
+                self.write_refused(queryset, permission)
+            raise ValidationError(serializer.errors)
+
+        with transaction.atomic():
+            if not queryset.filter(permission.get_edit_filter(request)).update(updated_at=timezone.now()):
+                self.write_refused(queryset, permission)
+            changed: int = self.writer(self.kwargs["pk"], serializer.validated_data["items"])
+
+        return Response({self.result_key: changed})
+
+
+class SelectionItemsAddView(SelectionItemsChangeView):
+    """
+    The SelectionItemsAddView class inherits from the SelectionItemsChangeView class and is a class-based view
+    for processing requests with POST methods at the address '/selection/<int: pk>/items/add/'.
+    Adds the ads missing from the selection with one INSERT statement.
+    """
+    result_key: str = "added"
+    writer: Callable[[int, List[int]], int] = staticmethod(add_items)
+
+
+class SelectionItemsRemoveView(SelectionItemsChangeView):
+    """
+    The SelectionItemsRemoveView class inherits from the SelectionItemsChangeView class and is a class-based view
+    for processing requests with POST methods at the address '/selection/<int: pk>/items/remove/'.
+    Removes the ads from the selection with one DELETE statement.
+    """
+    result_key: str = "removed"
+    writer: Callable[[int, List[int]], int] = staticmethod(remove_items)
@@ -10,7 +10,7 @@ class UserFactory(factory.django.DjangoModelFactory):
     The UserFactory class is a factory for creating test instances corresponding to the User model in order
     to verify the correct functioning of the application.
     """
-    username: str = factory.Faker("user_name")
+    username: str = factory.Sequence(lambda n: f"author_{n}")
     password: str = "1234"
     email: str = factory.Faker("email")
 
@@ -28,7 +28,7 @@ class CategoryFactory(factory.django.DjangoModelFactory):
     in order to verify the correct functioning of the application.
     """
     name: str = factory.Faker("user_name")
-    slug: str = factory.Faker("text", max_nb_chars=10)
+    slug: str = factory.Sequence(lambda n: f"slug{n:06d}")
 
     class Meta:
         """
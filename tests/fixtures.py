@@ -1,4 +1,8 @@
+from typing import Callable
+
 import pytest
+from django.core.cache import caches
+from django.db import connection
 
 
 @pytest.fixture
@@ -27,4 +31,40 @@ def hr_token(client, django_user_model) -> str:
         format="json"
     )
 
-    return response.data["access"]
\ No newline at end of file
+    return response.data["access"]
+
+
+@pytest.fixture
+def media_root(settings, tmp_path) -> None:
+    """
+    The media_root function is a fixture that replaces the MEDIA_ROOT setting with a temporary directory
+    and disables the handing of the transfers to the front server.
+    """
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.MEDIA_SENDFILE_BACKEND = ""
+
+
+@pytest.fixture
+def run_commit_callbacks() -> Callable[[], None]:
+    """
+    The run_commit_callbacks function is a fixture that returns a function running and clearing the callbacks
+    registered to be run after the commit of the transaction of the test, as if the changes made so far
+    were committed.
+    """
+    def run() -> None:
+        callbacks = connection.run_on_commit
+        connection.run_on_commit = []
+        for _, callback in callbacks:
+            callback()
+
+    return run
+
+
+@pytest.fixture(autouse=True)
+def clear_caches() -> None:
+    """
+    The clear_caches function is a fixture that clears all configured caches before each test,
+    so that the responses cached by one test are not served to another.
+    """
+    for cache in caches.all():
+        cache.clear()
@@ -0,0 +1,75 @@
+from typing import Dict, Any, List
+
+import pytest
+from rest_framework.exceptions import ErrorDetail
+
+from ads.models import Ad
+from author.models import User
+from categories.models import Category
+from tests.factories import AdFactory
+
+
+@pytest.mark.django_db
+def test_bulk_ads(client, hr_token: str, category: Category, django_assert_num_queries,
+                  run_commit_callbacks) -> None:
+    """
+    The test_bulk_ads function is designed to check the functioning when sending a POST request to the application
+    at /ad/bulk/ with valid data. Accepts as arguments the test client client, the hr_token fixture, the category
+    object from the Category factory, the django_assert_num_queries fixture and the run_commit_callbacks fixture.
+    Checks that the ads are created and updated with a number of queries independent of the number of ads.
+    """
+    user: User = User.objects.get(username="test_user")
+    own_ads: List[Ad] = AdFactory.create_batch(2, author=user)
+    run_commit_callbacks()
+    data: List[Dict[str, Any]] = [
+        {"name": f"test bulk ad {number}", "author": "test_user", "price": number, "category": category.name}
+        for number in range(20)
+    ] + [{"id": ad.id, "price": 500, "category": category.name} for ad in own_ads]
+
+    with django_assert_num_queries(8):
+        response = client.post(
+            "/ad/bulk/",
+            data,
+            content_type="application/json",
+            HTTP_AUTHORIZATION="Bearer " + hr_token
+        )
+
+    assert response.status_code == 201
+    assert len(response.data) == 22
+    assert response.data[0]["author"] == "test_user"
+    assert Ad.objects.filter(category=category, name__startswith="test bulk ad").count() == 20
+    assert set(Ad.objects.filter(id__in=[ad.id for ad in own_ads]).values_list("price", flat=True)) == {500}
+
+
+@pytest.mark.django_db
+def test_bulk_ads_item_errors(client, hr_token: str, ad: Ad, category: Category) -> None:
+    """
+    The test_bulk_ads_item_errors function is designed to check the functioning when sending a POST request
+    to the application at /ad/bulk/ with invalid items. Accepts as arguments the test client client,
+    the hr_token fixture, the ad object of another user from the Ad factory and the category object from
+    the Category factory. Checks that the errors are reported by items, that the images are not changed in bulk
+    and nothing is saved.
+    """
+    own_ad: Ad = AdFactory.create(author=User.objects.get(username="test_user"))
+    data: List[Dict[str, Any]] = [
+        {"name": "test bulk ad 1", "author": "test_user", "price": 10, "category": category.name},
+        {"name": "test bulk ad 2", "author": "unknown", "price": 10, "category": category.name},
+        {"id": ad.id, "price": 10},
+        {"id": own_ad.id, "image": "images/other.jpg"},
+    ]
+
+    response = client.post(
+        "/ad/bulk/",
+        data,
+        content_type="application/json",
+        HTTP_AUTHORIZATION="Bearer " + hr_token
+    )
+
+    assert response.status_code == 400
+    assert response.data["errors"] == [
+        {},
+        {"author": [ErrorDetail(string="Object with username=unknown does not exist.", code="does_not_exist")]},
+        {"detail": "Only owners, administrators, and moderators are allowed to edit the ad."},
+        {"image": [f"The image is changed at the address '/ad/{own_ad.id}/update/'."]},
+    ]
+    assert not Ad.objects.filter(name__startswith="test bulk ad").exists()
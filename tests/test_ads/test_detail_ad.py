@@ -22,7 +22,8 @@ def test_detail_ad(client, ad: Ad, hr_token: str) -> None:
         "price": "100",
         "is_published": "FALSE",
         "category": ad.category.name,
-        'image': None
+        'image': None,
+        'images': None
     }
 
     response = client.get(
@@ -50,3 +51,71 @@ def test_detail_ad_with_out_token(client, ad: Ad) -> None:
             string='Authentication credentials were not provided.',
             code='not_authenticated'
         )}
+
+
+@pytest.mark.django_db
+def test_detail_ad_not_modified(client, ad: Ad, hr_token: str, django_assert_num_queries) -> None:
+    """
+    The test_detail_ad_not_modified function is designed to check the conditional GET requests to the application
+    at /ad/<int: pk>/. It takes as arguments the test client client, the ad object from the Ad factory,
+    the hr_token fixture and the django_assert_num_queries fixture. Checks that a request with the ETag
+    of an unchanged ad is answered with the status 304 without loading the ad, and that changing the category
+    of the ad changes the ETag.
+    """
+    response = client.get(f"/ad/{ad.pk}/", HTTP_AUTHORIZATION="Bearer " + hr_token)
+
+    with django_assert_num_queries(2):
+        not_modified_response = client.get(
+            f"/ad/{ad.pk}/",
+            HTTP_AUTHORIZATION="Bearer " + hr_token,
+            HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+
+    assert not_modified_response.status_code == 304
+    assert not_modified_response["ETag"] == response["ETag"]
+
+    ad.category.name = "new category"
+    ad.category.save()
+    modified_response = client.get(
+        f"/ad/{ad.pk}/",
+        HTTP_AUTHORIZATION="Bearer " + hr_token,
+        HTTP_IF_NONE_MATCH=response["ETag"]
+    )
+
+    assert modified_response.status_code == 200
+    assert modified_response.data["category"] == "new category"
+
+
+@pytest.mark.django_db
+def test_detail_ad_sparse_fields(client, ad: Ad, hr_token: str) -> None:
+    """
+    The test_detail_ad_sparse_fields function is designed to check the functioning when sending a GET request
+    to the application at /ad/<int: pk>/?fields=. It takes as arguments the test client client, the ad object
+    from the Ad factory and the hr_token fixture. Checks that only the requested fields are displayed.
+    """
+    response = client.get(
+        f"/ad/{ad.pk}/",
+        {"fields": "id,name,author"},
+        HTTP_AUTHORIZATION="Bearer " + hr_token
+    )
+
+    assert response.status_code == 200
+    assert response.data == {"id": ad.id, "name": ad.name, "author": ad.author.username}
+
+
+@pytest.mark.django_db
+def test_detail_ad_sparse_fields_etag(client, ad: Ad, hr_token: str) -> None:
+    """
+    The test_detail_ad_sparse_fields_etag function is designed to check the validators of the representations
+    of an ad at /ad/<int: pk>/ and /async/ad/<int: pk>/. It takes as arguments the test client client, the ad object
+    from the Ad factory and the hr_token fixture. Checks that the representation restricted by the fields
+    query parameter has its own ETag, so its ETag never validates the full representation.
+    """
+    headers = {"HTTP_AUTHORIZATION": "Bearer " + hr_token}
+    sparse_response = client.get(f"/ad/{ad.pk}/", {"fields": "id"}, **headers)
+    full_response = client.get(f"/ad/{ad.pk}/", HTTP_IF_NONE_MATCH=sparse_response["ETag"], **headers)
+
+    assert full_response.status_code == 200
+    assert full_response["ETag"] != sparse_response["ETag"]
+    assert full_response.data["name"] == ad.name
+    assert client.get(f"/async/ad/{ad.pk}/", {"fields": "id"}, **headers)["ETag"] == sparse_response["ETag"]
@@ -0,0 +1,55 @@
+import csv
+import json
+from io import StringIO
+from typing import List, Dict, Any
+
+import pytest
+from django.core.management import call_command
+
+from ads.models import Ad
+from categories.models import Category
+from tests.factories import AdFactory
+
+
+@pytest.mark.django_db
+def test_export_ads_ndjson(client, category: Category) -> None:
+    """
+    The test_export_ads_ndjson function is designed to check the functioning when sending a GET request
+    to the application at /ad/export/. Takes the test client client and the category object from the Category
+    factory as arguments. Checks that the ads matching the filters are streamed as NDJSON.
+    """
+    ads: List[Ad] = AdFactory.create_batch(3, is_published=True, category=category)
+    AdFactory.create(is_published=True)
+
+    response = client.get("/ad/export/", {"cat": category.id})
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/x-ndjson"
+    rows: List[Dict[str, Any]] = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+    assert [row["id"] for row in rows] == [ad.id for ad in ads]
+    assert rows[0] == {
+        "id": ads[0].id,
+        "name": ads[0].name,
+        "author": ads[0].author.username,
+        "price": "100",
+        "description": ads[0].description,
+        "is_published": ads[0].is_published,
+        "image": "",
+        "category": category.name
+    }
+
+
+@pytest.mark.django_db
+def test_export_ads_command_csv() -> None:
+    """
+    The test_export_ads_command_csv function is designed to check the export_ads management command
+    in CSV format. Checks that the header and a row per ad are written.
+    """
+    ads: List[Ad] = AdFactory.create_batch(2, is_published=True)
+    output: StringIO = StringIO()
+
+    call_command("export_ads", "--format", "csv", "--price-from", "50", stdout=output)
+
+    rows: List[List[str]] = list(csv.reader(StringIO(output.getvalue())))
+    assert rows[0] == ["id", "name", "author", "price", "description", "is_published", "image", "category"]
+    assert [int(row[0]) for row in rows[1:]] == [ad.id for ad in ads]
@@ -0,0 +1,66 @@
+from io import BytesIO
+from typing import Dict
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image
+
+from ads.images import generate_variants, VARIANTS
+from ads.models import Ad
+from ads.serializers import AdListSerializer
+from categories.models import Category
+from tests.factories import AdFactory, CategoryFactory
+
+
+def save_image(name: str, size: tuple) -> str:
+    """
+    The save_image function takes as arguments the name of a file and the size of an image. Saves a JPEG image
+    of the given size to the default storage. Returns the name of the saved file.
+    """
+    buffer: BytesIO = BytesIO()
+    Image.new("RGB", size, "orange").save(buffer, "JPEG")
+    return default_storage.save(name, ContentFile(buffer.getvalue()))
+
+
+def test_generate_variants(media_root) -> None:
+    """
+    The test_generate_variants function is designed to check the generation of the resized variants of an image.
+    Takes the media_root fixture as an argument. Checks that every variant is saved in every format
+    and fits into its size.
+    """
+    image_name: str = save_image("images/post.jpg", (2400, 1200))
+
+    variants: Dict[str, Dict[str, str]] = generate_variants(image_name, default_storage)
+
+    assert set(variants) == set(VARIANTS)
+    for variant, (width, height) in VARIANTS.items():
+        assert set(variants[variant]) == {"webp", "jpeg"}
+        with default_storage.open(variants[variant]["webp"]) as variant_file:
+            image: Image.Image = Image.open(variant_file)
+            assert image.format == "WEBP"
+            assert image.size == (width, width // 2)
+
+
+@pytest.mark.django_db
+def test_ad_images_urls(media_root, django_capture_on_commit_callbacks) -> None:
+    """
+    The test_ad_images_urls function is designed to check the URLs of the image variants displayed
+    by the ad serializers. Takes the media_root and django_capture_on_commit_callbacks fixtures as arguments.
+    Checks that saving an ad with a new image schedules the processing and that the URLs of the original image
+    are displayed until the variants are generated.
+    """
+    image_name: str = save_image("images/post.jpg", (800, 600))
+
+    category: Category = CategoryFactory.create()
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        ad: Ad = AdFactory.create(image=image_name, category=category)
+
+    assert len(callbacks) == 1
+    assert AdListSerializer(ad).data["images"]["thumb"] == {"webp": "/media/" + image_name,
+                                                            "jpeg": "/media/" + image_name}
+
+    ad.image_variants = generate_variants(image_name, default_storage)
+
+    assert AdListSerializer(ad).data["images"]["card"]["webp"] == "/media/images/variants/post_card.webp"
@@ -0,0 +1,71 @@
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command, CommandError
+
+from ads.models import Ad
+from author.models import Location, User
+from categories.models import Category
+
+
+def write_csv(directory: Path, name: str, content: str) -> str:
+    """
+    The write_csv function takes as arguments a directory, the name of a file and its content.
+    Writes the file and returns its path as a string.
+    """
+    path: Path = directory / name
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.django_db
+def test_import_csv(tmp_path) -> None:
+    """
+    The test_import_csv function is designed to check the loading of the CSV files with the import_csv command.
+    Takes the tmp_path fixture as an argument. Checks that the files are loaded in the order of the references,
+    that the foreign keys given by identifiers and by names are resolved, that the missing slugs and emails
+    are filled, that the invalid rows are skipped and reported and that the sequences continue after the imported
+    identifiers.
+    """
+    paths = [
+        write_csv(tmp_path, "ad.csv", 'Id,name,author_id,price,description,is_published,image,category_id\n'
+                                      '7,"Сибирские котята, 3 месяца",40,2500,"Милые\n""ручные""",TRUE,images/1.jpg,30\n'
+                                      '8,Кресло в хорошем состоянии,riverna,,,FALSE,images/2.jpg,Мебель и интерьер\n'
+                                      '9,Коротко,40,100,,TRUE,images/3.jpg,30\n'
+                                      '10,Книга без автора в базе,nobody,100,,TRUE,images/4.jpg,30\n'),
+        write_csv(tmp_path, "user.csv", "id,first_name,last_name,username,password,role,age,location_id\n"
+                                        "40,Павел,Никифоров,pnikifirov,gZvptL,member,21,20\n"
+                                        "41,Ирина,Реброва,riverna,zo0rj6,admin,31,\"Москва, м. Сокол\"\n"),
+        write_csv(tmp_path, "location.csv", 'id,name,lat,lng\n'
+                                            '20,"Москва, м. Студенческая",55.738472,37.548188\n'
+                                            '21,"Москва, м. Сокол",55.805,37.515\n'),
+        write_csv(tmp_path, "category.csv", "id,name\n30,Котики\n31,Мебель и интерьер\n32,Indoor plants\n"),
+    ]
+    output: StringIO = StringIO()
+    errors: StringIO = StringIO()
+
+    call_command("import_csv", *paths, "--batch-size", "2", stdout=output, stderr=errors)
+
+    assert "ad.csv: 2 rows copied, 2 skipped" in output.getvalue()
+    assert "ad.csv:5: name:" in errors.getvalue()
+    assert "ad.csv:6: author_id: User 'nobody' does not exist." in errors.getvalue()
+    assert dict(Category.objects.values_list("name", "slug")) == {
+        "Котики": "cat0030", "Мебель и интерьер": "cat0031", "Indoor plants": "indoor-pla"
+    }
+    assert User.objects.get(pk=41).location_id == 21
+    assert User.objects.get(pk=40).email == "pnikifirov@example.com"
+    assert str(Location.objects.get(pk=20).lat) == "55.738472"
+
+    first: Ad = Ad.objects.get(pk=7)
+    assert first.description == 'Милые\n"ручные"'
+    assert first.is_published is True
+    assert first.image_variants == {}
+    assert first.search_vector
+    second: Ad = Ad.objects.get(pk=8)
+    assert (second.author_id, second.category_id, second.price, second.description) == (41, 31, None, "")
+
+    assert Category.objects.create(name="Новая", slug="novaya").pk == 33
+
+    with pytest.raises(CommandError):
+        call_command("import_csv", paths[3], "--max-errors", "1", stdout=StringIO(), stderr=StringIO())
@@ -1,9 +1,17 @@
+import multiprocessing
 from typing import List, Dict, Any
 
 import pytest
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
+from ads.cache import invalidate_categories
 from ads.models import Ad
 from ads.serializers import AdListSerializer
+from ads.views import AdsListView
+from author.models import Location
+from categories.models import Category
 from tests.factories import AdFactory
 
 
@@ -14,7 +22,7 @@ def test_ads_list(client) -> None:
     to the application at /ad/. Takes the test client client as an argument.
     Checks the compliance of the status codes and the content of the response object.
     """
-    ads: List[Ad] = AdFactory.create_batch(10)
+    ads: List[Ad] = AdFactory.create_batch(10, is_published=True)
 
     expected_response: Dict[str, Any] = {
         "count": 10,
@@ -26,3 +34,278 @@ def test_ads_list(client) -> None:
 
     assert response.status_code == 200
     assert response.data == expected_response
+
+
+@pytest.mark.django_db
+def test_ads_list_published_only(client) -> None:
+    """
+    The test_ads_list_published_only function is designed to check the functioning when sending a GET request
+    to the application at /ad/. Takes the test client client as an argument. Checks that the unpublished ads
+    are not displayed in the list.
+    """
+    published_ad: Ad = AdFactory.create(is_published=True)
+    AdFactory.create()
+
+    response = client.get("/ad/")
+
+    assert response.status_code == 200
+    assert [ad["id"] for ad in response.data["results"]] == [published_ad.id]
+
+
+@pytest.mark.django_db
+def test_ads_list_text_search(client) -> None:
+    """
+    The test_ads_list_text_search function is designed to check the full-text search when sending a GET request
+    to the application at /ad/?text=. Takes the test client client as an argument. Checks that the search matches
+    words in the name and description fields and that ads with the word in the name are ranked first.
+    """
+    ad_in_description: Ad = AdFactory.create(is_published=True, name="Отдам даром", description="Рыжие котята ищут дом")
+    ad_in_name: Ad = AdFactory.create(is_published=True, name="Сибирские котята", description="Возраст 3 месяца")
+    AdFactory.create(is_published=True, name="Продам велосипед", description="Почти новый")
+
+    response = client.get("/ad/", {"text": "котята"})
+
+    assert response.status_code == 200
+    assert [ad["id"] for ad in response.data["results"]] == [ad_in_name.id, ad_in_description.id]
+
+
+@pytest.mark.django_db
+def test_ads_list_cursor_pagination(client) -> None:
+    """
+    The test_ads_list_cursor_pagination function is designed to check the keyset pagination when sending
+    a GET request to the application at /ad/?pagination=cursor. Takes the test client client as an argument.
+    Checks that the pages follow each other by the cursor, that the rows are not counted and that the keyset
+    pagination is refused for the searches ordered by relevance and distance.
+    """
+    ads: List[Ad] = AdFactory.create_batch(15, is_published=True)
+
+    with CaptureQueriesContext(connection) as context:
+        response = client.get("/ad/", {"pagination": "cursor"})
+
+    assert response.status_code == 200
+    assert "count" not in response.data
+    assert not any("COUNT(" in query["sql"] for query in context.captured_queries)
+    assert response.data["previous"] is None
+    assert response.data["results"] == AdListSerializer(ads[:10], many=True).data
+
+    next_response = client.get(response.data["next"])
+
+    assert next_response.status_code == 200
+    assert next_response.data["next"] is None
+    assert next_response.data["results"] == AdListSerializer(ads[10:], many=True).data
+    assert client.get("/ad/", {"pagination": "cursor", "text": "котята"}).status_code == 400
+    assert client.get(response.data["next"] + "&near=55.75,37.61").status_code == 400
+
+
+@pytest.mark.django_db
+def test_ads_list_constant_queries(client, django_assert_num_queries) -> None:
+    """
+    The test_ads_list_constant_queries function is designed to check that the number of queries made when sending
+    a GET request to the application at /ad/ does not depend on the number of ads on the page. Takes the test client
+    client and the django_assert_num_queries fixture as arguments. Checks that a page of ads of different authors
+    costs one count query and one query of the rows.
+    """
+    AdFactory.create_batch(10, is_published=True)
+
+    with django_assert_num_queries(2):
+        response = client.get("/ad/")
+
+    assert response.status_code == 200
+    assert len({ad["author"] for ad in response.data["results"]}) == 10
+
+
+@pytest.mark.django_db
+def test_ads_list_near(client) -> None:
+    """
+    The test_ads_list_near function is designed to check the search of ads by distance when sending a GET request
+    to the application at /ad/?near=<lat>,<lng>&radius_km=. Takes the test client client as an argument.
+    Checks that only the ads within the radius are returned, the nearest first.
+    """
+    studencheskaya: Location = Location.objects.create(name="Студенческая", lat=55.738472, lng=37.548188)
+    cherkizovskaya: Location = Location.objects.create(name="Черкизовская", lat=55.804042, lng=37.745415)
+    petersburg: Location = Location.objects.create(name="Санкт-Петербург", lat=59.938951, lng=30.315635)
+    far_ad: Ad = AdFactory.create(is_published=True, author__location=cherkizovskaya)
+    near_ad: Ad = AdFactory.create(is_published=True, author__location=studencheskaya)
+    AdFactory.create(is_published=True, author__location=petersburg)
+
+    response = client.get("/ad/", {"near": "55.7520,37.6175", "radius_km": 15})
+
+    assert response.status_code == 200
+    assert [ad["id"] for ad in response.data["results"]] == [near_ad.id, far_ad.id]
+
+
+@pytest.mark.django_db
+def test_ads_list_near_antimeridian(client) -> None:
+    """
+    The test_ads_list_near_antimeridian function is designed to check the search of ads by distance near
+    the antimeridian and the poles when sending a GET request to the application at /ad/?near=<lat>,<lng>.
+    Takes the test client client as an argument. Checks that the ads on the other side of the antimeridian
+    and of the pole are found.
+    """
+    east: Location = Location.objects.create(name="Восток", lat=65.0, lng=179.95)
+    west: Location = Location.objects.create(name="Запад", lat=65.0, lng=-179.95)
+    across_pole: Location = Location.objects.create(name="Полюс", lat=89.95, lng=180.0)
+    east_ad: Ad = AdFactory.create(is_published=True, author__location=east)
+    west_ad: Ad = AdFactory.create(is_published=True, author__location=west)
+    pole_ad: Ad = AdFactory.create(is_published=True, author__location=across_pole)
+
+    response = client.get("/ad/", {"near": "65.0,179.9", "radius_km": 10})
+
+    assert [ad["id"] for ad in response.data["results"]] == [east_ad.id, west_ad.id]
+
+    response = client.get("/ad/", {"near": "65.0,-179.9", "radius_km": 10})
+
+    assert [ad["id"] for ad in response.data["results"]] == [west_ad.id, east_ad.id]
+
+    response = client.get("/ad/", {"near": "89.95,0", "radius_km": 20})
+
+    assert [ad["id"] for ad in response.data["results"]] == [pole_ad.id]
+
+
+@pytest.mark.django_db
+def test_ads_list_near_invalid(client) -> None:
+    """
+    The test_ads_list_near_invalid function is designed to check the functioning when sending a GET request
+    to the application at /ad/ with an invalid near parameter. Takes the test client client as an argument.
+    Checks the compliance of the status code.
+    """
+    response = client.get("/ad/", {"near": "Москва"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_ads_list_cache(client, category: Category, settings) -> None:
+    """
+    The test_ads_list_cache function is designed to check the caching of the responses at /ad/.
+    Takes the test client client, the category object from the Category factory and the settings fixture
+    as arguments. Checks that equivalent requests are served from the cache, that saving an ad of the category
+    invalidates the cached responses however the category is written and that the responses are cached
+    by host.
+    """
+    AdFactory.create(is_published=True, category=category)
+
+    first_response = client.get("/ad/", {"cat": category.id, "text": ""})
+    second_response = client.get("/ad/", {"cat": category.id})
+
+    assert first_response["X-Cache"] == "MISS"
+    assert second_response["X-Cache"] == "HIT"
+    assert second_response.data == first_response.data
+
+    AdFactory.create(is_published=True, category=category)
+    third_response = client.get("/ad/", {"cat": category.id})
+
+    assert third_response["X-Cache"] == "MISS"
+    assert third_response.data["count"] == 2
+    assert client.get("/ad/cache/stats/").data == {"hits": 1, "misses": 2}
+
+    padded_params: Dict[str, str] = {"cat": f"0{category.id}"}
+    assert client.get("/ad/", padded_params).data["count"] == 2
+
+    AdFactory.create(is_published=True, category=category)
+
+    assert client.get("/ad/", padded_params).data["count"] == 3
+
+    settings.ALLOWED_HOSTS = ["testserver", "other.example"]
+    client.get("/ad/", {"cat": category.id})
+
+    assert client.get("/ad/", {"cat": category.id}, HTTP_HOST="other.example")["X-Cache"] == "MISS"
+
+
+@pytest.mark.django_db
+def test_ads_list_cache_invalidated_by_other_process(client, category: Category) -> None:
+    """
+    The test_ads_list_cache_invalidated_by_other_process function is designed to check that the responses cached
+    by a process are not served after the ads of their category are changed by another process. Takes the test
+    client client and the category object from the Category factory as arguments.
+    """
+    AdFactory.create(is_published=True, category=category)
+    client.get("/ad/", {"cat": category.id})
+
+    process = multiprocessing.get_context("fork").Process(target=invalidate_categories, args=([category.id],))
+    process.start()
+    process.join()
+
+    assert process.exitcode == 0
+    assert client.get("/ad/", {"cat": category.id})["X-Cache"] == "MISS"
+
+
+@pytest.mark.django_db
+def test_ads_list_facets(client, django_assert_max_num_queries) -> None:
+    """
+    The test_ads_list_facets function is designed to check the functioning when sending a GET request
+    to the application at /ad/?facets=1. Takes the test client client as an argument. Checks that the counts
+    by categories ignore the category filter, that the counts by locations and price ranges follow all
+    the filters and that the facets are computed with a fixed number of queries.
+    """
+    moscow: Location = Location.objects.create(name="Москва", lat=55.75, lng=37.62)
+    ads: List[Ad] = AdFactory.create_batch(3, is_published=True, price=500, author__location=moscow)
+    AdFactory.create(is_published=True, category=ads[0].category, price=7000, author__location=moscow)
+    other_ad: Ad = AdFactory.create(is_published=True, price=200000)
+    AdFactory.create(category=ads[0].category)
+
+    with django_assert_max_num_queries(5):
+        response = client.get("/ad/", {"cat": ads[0].category_id, "facets": "1"})
+
+    assert response.status_code == 200
+    assert response.data["count"] == 2
+    facets: Dict[str, Any] = response.data["facets"]
+    assert facets["categories"][0] == {"id": ads[0].category_id, "name": ads[0].category.name, "count": 2}
+    assert {category["id"]: category["count"] for category in facets["categories"]} == {
+        ads[0].category_id: 2, ads[1].category_id: 1, ads[2].category_id: 1, other_ad.category_id: 1
+    }
+    assert facets["locations"] == [{"id": moscow.id, "name": "Москва", "count": 2}]
+    assert [bucket["count"] for bucket in facets["price"]] == [1, 0, 1, 0, 0, 0]
+    assert facets["price"][-1] == {"from": 100000, "to": None, "count": 0}
+    assert "facets" not in client.get("/ad/").data
+
+
+@pytest.mark.django_db
+def test_ads_list_sparse_fields(client) -> None:
+    """
+    The test_ads_list_sparse_fields function is designed to check the functioning when sending a GET request
+    to the application at /ad/?fields=. Takes the test client client as an argument. Checks that only
+    the requested fields are displayed and loaded from the database and that unknown fields are rejected.
+    """
+    ads: List[Ad] = AdFactory.create_batch(2, is_published=True)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get("/ad/", {"fields": "price,id"})
+
+    assert response.status_code == 200
+    assert response.data["results"] == [{"id": ad.id, "price": "100"} for ad in ads]
+    page_query: str = queries.captured_queries[-1]["sql"]
+    assert '"ads_ad"."price"' in page_query
+    assert '"ads_ad"."name"' not in page_query
+    assert "author_user" not in page_query
+
+    response = client.get("/ad/", {"fields": "id,password"})
+
+    assert response.status_code == 400
+    assert response.data == {"fields": "Unknown fields: password."}
+
+
+@pytest.mark.django_db
+def test_ads_list_fast_parity(client, monkeypatch) -> None:
+    """
+    The test_ads_list_fast_parity function is designed to check the fast list mode at /ad/. Takes the test client
+    client and the monkeypatch fixture as arguments. Checks that the pages built from
+    the rows of the values are identical to the pages serialized by the AdListSerializer for the filters,
+    the sparse fields and both pagination modes.
+    """
+    monkeypatch.setattr(AdsListView, "fast_list", True)
+    AdFactory.create_batch(12, is_published=True, price=700)
+    AdFactory.create(is_published=True, name="Сибирские котята", image="pictures/cat.jpg",
+                     image_variants={"thumb": {"webp": "pictures/variants/cat_thumb.webp"}})
+    AdFactory.create(is_published=True, price=None, author__location=None)
+
+    for params in [{}, {"page": 2}, {"text": "котята"}, {"fields": "id,images"}, {"pagination": "cursor"}]:
+        fast_response = client.get("/ad/", params)
+        with override_settings(ADS_LIST_CACHE_ALIAS="default"):
+            monkeypatch.setattr(AdsListView, "fast_list", False)
+            serialized_response = client.get("/ad/", params)
+            monkeypatch.setattr(AdsListView, "fast_list", True)
+
+        assert fast_response.status_code == 200
+        assert serialized_response["X-Cache"] == "MISS"
+        assert fast_response.json() == serialized_response.json()
@@ -0,0 +1,86 @@
+from typing import List
+
+import pytest
+
+from ads.models import Ad
+from tests.factories import AdFactory
+
+
+@pytest.mark.django_db
+def test_ads_list_async(client) -> None:
+    """
+    The test_ads_list_async function is designed to check the functioning when sending a GET request
+    to the application at /async/ad/. Takes the test client client as an argument. Checks that the pages,
+    the filters and the facets are displayed as at /ad/ with the links to the pages of the requested address
+    and that the responses are cached by each address.
+    """
+    ads: List[Ad] = AdFactory.create_batch(12, is_published=True, price=500)
+    AdFactory.create(is_published=True, category=ads[0].category, price=7000)
+
+    for params in [{}, {"page": 2}, {"cat": ads[0].category_id, "facets": "1"}]:
+        response = client.get("/async/ad/", params)
+        cached_response = client.get("/async/ad/", params)
+        sync_response = client.get("/ad/", params)
+
+        assert response.status_code == 200
+        assert response["X-Cache"] == "MISS"
+        assert cached_response["X-Cache"] == "HIT"
+        assert sync_response["X-Cache"] == "MISS"
+        assert response.json() == cached_response.json()
+        assert response.json() == {
+            **sync_response.json(),
+            **{link: sync_response.json()[link] and sync_response.json()[link].replace("/ad/", "/async/ad/")
+               for link in ["next", "previous"]},
+        }
+
+    assert client.get("/async/ad/")["X-Cache"] == "HIT"
+    assert "/async/ad/?page=2" in client.get("/async/ad/").json()["next"]
+    assert "/async/ad/" not in client.get("/ad/").json()["next"]
+
+    client.get("/async/ad/", {"price_from": 1000})
+    response = client.get("/async/ad/", {"price_from": 1000})
+
+    assert response["X-Cache"] == "HIT"
+    assert response.json()["count"] == 1
+
+
+@pytest.mark.django_db
+def test_ads_list_async_errors(client) -> None:
+    """
+    The test_ads_list_async_errors function is designed to check the functioning when sending a GET request
+    with incorrect parameters to the application at /async/ad/. Takes the test client client as an argument.
+    Checks the status codes and the details of the errors.
+    """
+    assert client.get("/async/ad/", {"near": "north"}).json() == {
+        "near": "The value must be in the format '<lat>,<lng>'."
+    }
+    assert client.get("/async/ad/", {"page": 3}).status_code == 404
+    assert client.get("/async/ad/", {"pagination": "cursor"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_detail_ad_async(client, ad: Ad, hr_token: str) -> None:
+    """
+    The test_detail_ad_async function is designed to check the functioning when sending a GET request
+    to the application at /async/ad/<int: pk>/. It takes as arguments the test client client, the ad object
+    from the Ad factory and the hr_token fixture. Checks that the ad and its validators are displayed exactly
+    as at /ad/<int: pk>/, that an unchanged ad is answered with the status 304 and that the endpoint
+    is available only to authenticated users.
+    """
+    response = client.get(f"/async/ad/{ad.pk}/", HTTP_AUTHORIZATION="Bearer " + hr_token)
+    sync_response = client.get(f"/ad/{ad.pk}/", HTTP_AUTHORIZATION="Bearer " + hr_token)
+
+    assert response.status_code == 200
+    assert response.json() == sync_response.json()
+    assert response["ETag"] == sync_response["ETag"]
+
+    not_modified_response = client.get(
+        f"/async/ad/{ad.pk}/",
+        HTTP_AUTHORIZATION="Bearer " + hr_token,
+        HTTP_IF_NONE_MATCH=response["ETag"]
+    )
+
+    assert not_modified_response.status_code == 304
+    assert client.get(f"/async/ad/{ad.pk}/").json() == client.get(f"/ad/{ad.pk}/").json()
+    assert client.get(f"/async/ad/{ad.pk}/").status_code == 401
+    assert client.get(f"/async/ad/{ad.pk + 1}/", HTTP_AUTHORIZATION="Bearer " + hr_token).status_code == 404
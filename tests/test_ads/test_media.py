@@ -0,0 +1,74 @@
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+from ads.models import Ad
+from author.models import User
+from tests.factories import AdFactory
+
+CONTENT: bytes = b"0123456789" * 100
+
+
+@pytest.mark.django_db
+def test_ad_media(client, media_root) -> None:
+    """
+    The test_ad_media function is designed to check the functioning when sending a GET request to the application
+    at /media/<path>. Takes the test client client and the media_root fixture as arguments. Checks that the image
+    of a published ad is sent with the cache headers, that the conditional and range requests are answered
+    with the statuses 304, 412, 206 and 416, that the variants of the image are served and that files not belonging to an ad are not served.
+    """
+    name: str = default_storage.save("images/post.jpg", ContentFile(CONTENT))
+    variant_name: str = default_storage.save("images/variants/post_thumb.webp", ContentFile(CONTENT))
+    ad: Ad = AdFactory.create(is_published=True, image=name)
+    Ad.objects.filter(pk=ad.pk).update(image_variants={"thumb": {"webp": variant_name}})
+
+    response = client.get(f"/media/{name}")
+
+    assert response.status_code == 200
+    assert b"".join(response.streaming_content) == CONTENT
+    assert response["Content-Type"] == "image/jpeg"
+    assert response["Cache-Control"].startswith("public, max-age=")
+    assert response["Accept-Ranges"] == "bytes"
+
+    assert client.get(f"/media/{name}", HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 304
+    assert client.get(f"/media/{name}", HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]).status_code == 304
+    assert client.get(f"/media/{name}", HTTP_IF_NONE_MATCH=f'"other", W/{response["ETag"]}').status_code == 304
+    assert client.get(f"/media/{name}", HTTP_IF_NONE_MATCH='"other"',
+                      HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]).status_code == 200
+    assert client.get(f"/media/{name}", HTTP_IF_MATCH='"other"').status_code == 412
+
+    partial_response = client.get(f"/media/{name}", HTTP_RANGE="bytes=10-19")
+
+    assert partial_response.status_code == 206
+    assert partial_response["Content-Range"] == f"bytes 10-19/{len(CONTENT)}"
+    assert b"".join(partial_response.streaming_content) == CONTENT[10:20]
+    assert b"".join(client.get(f"/media/{name}", HTTP_RANGE="bytes=-5").streaming_content) == CONTENT[-5:]
+    assert client.get(f"/media/{name}", HTTP_RANGE="bytes=5000-").status_code == 416
+
+    assert client.get(f"/media/{variant_name}")["Content-Type"] == "image/webp"
+    default_storage.save("images/other.jpg", ContentFile(CONTENT))
+    assert client.get("/media/images/other.jpg").status_code == 404
+
+
+@pytest.mark.django_db
+def test_ad_media_unpublished(client, media_root, hr_token: str, settings) -> None:
+    """
+    The test_ad_media_unpublished function is designed to check the access to the images of unpublished ads
+    at /media/<path>. Takes the test client client, the media_root fixture, the hr_token fixture and the settings
+    fixture as arguments. Checks that the image is available only to the creator of the ad and that the transfer
+    is handed to the front server with the X-Accel-Redirect header.
+    """
+    name: str = default_storage.save("images/draft.jpg", ContentFile(CONTENT))
+    ad: Ad = AdFactory.create(image=name, author=User.objects.get(username="test_user"))
+    other_name: str = default_storage.save("images/other.jpg", ContentFile(CONTENT))
+    AdFactory.create(image=other_name)
+    settings.MEDIA_SENDFILE_BACKEND = "nginx"
+
+    assert client.get(f"/media/{name}").status_code == 401
+    assert client.get(f"/media/{other_name}", HTTP_AUTHORIZATION="Bearer " + hr_token).status_code == 403
+
+    response = client.get(f"/media/{ad.image.name}", HTTP_AUTHORIZATION="Bearer " + hr_token)
+
+    assert response.status_code == 200
+    assert response["X-Accel-Redirect"] == f"/protected-media/{name}"
+    assert response.content == b""
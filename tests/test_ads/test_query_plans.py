@@ -0,0 +1,132 @@
+import random
+from typing import Dict, List
+
+import pytest
+from django.db import connection
+from django.db.models import QuerySet
+
+from ads.filters import filter_ads
+from ads.images import media_lookup
+from ads.models import Ad
+from ads.views import AdsListView
+from author.models import Location, User
+from categories.models import Category
+from home_work.eager_loading import setup_eager_loading
+
+ADS_COUNT: int = 20000
+CATEGORIES_COUNT: int = 50
+LOCATIONS_COUNT: int = 2000
+GOODS: List[str] = ["диван", "телефон", "шкаф", "велосипед", "самовар"]
+GOODS_WEIGHTS: List[int] = [30, 30, 30, 9, 1]
+
+FILTER_COMBINATIONS: List[Dict[str, str]] = [
+    {},
+    {"cat": "{category}"},
+    {"price_from": "99000"},
+    {"price_to": "1000"},
+    {"price_from": "40000", "price_to": "41000"},
+    {"cat": "{category}", "price_from": "40000"},
+    {"cat": "{category}", "price_to": "60000"},
+    {"cat": "{category}", "price_from": "40000", "price_to": "60000"},
+    {"text": "самовар"},
+    {"cat": "{category}", "text": "велосипед"},
+    {"location": "город-0042"},
+    {"cat": "{category}", "location": "город-0042"},
+    {"near": "{near}"},
+    {"cat": "{category}", "near": "{near}", "radius_km": "5"},
+]
+
+
+@pytest.fixture
+def seeded_ads() -> Category:
+    """
+    The seeded_ads function is a fixture that inserts a realistic volume of ads spread over the categories
+    and prices, nine out of ten of them published, moves the new entries of the full-text index out of its
+    pending list, as the autovacuum would, and updates the statistics of the tables so that the planner sees them.
+    The authors live in different locations scattered over the country. Returns one of the categories.
+    """
+    randomizer: random.Random = random.Random(31)
+    locations: List[Location] = Location.objects.bulk_create(
+        Location(name=f"Город-{index:04d}", normalized_name=f"город-{index:04d}",
+                 lat=round(randomizer.uniform(43, 68), 6), lng=round(randomizer.uniform(30, 130), 6))
+        for index in range(LOCATIONS_COUNT)
+    )
+    authors: List[User] = User.objects.bulk_create(
+        User(username=f"seller_{index}", email=f"seller_{index}@example.org", location=locations[index])
+        for index in range(100)
+    )
+    categories: List[Category] = Category.objects.bulk_create(
+        Category(name=f"category {index}", slug=f"cat{index:04d}") for index in range(CATEGORIES_COUNT)
+    )
+    Ad.objects.bulk_create(
+        (
+            Ad(
+                name=f"{randomizer.choice(['Продам', 'Отдам', 'Куплю'])} "
+                     f"{randomizer.choices(GOODS, weights=GOODS_WEIGHTS)[0]} {index}",
+                description="test text",
+                price=randomizer.randrange(100000),
+                author=randomizer.choice(authors),
+                category=randomizer.choice(categories),
+                is_published=randomizer.random() < 0.9,
+            )
+            for index in range(ADS_COUNT)
+        ),
+        batch_size=2000
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT gin_clean_pending_list('ad_search_vector_gin'::regclass)")
+        cursor.execute("ANALYZE ads_ad")
+        cursor.execute("ANALYZE author_user")
+        cursor.execute("ANALYZE author_location")
+        cursor.execute("ANALYZE categories_category")
+    return categories[0]
+
+
+@pytest.mark.django_db
+def test_ads_list_query_plans(seeded_ads: Category) -> None:
+    """
+    The test_ads_list_query_plans function is designed to check the query plans of the ad list.
+    Takes the seeded category as an argument. Checks that for every supported combination of the filters
+    the query of the first page and the query of all the matching ads, as read by the count of the pagination
+    and the facets, use an index instead of a sequential scan of the table, and that the locations are searched
+    by the index of their coordinates and by the trigram index of their names, which is created only
+    on the database servers providing the pg_trgm extension.
+    """
+    location: Location = Location.objects.get(name="Город-0042")
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_indexes WHERE indexname = 'location_name_trgm_idx'")
+        trigram_index: bool = cursor.fetchone() is not None
+    for params in FILTER_COMBINATIONS:
+        params = {
+            name: value.format(category=seeded_ads.id, near=f"{location.lat},{location.lng}")
+            for name, value in params.items()
+        }
+        queryset: QuerySet[Ad] = setup_eager_loading(
+            filter_ads(AdsListView.queryset.all(), params), AdsListView.serializer_class
+        )
+
+        plans: List[str] = [queryset[:10].explain()]
+        if params:
+            plans.append(queryset.order_by().values("id").explain())
+
+        for plan in plans:
+            assert "Seq Scan on ads_ad" not in plan, f"{params}\n{plan}"
+            assert "Index" in plan, f"{params}\n{plan}"
+        if "location" in params and trigram_index:
+            assert "location_name_trgm_idx" in plans[-1], f"{params}\n{plans[-1]}"
+        if "near" in params:
+            assert "location_lat_lng_idx" in plans[-1], f"{params}\n{plans[-1]}"
+
+
+@pytest.mark.django_db
+def test_media_lookup_query_plans(seeded_ads: Category) -> None:
+    """
+    The test_media_lookup_query_plans function is designed to check the query plans of the lookups of the media
+    files. Takes the seeded category as an argument. Checks that the ads are found by the name of their image
+    and by the name of a variant of their image with the index of the image names.
+    """
+    for name in ["images/ab/photo.jpg", "images/ab/variants/photo_thumb.webp"]:
+        plan: str = Ad.objects.filter(media_lookup(name)).explain()
+
+        assert "Seq Scan on ads_ad" not in plan, f"{name}\n{plan}"
+        assert "ad_image_idx" in plan, f"{name}\n{plan}"
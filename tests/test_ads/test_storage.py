@@ -0,0 +1,122 @@
+from io import BytesIO, StringIO
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from PIL import Image
+
+from ads.images import variant_name
+from ads.models import Ad, ImageBlob
+from ads.storage import image_storage, is_content_name
+from tests.factories import AdFactory
+
+
+def image_content(color: str) -> bytes:
+    """
+    The image_content function takes as an argument the color of an image. Returns the content
+    of a small JPEG image filled with this color.
+    """
+    buffer: BytesIO = BytesIO()
+    Image.new("RGB", (40, 30), color).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+@pytest.mark.django_db
+def test_content_addressed_storage(media_root, django_capture_on_commit_callbacks) -> None:
+    """
+    The test_content_addressed_storage function is designed to check that identical uploads are stored once.
+    Takes the media_root and django_capture_on_commit_callbacks fixtures as arguments.
+    Checks that the uploads with the same content get the same name,
+    that the references are counted by the ads and that the file is deleted with the last ad referencing it.
+    """
+    first_name: str = image_storage.save("images/photo.jpg", ContentFile(image_content("orange")))
+    second_name: str = image_storage.save("images/photo_copy.jpg", ContentFile(image_content("orange")))
+
+    assert first_name == second_name
+    assert is_content_name(first_name)
+
+    first: Ad = AdFactory.create(image=first_name)
+    second: Ad = AdFactory.create(image=second_name)
+
+    assert ImageBlob.objects.get(name=first_name).refcount == 2
+
+    first.delete()
+
+    assert ImageBlob.objects.get(name=first_name).refcount == 1
+    assert image_storage.exists(first_name)
+
+    second.image = image_storage.save("images/other.jpg", ContentFile(image_content("blue")))
+    with django_capture_on_commit_callbacks(execute=True):
+        second.save()
+
+    assert not ImageBlob.objects.filter(name=first_name).exists()
+    assert not image_storage.exists(first_name)
+    assert ImageBlob.objects.get(name=second.image.name).refcount == 1
+
+
+@pytest.mark.django_db
+def test_released_image_uploaded_again(media_root, django_capture_on_commit_callbacks) -> None:
+    """
+    The test_released_image_uploaded_again function is designed to check that an image uploaded again after
+    the release of its last reference is kept. Takes the media_root and django_capture_on_commit_callbacks
+    fixtures as arguments. Checks that the deletion pending until the commit skips the file reused by the upload.
+    """
+    name: str = image_storage.save("images/photo.jpg", ContentFile(image_content("orange")))
+    ad: Ad = AdFactory.create(image=name)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        ad.delete()
+
+    assert image_storage.save("images/again.jpg", ContentFile(image_content("orange"))) == name
+
+    for callback in callbacks:
+        callback()
+
+    assert image_storage.exists(name)
+
+
+@pytest.mark.django_db
+def test_dedupe_images(media_root, django_capture_on_commit_callbacks) -> None:
+    """
+    The test_dedupe_images function is designed to check the deduplication of the existing images.
+    Takes the media_root and django_capture_on_commit_callbacks fixtures as arguments. Checks that the copies
+    of an image are replaced by one file stored under its digest, that the ads are pointed to it with regenerated
+    variants, that the references are counted and that the old files are deleted only after the commit.
+    """
+    first_name: str = default_storage.save("images/photo.jpg", ContentFile(image_content("orange")))
+    second_name: str = default_storage.save("images/photo.jpg", ContentFile(image_content("orange")))
+    unique_name: str = default_storage.save("images/other.jpg", ContentFile(image_content("blue")))
+    AdFactory.create(image=first_name)
+    AdFactory.create(image=second_name)
+    AdFactory.create(image=unique_name)
+
+    output: StringIO = StringIO()
+    call_command("dedupe_images", "--dry-run", stdout=output)
+
+    assert "Would remove 1 duplicate images" in output.getvalue()
+    assert default_storage.exists(second_name)
+
+    output = StringIO()
+    with django_capture_on_commit_callbacks() as callbacks:
+        call_command("dedupe_images", stdout=output)
+
+    assert default_storage.exists(first_name)
+    assert default_storage.exists(second_name)
+
+    for callback in callbacks:
+        callback()
+
+    assert "Removed 1 duplicate images" in output.getvalue()
+    assert not default_storage.exists(first_name)
+    assert not default_storage.exists(second_name)
+
+    names = set(Ad.objects.values_list("image", flat=True))
+    assert len(names) == 2
+    assert all(is_content_name(name) for name in names)
+    assert dict(ImageBlob.objects.values_list("name", "refcount")) == {
+        name: Ad.objects.filter(image=name).count() for name in names
+    }
+    for ad in Ad.objects.all():
+        assert ad.image_variants["thumb"]["webp"] == variant_name(ad.image.name, "thumb", "webp")
+        assert image_storage.exists(ad.image_variants["thumb"]["webp"])
@@ -0,0 +1,66 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ads.models import Ad
+from author.models import User
+from tests.factories import AdFactory
+
+
+@pytest.mark.django_db
+def test_update_ad_guarded(client, hr_token: str) -> None:
+    """
+    The test_update_ad_guarded function is designed to check the functioning when sending a PATCH request
+    to the application at /ad/<int:pk>/update/. Takes the test client client and the hr_token fixture as arguments.
+    Checks that the ad of the user is updated with a single UPDATE statement and that the ads of other users
+    and the missing ads are answered with the statuses 403 and 404 before validating the data.
+    """
+    user: User = User.objects.get(username="test_user")
+    ad: Ad = AdFactory.create(author=user)
+    other: Ad = AdFactory.create()
+    headers = {"HTTP_AUTHORIZATION": "Bearer " + hr_token}
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.patch(f"/ad/{ad.pk}/update/", {"price": 250, "is_published": "TRUE"},
+                                content_type="application/json", **headers)
+
+    assert response.status_code == 200
+    assert response.data["price"] == "250"
+    assert response.data["is_published"] == "TRUE"
+    assert Ad.objects.get(pk=ad.pk).is_published is True
+    updates = [query["sql"] for query in queries.captured_queries if query["sql"].startswith("UPDATE")]
+    assert len(updates) == 1
+    assert f'"author_id" = {user.pk}' in updates[0]
+
+    assert client.patch(f"/ad/{other.pk}/update/", {"price": 250}, content_type="application/json",
+                        **headers).status_code == 403
+    assert client.patch(f"/ad/{other.pk}/update/", {"price": -1}, content_type="application/json",
+                        **headers).status_code == 403
+    assert client.patch(f"/ad/{other.pk + 1}/update/", {"price": 250}, content_type="application/json",
+                        **headers).status_code == 404
+    assert client.patch(f"/ad/{ad.pk}/update/", {"price": -1}, content_type="application/json",
+                        **headers).status_code == 400
+    assert Ad.objects.get(pk=other.pk).price == 100
+
+    User.objects.filter(pk=user.pk).update(role="moderator")
+
+    assert client.patch(f"/ad/{other.pk}/update/", {"price": 300}, content_type="application/json",
+                        **headers).status_code == 200
+    assert Ad.objects.get(pk=other.pk).price == 300
+
+
+@pytest.mark.django_db
+def test_delete_ad_guarded(client, hr_token: str) -> None:
+    """
+    The test_delete_ad_guarded function is designed to check the functioning when sending a DELETE request
+    to the application at /ad/<int:pk>/delete/. Takes the test client client and the hr_token fixture as arguments.
+    Checks that only the ads of the user are deleted and that the missing ads are answered with the status 404.
+    """
+    ad: Ad = AdFactory.create(author=User.objects.get(username="test_user"))
+    other: Ad = AdFactory.create()
+    headers = {"HTTP_AUTHORIZATION": "Bearer " + hr_token}
+
+    assert client.delete(f"/ad/{other.pk}/delete/", **headers).status_code == 403
+    assert client.delete(f"/ad/{ad.pk}/delete/", **headers).status_code == 204
+    assert client.delete(f"/ad/{ad.pk}/delete/", **headers).status_code == 404
+    assert list(Ad.objects.values_list("pk", flat=True)) == [other.pk]
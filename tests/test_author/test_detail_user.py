@@ -0,0 +1,23 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from author.models import User, Location
+
+
+@pytest.mark.django_db
+def test_detail_user_sparse_fields(client) -> None:
+    """
+    The test_detail_user_sparse_fields function is designed to check the functioning when sending a GET request
+    to the application at /user/<int: pk>/?fields=. Takes the test client client as an argument. Checks that
+    only the requested fields are displayed and that the password hash is not loaded from the database.
+    """
+    location: Location = Location.objects.create(name="Москва")
+    user: User = User.objects.create_user(username="sparse", password="1234", location=location)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(f"/user/{user.pk}/", {"fields": "id,username,location"})
+
+    assert response.status_code == 200
+    assert response.data == {"id": user.id, "username": "sparse", "location": "Москва"}
+    assert '"author_user"."password"' not in queries.captured_queries[-1]["sql"]
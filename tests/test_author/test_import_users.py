@@ -0,0 +1,120 @@
+import json
+from io import StringIO
+from typing import Any, Dict, List
+
+import pytest
+from django.contrib.auth.hashers import check_password
+from django.core.management import call_command
+
+from author.models import Location, User
+from author.passwords import hash_passwords
+
+
+@pytest.fixture
+@pytest.mark.django_db
+def admin_token(client, django_user_model) -> str:
+    """
+    The admin_token function is a fixture that creates a user with the role of administrator, makes a token request
+    and returns it as a string.
+    """
+    django_user_model.objects.create_user(username="test_admin", password="1234", email="admin@mail.ru", role="admin")
+    response = client.post("/user/token/", {"username": "test_admin", "password": "1234"}, format="json")
+    return response.data["access"]
+
+
+def test_hash_passwords(settings) -> None:
+    """
+    The test_hash_passwords function is designed to check the hashing of the passwords by the pool of worker
+    processes. Takes the settings fixture as an argument. Checks that the hashes are returned in the order
+    of the passwords.
+    """
+    settings.PASSWORD_HASH_WORKERS = 2
+    passwords: List[str] = ["first", "second", "third"]
+
+    hashes: List[str] = hash_passwords(passwords)
+
+    assert [check_password(password, hashed) for password, hashed in zip(passwords, hashes)] == [True] * 3
+    assert not check_password("second", hashes[0])
+
+
+@pytest.mark.django_db
+def test_bulk_users(client, admin_token: str, hr_token: str, django_assert_num_queries) -> None:
+    """
+    The test_bulk_users function is designed to check the functioning when sending a POST request to the application
+    at /user/bulk/. Accepts as arguments the test client client, the admin_token and hr_token fixtures
+    and the django_assert_num_queries fixture. Checks that the users are created with a number of queries
+    independent of the number of users, that their locations are shared and that only administrators
+    may import users.
+    """
+    Location.objects.create(name="Москва")
+    data: List[Dict[str, Any]] = [
+        {"username": f"bulk_{number}", "password": f"secret_{number}", "email": f"bulk_{number}@mail.ru",
+         "birth_date": "1990-05-05", "location": ["москва", " Казань"][number % 2]}
+        for number in range(10)
+    ]
+
+    response = client.post("/user/bulk/", data, content_type="application/json",
+                           HTTP_AUTHORIZATION="Bearer " + hr_token)
+
+    assert response.status_code == 403
+
+    with django_assert_num_queries(9):
+        response = client.post("/user/bulk/", data, content_type="application/json",
+                               HTTP_AUTHORIZATION="Bearer " + admin_token)
+
+    assert response.status_code == 201
+    assert [user["location"] for user in response.data[:2]] == ["Москва", "Казань"]
+    assert "password" not in response.data[0]
+    assert User.objects.filter(username__startswith="bulk_", location__name="Москва").count() == 5
+    assert User.objects.get(username="bulk_3").check_password("secret_3")
+    assert Location.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_bulk_users_errors(client, admin_token: str) -> None:
+    """
+    The test_bulk_users_errors function is designed to check the functioning when sending a POST request
+    to the application at /user/bulk/ with invalid users. Accepts as arguments the test client client
+    and the admin_token fixture. Checks that the rules of the user creation and the uniqueness are checked
+    by users and nothing is saved.
+    """
+    data: List[Dict[str, Any]] = [
+        {"username": "bulk_1", "password": "1234", "email": "bulk_1@mail.ru", "birth_date": "1990-05-05"},
+        {"username": "bulk_2", "password": "1234", "email": "bulk_2@rambler.ru", "birth_date": "1990-05-05"},
+        {"username": "bulk_1", "password": "1234", "email": "admin@mail.ru", "birth_date": "1990-05-05"},
+    ]
+
+    response = client.post("/user/bulk/", data, content_type="application/json",
+                           HTTP_AUTHORIZATION="Bearer " + admin_token)
+
+    assert response.status_code == 400
+    assert response.data["errors"][0] == {}
+    assert response.data["errors"][1] == {"email": ["bulk_2@rambler.ru registration with rambler.ru prohibited "]}
+    assert response.data["errors"][2] == {
+        "username": ["A user with that username already exists."],
+        "email": ["A user with this email already exists."],
+    }
+    assert not User.objects.filter(username__startswith="bulk_").exists()
+
+
+@pytest.mark.django_db
+def test_import_users_command(tmp_path) -> None:
+    """
+    The test_import_users_command function is designed to check the import_users command. Takes the tmp_path
+    fixture as an argument. Checks that the users of a file are imported in chunks and the invalid ones
+    are skipped and reported.
+    """
+    path = tmp_path / "users.json"
+    path.write_text(json.dumps([
+        {"username": f"import_{number}", "password": "1234", "email": f"import_{number}@mail.ru",
+         "birth_date": "1990-05-05", "location": "Самара"}
+        for number in range(5)
+    ] + [{"username": "import_5", "password": "1234", "email": "import_5@mail.ru"}]), encoding="utf-8")
+    output: StringIO = StringIO()
+    errors: StringIO = StringIO()
+
+    call_command("import_users", str(path), "--chunk-size", "2", stdout=output, stderr=errors)
+
+    assert "Imported 5 users, 1 invalid users skipped." in output.getvalue()
+    assert "User 6:" in errors.getvalue()
+    assert User.objects.filter(username__startswith="import_", location__name="Самара").count() == 5
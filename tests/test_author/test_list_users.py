@@ -0,0 +1,27 @@
+import pytest
+
+from author.models import User, Location
+from author.views import UsersListView
+
+
+@pytest.mark.django_db
+def test_users_list_fast_parity(client, monkeypatch) -> None:
+    """
+    The test_users_list_fast_parity function is designed to check the fast list mode at /user/. Takes the test
+    client client and the monkeypatch fixture as arguments. Checks that the pages built from the rows
+    of the values are identical to the pages serialized by the UserListSerializer.
+    """
+    location: Location = Location.objects.create(name="Москва")
+    for index in range(12):
+        User.objects.create(username=f"user_{index}", email=f"user_{index}@example.org",
+                            role="moderator" if index % 2 else "member", age=20 + index,
+                            location=location if index % 3 else None)
+
+    for params in [{}, {"page": 2}, {"fields": "username,location"}, {"pagination": "cursor"}]:
+        monkeypatch.setattr(UsersListView, "fast_list", True)
+        fast_response = client.get("/user/", params)
+        monkeypatch.setattr(UsersListView, "fast_list", False)
+        serialized_response = client.get("/user/", params)
+
+        assert fast_response.status_code == 200
+        assert fast_response.json() == serialized_response.json()
@@ -0,0 +1,121 @@
+import multiprocessing
+
+import pytest
+from django.db import connection
+
+from author import locations
+from author.locations import find_location, resolve_location
+from author.models import Location, User
+
+
+@pytest.mark.django_db
+def test_resolve_location(settings, django_capture_on_commit_callbacks, django_assert_num_queries) -> None:
+    """
+    The test_resolve_location function is designed to check the location resolver. Takes the settings,
+    django_capture_on_commit_callbacks and django_assert_num_queries fixtures as arguments. Checks that the names
+    differing in the case and the whitespace resolve to one stored location, that the resolved names are served
+    from the bounded cache of the process and that saving a location invalidates the cache.
+    """
+    settings.LOCATION_CACHE_SIZE = 2
+
+    with django_capture_on_commit_callbacks(execute=True):
+        moscow_id, moscow_name = resolve_location("Москва,  м. Сокол")
+        assert resolve_location(" москва, м. сокол ") == (moscow_id, moscow_name)
+
+    assert moscow_name == "Москва, м. Сокол"
+    assert Location.objects.get(pk=moscow_id).normalized_name == "москва, м. сокол"
+    assert Location.objects.count() == 1
+    with django_assert_num_queries(0):
+        assert find_location("МОСКВА, м. Сокол") == (moscow_id, moscow_name)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        resolve_location("Казань")
+        resolve_location("Самара")
+
+    assert list(locations._resolved) == ["казань", "самара"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Location.objects.filter(name="Казань").get().save()
+
+    assert list(locations._resolved) == []
+
+
+@pytest.mark.django_db
+def test_user_location_interned(client) -> None:
+    """
+    The test_user_location_interned function is designed to check the locations of the users created
+    at /user/create/ and of the locations created at /location/. Takes the test client client as an argument.
+    Checks that the users naming a location differently share one location and that a location with a taken
+    normalized name is rejected.
+    """
+    location: Location = Location.objects.create(name="Москва")
+    for index, name in enumerate(["Москва", " МОСКВА", ["москва"]]):
+        response = client.post("/user/create/", {
+            "username": f"user_{index}",
+            "password": "1234",
+            "email": f"user_{index}@mail.ru",
+            "birth_date": "1990-05-05",
+            "location": name,
+        }, content_type="application/json")
+
+        assert response.status_code == 201
+        assert response.data["location"] == "Москва"
+
+    assert set(User.objects.values_list("location_id", flat=True)) == {location.pk}
+    assert Location.objects.count() == 1
+
+    response = client.post("/location/", {"name": "москва"}, content_type="application/json")
+
+    assert response.status_code == 400
+    assert "name" in response.data
+    assert client.post("/location/", {"name": "Казань"}, content_type="application/json").status_code == 201
+    assert client.patch(f"/location/{location.pk}/", {"name": "москва"},
+                        content_type="application/json").status_code == 200
+
+
+@pytest.mark.django_db
+def test_stale_location_resolved_again(client, django_capture_on_commit_callbacks) -> None:
+    """
+    The test_stale_location_resolved_again function is designed to check the users created with a location deleted
+    by another process after the process has resolved its name. Takes the test client client
+    and the django_capture_on_commit_callbacks fixture as arguments. Checks that the location is resolved again
+    from the database instead of failing, and that the long names keep their folded forms.
+    """
+    with django_capture_on_commit_callbacks(execute=True):
+        stale_id, _ = resolve_location("Казань")
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {Location._meta.db_table} WHERE id = %s", [stale_id])
+
+    response = client.post("/user/create/", {
+        "username": "user_stale",
+        "password": "1234",
+        "email": "user_stale@mail.ru",
+        "birth_date": "1990-05-05",
+        "location": "Казань",
+    }, content_type="application/json")
+
+    assert response.status_code == 201
+    assert response.data["location"] == "Казань"
+    assert User.objects.get(username="user_stale").location_id not in (None, stale_id)
+
+    location: Location = Location.objects.create(name="ß" * 50)
+    assert Location.objects.get(pk=location.pk).normalized_name == "ss" * 50
+
+
+@pytest.mark.django_db
+def test_locations_invalidated_by_other_process(django_capture_on_commit_callbacks) -> None:
+    """
+    The test_locations_invalidated_by_other_process function is designed to check that the names resolved
+    by a process are forgotten when the locations are changed by another process. Takes
+    the django_capture_on_commit_callbacks fixture as an argument.
+    """
+    with django_capture_on_commit_callbacks(execute=True):
+        location = resolve_location("Самара")
+    assert find_location("Самара") == location
+
+    process = multiprocessing.get_context("fork").Process(target=locations.invalidate_locations)
+    process.start()
+    process.join()
+
+    assert process.exitcode == 0
+    assert locations.get_resolved("самара") is None
@@ -0,0 +1,115 @@
+import multiprocessing
+
+import pytest
+from django.db import transaction
+from django.db.models import Count, Max
+
+from ads.models import Ad
+from author.models import User
+from categories.cache import CategorySnapshot, get_snapshot, invalidate_snapshot
+from categories.models import Category
+from home_work.conditional import get_validators
+from tests.factories import CategoryFactory
+
+
+@pytest.mark.django_db
+def test_category_list_cached(client, django_assert_num_queries, run_commit_callbacks) -> None:
+    """
+    The test_category_list_cached function is designed to check the functioning when sending a GET request
+    to the application at /cat/. Takes the test client client, the django_assert_num_queries fixture
+    and the run_commit_callbacks fixture as arguments. Checks that the list is loaded with one query and then
+    served from the cache with the same validators as computed by the database, and that saving and deleting
+    a category invalidates the cache.
+    """
+    first: Category = CategoryFactory.create(name="Котики")
+    CategoryFactory.create(name="Книги")
+    run_commit_callbacks()
+
+    with django_assert_num_queries(1):
+        response = client.get("/cat/")
+    with django_assert_num_queries(0):
+        cached_response = client.get("/cat/")
+
+    assert response.status_code == 200
+    assert [category["name"] for category in response.data["results"]] == ["Котики", "Книги"]
+    assert cached_response.data == response.data
+    assert response["ETag"] == get_validators(Category.objects.order_by(), {
+        "updated_at": Max("updated_at"), "count": Count("id")
+    })[0]
+    assert client.get("/cat/", HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 304
+
+    first.name = "Кошки"
+    first.save()
+    CategoryFactory.create(name="Растения").delete()
+
+    assert [category["name"] for category in client.get("/cat/").data["results"]] == ["Кошки", "Книги"]
+
+
+@pytest.mark.django_db
+def test_ad_category_resolved_from_cache(client, hr_token: str, django_assert_num_queries,
+                                         run_commit_callbacks) -> None:
+    """
+    The test_ad_category_resolved_from_cache function is designed to check that the ad serializers resolve
+    the category by name through the cache. Takes the test client client, the hr_token fixture,
+    the django_assert_num_queries fixture and the run_commit_callbacks fixture as arguments. Checks that
+    the category of a created ad is resolved without querying the categories and that unknown names are rejected.
+    """
+    category: Category = CategoryFactory.create(name="Котики")
+    run_commit_callbacks()
+    client.get("/cat/")
+    data = {"name": "Сибирские котята", "author": "test_user", "price": 100, "category": "Котики"}
+
+    response = client.post("/ad/create/", data, content_type="application/json")
+
+    assert response.status_code == 201
+    assert response.data["category"] == "Котики"
+    assert Ad.objects.get(pk=response.data["id"]).category_id == category.pk
+
+    response = client.post("/ad/create/", dict(data, category="Собаки"), content_type="application/json")
+
+    assert response.status_code == 400
+    assert "category" in response.data
+
+    ad: Ad = Ad.objects.get(author=User.objects.get(username="test_user"))
+    with django_assert_num_queries(3):
+        response = client.get(f"/ad/{ad.pk}/", HTTP_AUTHORIZATION="Bearer " + hr_token)
+
+    assert response.data["category"] == "Котики"
+
+
+@pytest.mark.django_db
+def test_category_snapshot_invalidated_by_other_process() -> None:
+    """
+    The test_category_snapshot_invalidated_by_other_process function is designed to check that the snapshot
+    of the categories of a process is reloaded when the categories are changed by another process.
+    """
+    snapshot: CategorySnapshot = get_snapshot()
+
+    process = multiprocessing.get_context("fork").Process(target=invalidate_snapshot)
+    process.start()
+    process.join()
+
+    assert process.exitcode == 0
+    assert get_snapshot() is not snapshot
+
+
+@pytest.mark.django_db
+def test_category_snapshot_rolled_back(run_commit_callbacks) -> None:
+    """
+    The test_category_snapshot_rolled_back function is designed to check that the categories of a rolled back
+    transaction are not kept in the snapshot of the process. Takes the run_commit_callbacks fixture as an argument.
+    Checks that the transaction reads its own categories and that the snapshot read after the rollback
+    does not contain them.
+    """
+    CategoryFactory.create(name="Книги")
+    run_commit_callbacks()
+    snapshot: CategorySnapshot = get_snapshot()
+
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            CategoryFactory.create(name="Фантом")
+            assert "Фантом" in get_snapshot().ids_by_name
+            raise RuntimeError()
+
+    assert get_snapshot() is snapshot
+    assert "Фантом" not in get_snapshot().ids_by_name
@@ -0,0 +1,33 @@
+from typing import List
+
+import pytest
+
+from ads.models import Ad
+from author.models import User
+from selection.models import Selection
+from tests.factories import AdFactory
+
+
+@pytest.mark.django_db
+def test_selection_detail_sparse_fields(client, hr_token: str) -> None:
+    """
+    The test_selection_detail_sparse_fields function is designed to check the functioning when sending a GET request
+    to the application at /selection/<int: pk>/?fields=&item_fields=. Accepts as arguments a test client client
+    and a token from the hr_token fixture. Checks that only the requested fields of the selection and its ads
+    are displayed.
+    """
+    ads: List[Ad] = AdFactory.create_batch(2)
+    selection: Selection = Selection.objects.create(name="test", owner=User.objects.get(username="test_user"))
+    selection.items.set(ads)
+
+    response = client.get(
+        f"/selection/{selection.pk}/",
+        {"fields": "name,items", "item_fields": "id,name,price"},
+        HTTP_AUTHORIZATION="Bearer " + hr_token
+    )
+
+    assert response.status_code == 200
+    assert response.data == {
+        "items": [{"id": ad.id, "name": ad.name, "price": "100"} for ad in ads],
+        "name": "test",
+    }
@@ -0,0 +1,29 @@
+from typing import List
+
+import pytest
+
+from ads.models import Ad
+from author.models import User
+from selection.models import Selection
+from tests.factories import AdFactory
+
+
+@pytest.mark.django_db
+def test_selection_detail_async(client, hr_token: str) -> None:
+    """
+    The test_selection_detail_async function is designed to check the functioning when sending a GET request
+    to the application at /async/selection/<int: pk>/. Accepts as arguments a test client client and a token
+    from the hr_token fixture. Checks that the selection with its ads and its validators are displayed exactly
+    as at /selection/<int: pk>/.
+    """
+    ads: List[Ad] = AdFactory.create_batch(3)
+    selection: Selection = Selection.objects.create(name="test", owner=User.objects.get(username="test_user"))
+    selection.items.set(ads)
+
+    response = client.get(f"/async/selection/{selection.pk}/", HTTP_AUTHORIZATION="Bearer " + hr_token)
+    sync_response = client.get(f"/selection/{selection.pk}/", HTTP_AUTHORIZATION="Bearer " + hr_token)
+
+    assert response.status_code == 200
+    assert response.json() == sync_response.json()
+    assert [item["id"] for item in response.json()["items"]] == [ad.id for ad in ads]
+    assert response["ETag"] == sync_response["ETag"]
@@ -0,0 +1,49 @@
+from typing import List
+
+import pytest
+
+from ads.models import Ad
+from author.models import User
+from selection.models import Selection
+from tests.factories import AdFactory
+
+
+@pytest.mark.django_db
+def test_selection_items_pages(client, hr_token: str, settings, django_assert_num_queries) -> None:
+    """
+    The test_selection_items_pages function is designed to check the pagination of the ads of a selection.
+    Accepts as arguments a test client client, a token from the hr_token fixture, the settings fixture and the
+    django_assert_num_queries fixture. Checks that the detail page displays the first page of the ads with
+    a number of queries independent of the number of ads, and that the rest of them are displayed by pages
+    at /selection/<int: pk>/items/.
+    """
+    settings.SELECTION_ITEMS_PAGE_SIZE = 2
+    ads: List[Ad] = AdFactory.create_batch(5)
+    selection: Selection = Selection.objects.create(name="test", owner=User.objects.get(username="test_user"))
+    selection.items.set(ads)
+
+    with django_assert_num_queries(4):
+        response = client.get(f"/selection/{selection.pk}/", {"item_fields": "id,name"},
+                              HTTP_AUTHORIZATION="Bearer " + hr_token)
+
+    assert response.status_code == 200
+    assert response.data["items"] == [{"id": ad.id, "name": ad.name} for ad in ads[:2]]
+    assert f"/selection/{selection.pk}/items/?" in response.data["items_next"]
+    assert "item_fields=id%2Cname" in response.data["items_next"]
+
+    async_response = client.get(f"/async/selection/{selection.pk}/", {"item_fields": "id,name"},
+                                HTTP_AUTHORIZATION="Bearer " + hr_token)
+
+    assert async_response.json()["items_next"] == response.data["items_next"]
+
+    ids: List[int] = [item["id"] for item in response.data["items"]]
+    url: str = response.data["items_next"]
+    while url:
+        response = client.get(url, HTTP_AUTHORIZATION="Bearer " + hr_token)
+        assert response.status_code == 200
+        assert set(response.data["results"][0]) == {"id", "name"}
+        ids.extend(item["id"] for item in response.data["results"])
+        url = response.data["next"]
+
+    assert ids == [ad.id for ad in ads]
+    assert client.get("/selection/0/items/", HTTP_AUTHORIZATION="Bearer " + hr_token).status_code == 404
@@ -0,0 +1,50 @@
+from typing import List
+
+import pytest
+
+from ads.models import Ad
+from author.models import User
+from selection.models import Selection
+from tests.factories import AdFactory, UserFactory
+
+
+@pytest.mark.django_db
+def test_selection_items_add_remove(client, hr_token: str, django_assert_num_queries) -> None:
+    """
+    The test_selection_items_add_remove function is designed to check the functioning when sending POST requests
+    to the application at /selection/<int:pk>/items/add/ and /selection/<int:pk>/items/remove/. Takes the test
+    client client, the hr_token fixture and the django_assert_num_queries fixture as arguments. Checks that only
+    the difference is written with a number of queries independent of the number of ads, that the unknown ads
+    are skipped and that only the owner changes the ads of the selection.
+    """
+    ads: List[Ad] = AdFactory.create_batch(4)
+    selection: Selection = Selection.objects.create(name="mine", owner=User.objects.get(username="test_user"))
+    selection.items.set(ads[:2])
+    other: Selection = Selection.objects.create(name="theirs", owner=UserFactory.create())
+    headers = {"HTTP_AUTHORIZATION": "Bearer " + hr_token}
+
+    with django_assert_num_queries(5):
+        response = client.post(f"/selection/{selection.pk}/items/add/",
+                               {"items": [ad.pk for ad in ads] + [10 ** 6]},
+                               content_type="application/json", **headers)
+
+    assert response.status_code == 200
+    assert response.data == {"added": 2}
+    assert set(selection.items.values_list("pk", flat=True)) == {ad.pk for ad in ads}
+
+    response = client.post(f"/selection/{selection.pk}/items/remove/", {"items": [ads[0].pk, ads[3].pk]},
+                           content_type="application/json", **headers)
+
+    assert response.status_code == 200
+    assert response.data == {"removed": 2}
+    assert set(selection.items.values_list("pk", flat=True)) == {ads[1].pk, ads[2].pk}
+
+    assert client.post(f"/selection/{other.pk}/items/add/", {"items": [ads[0].pk]},
+                       content_type="application/json", **headers).status_code == 403
+    assert client.post(f"/selection/{other.pk}/items/remove/", {"items": []},
+                       content_type="application/json", **headers).status_code == 403
+    assert client.post(f"/selection/{selection.pk}/items/add/", {"items": []},
+                       content_type="application/json", **headers).status_code == 400
+    assert client.post("/selection/0/items/add/", {"items": [ads[0].pk]},
+                       content_type="application/json", **headers).status_code == 404
+    assert not other.items.exists()
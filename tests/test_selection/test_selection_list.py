@@ -0,0 +1,68 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from author.models import User
+from selection.models import Selection
+from selection.views import SelectionListView
+from tests.factories import AdFactory, UserFactory
+
+
+@pytest.mark.django_db
+def test_selection_list_owner(client, hr_token: str, django_assert_num_queries) -> None:
+    """
+    The test_selection_list_owner function is designed to check the functioning when sending a GET request
+    to the application at /selection/?owner=. Takes the test client client, the hr_token fixture and the
+    django_assert_num_queries fixture as arguments. Checks that the selections of the user or of the given owner
+    are displayed with the numbers of their ads counted in the query loading the page, ordered by the columns
+    of the index of the owners without joining the owners.
+    """
+    user: User = User.objects.get(username="test_user")
+    other: User = UserFactory.create()
+    mine: Selection = Selection.objects.create(name="mine", owner=user)
+    mine.items.set(AdFactory.create_batch(3))
+    empty: Selection = Selection.objects.create(name="empty", owner=user)
+    Selection.objects.create(name="theirs", owner=other)
+    headers = {"HTTP_AUTHORIZATION": "Bearer " + hr_token}
+
+    with django_assert_num_queries(2):
+        response = client.get("/selection/", {"owner": "me", "pagination": "cursor"}, **headers)
+
+    with CaptureQueriesContext(connection) as queries:
+        client.get("/selection/", {"owner": "me"}, **headers)
+
+    assert 'ORDER BY "selection_selection"."owner_id" ASC, "selection_selection"."id" ASC' in queries[-1]["sql"]
+    assert all("author_user" not in query["sql"] for query in queries[1:])
+
+    assert response.status_code == 200
+    assert response.data["results"] == [
+        {"id": mine.id, "name": "mine", "items_count": 3},
+        {"id": empty.id, "name": "empty", "items_count": 0},
+    ]
+
+    response = client.get("/selection/", {"owner": other.id, "fields": "name"})
+
+    assert response.status_code == 200
+    assert response.data["results"] == [{"name": "theirs"}]
+    assert client.get("/selection/", {"owner": "me"}).status_code == 401
+    assert client.get("/selection/", {"owner": "someone"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_selection_list_fast_parity(client, monkeypatch) -> None:
+    """
+    The test_selection_list_fast_parity function is designed to check the fast list mode at /selection/.
+    Takes the test client client and the monkeypatch fixture as arguments. Checks that the pages built
+    from the rows of the values are identical to the pages serialized by the SelectionListSerializer.
+    """
+    owner: User = User.objects.create(username="owner")
+    Selection.objects.bulk_create(Selection(name=f"selection {index}", owner=owner) for index in range(12))
+
+    for params in [{}, {"page": 2}, {"pagination": "cursor"}]:
+        monkeypatch.setattr(SelectionListView, "fast_list", True)
+        fast_response = client.get("/selection/", params)
+        monkeypatch.setattr(SelectionListView, "fast_list", False)
+        serialized_response = client.get("/selection/", params)
+
+        assert fast_response.status_code == 200
+        assert fast_response.json() == serialized_response.json()
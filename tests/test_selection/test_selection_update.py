@@ -0,0 +1,39 @@
+import pytest
+
+from author.models import User
+from selection.models import Selection
+from tests.factories import AdFactory, UserFactory
+
+
+@pytest.mark.django_db
+def test_selection_update_delete_guarded(client, hr_token: str) -> None:
+    """
+    The test_selection_update_delete_guarded function is designed to check the functioning when sending PATCH
+    and DELETE requests to the application at /selection/<int:pk>/update/ and /selection/<int:pk>/delete/.
+    Takes the test client client and the hr_token fixture as arguments. Checks that only the owner edits
+    the selection, that changing the items is saved through the model and that the missing selections
+    are answered with the status 404.
+    """
+    selection: Selection = Selection.objects.create(name="mine", owner=User.objects.get(username="test_user"))
+    other: Selection = Selection.objects.create(name="theirs", owner=UserFactory.create())
+    ad = AdFactory.create()
+    headers = {"HTTP_AUTHORIZATION": "Bearer " + hr_token}
+
+    response = client.patch(f"/selection/{selection.pk}/update/", {"name": "renamed"},
+                            content_type="application/json", **headers)
+
+    assert response.status_code == 200
+    assert response.data["name"] == "renamed"
+
+    response = client.patch(f"/selection/{selection.pk}/update/", {"items": [ad.pk]},
+                            content_type="application/json", **headers)
+
+    assert response.status_code == 200
+    assert list(selection.items.values_list("pk", flat=True)) == [ad.pk]
+
+    assert client.patch(f"/selection/{other.pk}/update/", {"name": "renamed"}, content_type="application/json",
+                        **headers).status_code == 403
+    assert client.delete(f"/selection/{other.pk}/delete/", **headers).status_code == 403
+    assert client.delete(f"/selection/{selection.pk}/delete/", **headers).status_code == 204
+    assert client.delete(f"/selection/{selection.pk}/delete/", **headers).status_code == 404
+    assert list(Selection.objects.values_list("name", flat=True)) == ["theirs"]